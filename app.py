@@ -2,11 +2,15 @@ from flask import Flask, jsonify, request, render_template
 import json
 import os
 import logging
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
 import sqlite3
-from contextlib import closing
+from contextlib import closing, nullcontext
+from bisect import bisect_right
+from dictionary_xml import RECORD_FIELDS, batched, extract_record, iter_items
+from import_manifest import ImportManifest
+from sqlite_bulk import bulk_load, is_empty
+from search_index import build_word_index, get_choseong_index, get_word_index
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,6 +21,10 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# 검색 결과 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
 def init_db():
     """데이터베이스 초기화"""
     try:
@@ -40,12 +48,69 @@ def init_db():
                         meaning TEXT
                     )
                 ''')
+                # 재임포트 시 upsert할 수 있도록 target_code를 유일하게 유지
+                # (이전 버전이 중복 삽입한 행은 가장 먼저 들어간 행만 남김)
+                cursor.execute("UPDATE words SET target_code = NULL WHERE target_code = ''")
+                cursor.execute('''
+                    DELETE FROM words
+                    WHERE target_code IS NOT NULL AND id NOT IN (
+                        SELECT MIN(id) FROM words WHERE target_code IS NOT NULL GROUP BY target_code
+                    )
+                ''')
+                cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_words_target_code ON words (target_code)')
                 conn.commit()
     except Exception as e:
         logger.error(f"데이터베이스 초기화 중 오류 발생: {str(e)}")
 
+INSERT_WORD_SQL = '''
+    INSERT INTO words (
+        target_code, word, word_unit, word_type, pronunciation,
+        origin, pos_info, study_info, lexical_info, conju_info,
+        example, meaning
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(target_code) DO UPDATE SET
+        word = excluded.word, word_unit = excluded.word_unit, word_type = excluded.word_type,
+        pronunciation = excluded.pronunciation, origin = excluded.origin,
+        pos_info = excluded.pos_info, study_info = excluded.study_info,
+        lexical_info = excluded.lexical_info, conju_info = excluded.conju_info,
+        example = excluded.example, meaning = excluded.meaning
+'''
+
+# 의미 정보로 합칠 필드: (레코드 위치, 표시 이름)
+MEANING_FIELDS = tuple(
+    (RECORD_FIELDS.index(tag), label)
+    for tag, label in (('pos_info', '품사'), ('study_info', '학습 정보'),
+                       ('lexical_info', '어휘 정보'), ('conju_info', '활용 정보'))
+)
+
+def word_row(item):
+    """item 요소를 words 테이블 행으로 변환
+
+    word_info가 없거나, 다시 가져올 때 upsert할 target_code가 없으면 None
+    """
+    record = extract_record(item, default='')
+    if record is None or not record[0]:
+        return None
+    # 의미 정보 합치기
+    record.append(' | '.join([f"{label}: {record[index]}" for index, label in MEANING_FIELDS if record[index]]))
+    return tuple(record)
+
+def iter_word_batches(xml_file, start):
+    """start번째 item부터 (처리한 item 수, 삽입할 행 목록)을 배치 단위로 반환"""
+    items = (
+        word_row(item)
+        for index, item in enumerate(iter_items(xml_file))
+        if index >= start
+    )
+    for batch in batched(items):
+        yield len(batch), [row for row in batch if row is not None]
+
 def import_xml_to_db():
-    """XML 파일에서 데이터베이스로 데이터 임포트"""
+    """XML 파일에서 데이터베이스로 데이터 임포트
+
+    import_manifest에 파일별 진행 상태를 기록해 변경되지 않은 파일은 건너뛰고,
+    중간에 멈춘 파일은 마지막으로 커밋한 배치 다음부터 이어서 가져옵니다.
+    """
     try:
         data_dir = Path('data/raw')
         if not data_dir.exists():
@@ -59,68 +124,48 @@ def import_xml_to_db():
             
         with closing(sqlite3.connect('korean_dictionary.db')) as conn:
             with closing(conn.cursor()) as cursor:
-                for xml_file in xml_files:
-                    try:
-                        logger.info(f"XML 파일 처리 중: {xml_file}")
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        
-                        for item in root.findall('.//item'):
-                            word_info = item.find('word_info')
-                            if word_info is None:
-                                continue
-                                
-                            word_data = {
-                                'target_code': item.find('target_code').text if item.find('target_code') is not None else '',
-                                'word': word_info.find('word').text if word_info.find('word') is not None else '',
-                                'word_unit': word_info.find('word_unit').text if word_info.find('word_unit') is not None else '',
-                                'word_type': word_info.find('word_type').text if word_info.find('word_type') is not None else '',
-                                'pronunciation': word_info.find('pronunciation_info').text if word_info.find('pronunciation_info') is not None else '',
-                                'origin': word_info.find('origin').text if word_info.find('origin') is not None else '',
-                                'pos_info': word_info.find('pos_info').text if word_info.find('pos_info') is not None else '',
-                                'study_info': word_info.find('study_info').text if word_info.find('study_info') is not None else '',
-                                'lexical_info': word_info.find('lexical_info').text if word_info.find('lexical_info') is not None else '',
-                                'conju_info': word_info.find('conju_info').text if word_info.find('conju_info') is not None else '',
-                                'example': word_info.find('example').text if word_info.find('example') is not None else ''
-                            }
-                            
-                            # 의미 정보 합치기
-                            meaning_parts = []
-                            if word_data['pos_info']:
-                                meaning_parts.append(f"품사: {word_data['pos_info']}")
-                            if word_data['study_info']:
-                                meaning_parts.append(f"학습 정보: {word_data['study_info']}")
-                            if word_data['lexical_info']:
-                                meaning_parts.append(f"어휘 정보: {word_data['lexical_info']}")
-                            if word_data['conju_info']:
-                                meaning_parts.append(f"활용 정보: {word_data['conju_info']}")
-                            
-                            word_data['meaning'] = ' | '.join(meaning_parts) if meaning_parts else ''
-                            
-                            # 데이터베이스에 삽입
-                            cursor.execute('''
-                                INSERT INTO words (
-                                    target_code, word, word_unit, word_type, pronunciation,
-                                    origin, pos_info, study_info, lexical_info, conju_info,
-                                    example, meaning
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            ''', (
-                                word_data['target_code'], word_data['word'], word_data['word_unit'],
-                                word_data['word_type'], word_data['pronunciation'], word_data['origin'],
-                                word_data['pos_info'], word_data['study_info'], word_data['lexical_info'],
-                                word_data['conju_info'], word_data['example'], word_data['meaning']
-                            ))
-                            
-                    except Exception as e:
-                        logger.error(f"{xml_file.name} 처리 중 오류 발생: {str(e)}")
-                        continue
+                manifest = ImportManifest(conn)
+                # 빈 테이블에 처음 적재할 때는 대량 적재 모드로 파일 단위로만 커밋
+                bulk = is_empty(conn, 'words')
+                with bulk_load(conn, ['words']) if bulk else nullcontext():
+                    import_files(conn, cursor, manifest, xml_files, bulk)
                         
-                conn.commit()
                 logger.info("데이터베이스 임포트 완료")
                 
     except Exception as e:
         logger.error(f"데이터베이스 임포트 중 오류 발생: {str(e)}")
 
+def import_files(conn, cursor, manifest, xml_files, bulk):
+    """파일별로 진행 위치부터 item을 upsert
+
+    bulk가 아니면 배치마다 진행 위치와 함께 커밋합니다. 대량 적재 모드에서는
+    저널이 없어 롤백할 수 없으므로 파일 단위로만 커밋하고, 오류가 나면 중단합니다.
+    (다음 실행은 증분 모드로 실패한 파일을 처음부터 다시 upsert)
+    """
+    for xml_file in xml_files:
+        try:
+            start = manifest.start_offset(xml_file)
+            if start is None:
+                logger.info(f"변경 없음, 건너뜀: {xml_file}")
+                continue
+            logger.info(f"XML 파일 처리 중: {xml_file} (item {start}부터)")
+            
+            # item을 하나씩 읽어 배치 단위로 upsert하고, 배치와 진행 위치를 함께 커밋
+            items_done = start
+            for item_count, rows in iter_word_batches(xml_file, start):
+                cursor.executemany(INSERT_WORD_SQL, rows)
+                items_done += item_count
+                if not bulk:
+                    manifest.checkpoint(xml_file, items_done)
+                    conn.commit()
+            manifest.complete(xml_file, items_done)
+                
+        except Exception as e:
+            logger.error(f"{xml_file.name} 처리 중 오류 발생: {str(e)}")
+            if bulk:
+                raise
+            conn.rollback()
+
 def get_db():
     """데이터베이스 연결 반환"""
     db = sqlite3.connect('korean_dictionary.db')
@@ -140,21 +185,40 @@ def index():
 def search_words():
     try:
         query = request.args.get('q', '').lower()
-        logger.info(f"검색 쿼리: {query}")
+        mode = request.args.get('mode', 'substring')
+        logger.info(f"검색 쿼리: {query} (방식: {mode})")
+        
+        try:
+            limit = min(max(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+            after = int(request.args['cursor']) if request.args.get('cursor') else None
+        except ValueError:
+            return jsonify({'error': 'limit과 cursor는 정수여야 합니다'}), 400
         
         if not query:
-            return jsonify([])
+            return jsonify({'total': 0, 'words': [], 'next_cursor': None})
         
-        with closing(get_db()) as db:
-            cursor = db.cursor()
-            cursor.execute('''
-                SELECT * FROM words 
-                WHERE LOWER(word) LIKE ? OR LOWER(meaning) LIKE ?
-            ''', (f'%{query}%', f'%{query}%'))
+        if mode == 'choseong':
+            # 초성/자모 트라이에서 표제어 접두사로 후보 ID를 구함
+            word_ids = sorted(get_choseong_index(get_db).search(query))
+        else:
+            # n-gram 색인에서 후보 ID를 구한 뒤 해당 행만 조회
+            word_ids = get_word_index(get_db).search(query)
+        
+        # 후보 ID가 정렬되어 있으므로 커서(마지막 ID) 다음부터 한 페이지만 조회
+        start = bisect_right(word_ids, after) if after is not None else 0
+        page_ids = word_ids[start:start + limit]
+        next_cursor = page_ids[-1] if start + limit < len(word_ids) else None
+        
+        results = []
+        if page_ids:
+            with closing(get_db()) as db:
+                cursor = db.cursor()
+                placeholders = ','.join('?' * len(page_ids))
+                cursor.execute(f'SELECT * FROM words WHERE id IN ({placeholders}) ORDER BY id', page_ids)
+                results = [dict(row) for row in cursor.fetchall()]
             
-            results = [dict(row) for row in cursor.fetchall()]
-            logger.info(f"검색 결과: {len(results)}개")
-            return jsonify(results)
+        logger.info(f"검색 결과: {len(word_ids)}개 중 {len(results)}개")
+        return jsonify({'total': len(word_ids), 'words': results, 'next_cursor': next_cursor})
             
     except Exception as e:
         logger.error(f"검색 중 오류 발생: {str(e)}")
@@ -179,11 +243,15 @@ def get_word(word):
 
 if __name__ == '__main__':
     try:
-        # 데이터베이스 초기화 및 데이터 임포트
-        if not os.path.exists('korean_dictionary.db'):
-            logger.info("데이터베이스 초기화 및 데이터 임포트 시작")
-            init_db()
-            import_xml_to_db()
+        # 데이터베이스 초기화 및 데이터 임포트 (변경된 파일만 가져옴)
+        logger.info("데이터베이스 초기화 및 데이터 임포트 시작")
+        init_db()
+        import_xml_to_db()
+        
+        # 단어 검색 색인 구축
+        with closing(get_db()) as db:
+            index = build_word_index(db)
+        logger.info(f"단어 검색 색인 구축 완료: {len(index)}개 단어")
         
         logger.info("Flask 애플리케이션 시작")
         app.run(host='0.0.0.0', port=8000, debug=True)
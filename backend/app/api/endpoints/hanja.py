@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import Float, Integer, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from typing import List, Optional
 
 from app.api.deps import get_db
+from app.db.fts import FTS_TABLE, build_match_query, is_fts_available
+from app.db.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_page_ids, keyset_paginate
 from app.models.hanja import Hanja
-from app.schemas.hanja import HanjaCreate, HanjaResponse, HanjaSearchRequest, HanjaListResponse
+from app.schemas.hanja import HanjaCreate, HanjaResponse, HanjaSearchRequest, HanjaSuggestion, HanjaListResponse
 from app.core.cache import redis_cache as cache
+from app.core.cache_keys import FAVORITES_KEY, SEARCH_GENERATION_KEY, hanja_detail_key, search_result_key
+from app.core.config import settings
+from app.core.invalidation import FAVORITE_TOGGLED, HANJA_SAVED, invalidation, load_favorites, serialize_hanja
+from app.core.negative_cache import hanja_negative_cache
+from app.core.streaming import STREAM_CHUNK_SIZE, ndjson_response, wants_ndjson
+from app.core.warmup import cache_warmer
+from app.db.session import SessionLocal
+from app.search import choseong_index, meaning_index, suggest_trie, rebuild_hanja_indexes, sort_value
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -33,6 +45,8 @@ async def create_hanja(
                 if value is not None:
                     setattr(existing_hanja, key, value)
             db.commit()
+            # 검색 색인과 캐시에 새 값 반영
+            await invalidation.emit(HANJA_SAVED, existing_hanja, db)
             return HanjaResponse.model_validate(existing_hanja)
         else:
             # 새 한자 생성
@@ -40,6 +54,7 @@ async def create_hanja(
             db.add(new_hanja)
             db.commit()
             db.refresh(new_hanja)
+            await invalidation.emit(HANJA_SAVED, new_hanja, db)
             return HanjaResponse.model_validate(new_hanja)
     
     except IntegrityError as e:
@@ -64,33 +79,182 @@ async def create_hanja(
             detail=f"한자 생성 중 예기치 않은 오류: {str(e)}"
         )
 
-@router.post("/search", response_model=List[HanjaResponse])
+def _index_candidates(search_request: HanjaSearchRequest, db: Session) -> Optional[List[int]]:
+    """메모리 색인으로 처리하는 검색 방식이면 후보 ID 목록을, 아니면 None을 반환합니다."""
+    if search_request.mode == "choseong":
+        # 초성/자모 트라이에서 발음 접두사로 후보 ID를 구함
+        if not choseong_index.loaded:
+            rebuild_hanja_indexes(db)
+        return list(choseong_index.search(search_request.query))
+    if search_request.mode == "substring" and meaning_index.loaded:
+        # 메모리 n-gram 색인에서 posting 교집합으로 후보 ID를 구함
+        return list(meaning_index.search(search_request.query))
+    return None
+
+def _search_candidates(search_request: HanjaSearchRequest, db: Session):
+    """색인을 쓰지 않는 검색 방식의 후보 쿼리를 만듭니다.
+
+    Returns:
+        (쿼리, bm25 점수 컬럼 또는 None, 전체 개수를 계산하는 함수)
+    """
+    match_query = None
+    if search_request.mode == "fulltext" and is_fts_available(db):
+        match_query = build_match_query(search_request.query)
+    
+    if match_query:
+        # FTS5 인덱스에서 후보와 bm25 점수를 가져와 hanja 테이블과 조인
+        matches = text(
+            f"SELECT rowid AS id, bm25({FTS_TABLE}) AS rank "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+        ).bindparams(match=match_query).columns(id=Integer, rank=Float).subquery()
+        count = lambda: db.execute(
+            text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"),
+            {"match": match_query}
+        ).scalar()
+        return db.query(Hanja).join(matches, matches.c.id == Hanja.id), matches.c.rank, count
+    
+    query = db.query(Hanja).filter(
+        (Hanja.traditional.contains(search_request.query)) |
+        (Hanja.simplified.contains(search_request.query)) |
+        (Hanja.korean_pronunciation.contains(search_request.query)) |
+        (Hanja.meaning.contains(search_request.query))
+    )
+    return query, None, query.count
+
+async def _hydrate_hanja(chars: List[str], db: Session) -> Optional[List[dict]]:
+    """한자 목록을 상세 캐시에서 채우고, 없는 것만 한 번의 쿼리로 읽습니다.
+
+    Returns:
+        순서가 유지된 한자 응답 목록. 그 사이 삭제된 한자가 있으면 None
+    """
+    keys = [hanja_detail_key(char) for char in chars]
+    details = await cache.mget_fresh(keys)
+    missing = [char for char, detail in zip(chars, details) if detail is None]
+    if missing:
+        loaded = {
+            hanja.traditional: serialize_hanja(hanja)
+            for hanja in db.query(Hanja).filter(Hanja.traditional.in_(missing))
+        }
+        if len(loaded) != len(set(missing)):
+            return None
+        await cache.put_many(
+            {hanja_detail_key(char): detail for char, detail in loaded.items()},
+            expire=settings.DETAIL_CACHE_TTL
+        )
+        details = [detail if detail is not None else loaded[char] for char, detail in zip(chars, details)]
+    return details
+
+@router.post("/search", response_model=HanjaListResponse)
 async def search_hanja(search_request: HanjaSearchRequest, db: Session = Depends(get_db)):
-    """한자 검색"""
+    """한자 검색
+
+    기본(substring) 방식은 메모리 n-gram 색인으로 부분 문자열 검색을 수행합니다.
+    (색인이 준비되지 않은 경우 LIKE 검색으로 대체)
+    fulltext 방식을 지정하면 FTS5 인덱스에서 단어 접두사로 찾고 bm25 점수로 순위를 매깁니다.
+    choseong 방식은 "ㅅ", "ㅅㅜ"처럼 초성/자모로 한국어 발음을 접두사 검색합니다.
+
+    결과는 (frequency, id) 또는 (stroke_count, id) 키셋 커서로 페이지를 나눕니다.
+    응답의 next_cursor를 다음 요청의 cursor로 넘기면 이어서 조회하며,
+    total은 첫 페이지에서 한 번만 계산해 커서에 담아 둡니다.
+
+    페이지 결과는 정규화된 검색 조건을 키로 한자 목록(traditional)만 캐싱하고,
+    응답 시 각 한자는 상세 캐시에서 채우므로 같은 검색이 반복되면 SQL을 실행하지 않습니다.
+    """
     try:
-        query = db.query(Hanja)
-        
-        if search_request.query:
-            search_term = f"%{search_request.query}%"
-            query = query.filter(
-                (Hanja.traditional.contains(search_request.query)) |
-                (Hanja.simplified.contains(search_request.query)) |
-                (Hanja.korean_pronunciation.contains(search_request.query)) |
-                (Hanja.meaning.contains(search_request.query))
+        sort_by = search_request.sort_by if search_request.sort_by in ("relevance", "strokes") else "frequency"
+        cache_key = search_result_key(
+            search_request.query, search_request.mode, sort_by,
+            search_request.limit, search_request.cursor,
+            await cache.get_counter(SEARCH_GENERATION_KEY)
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            hanja_list = await _hydrate_hanja(cached["chars"], db)
+            if hanja_list is not None:
+                return HanjaListResponse(
+                    total=cached["total"], hanja_list=hanja_list, next_cursor=cached["next_cursor"]
+                )
+        
+        row_ids = _index_candidates(search_request, db)
+        if row_ids == []:
+            await cache.set(
+                cache_key, {"total": 0, "chars": [], "next_cursor": None}, settings.SEARCH_CACHE_TTL
             )
+            return HanjaListResponse(total=0, hanja_list=[])
+        if row_ids is None:
+            query, rank, count = _search_candidates(search_request, db)
+        else:
+            query, rank, count = None, None, lambda: len(row_ids)
         
-        # 정렬 기준 적용
-        if search_request.sort_by == "frequency":
-            query = query.order_by(Hanja.frequency.desc())
+        # 정렬 기준 적용 (relevance는 fulltext 방식에서만 bm25 점수 순)
+        if search_request.sort_by == "relevance" and rank is not None:
+            sort_key, sort_column, descending = "relevance", rank, False
+            query = query.add_columns(rank)
+            value_of = lambda row: (row[1], row[0].id)
         elif search_request.sort_by == "strokes":
-            query = query.order_by(Hanja.stroke_count.asc())
+            sort_key, sort_column, descending = "strokes", Hanja.stroke_count, False
+            value_of = lambda row: (row.stroke_count, row.id)
+        else:
+            sort_key, sort_column, descending = "frequency", Hanja.frequency, True
+            value_of = lambda row: (row.frequency, row.id)
+        
+        # 커서는 같은 검색 조건에서만 사용할 수 있음
+        fingerprint = [search_request.query, search_request.mode, sort_key]
+        after, total = None, None
+        if search_request.cursor:
+            state = decode_cursor(search_request.cursor)
+            if state.get("f") != fingerprint or not isinstance(state.get("k"), list):
+                raise InvalidCursorError("검색 조건이 커서와 일치하지 않습니다")
+            after, total = tuple(state["k"]), state.get("t")
+        if total is None:
+            total = count()
+        
+        if row_ids is not None:
+            # 색인 후보는 메모리의 정렬 값으로 페이지를 고르고 그 ID만 조회
+            page_ids, next_key = keyset_page_ids(
+                row_ids, lambda row_id: sort_value(row_id, sort_key), descending, after, search_request.limit
+            )
+            by_id = {hanja.id: hanja for hanja in db.query(Hanja).filter(Hanja.id.in_(page_ids))} if page_ids else {}
+            rows = [by_id[row_id] for row_id in page_ids if row_id in by_id]
+        else:
+            rows, next_key = keyset_paginate(
+                query, sort_column, Hanja.id, descending, after, search_request.limit, value_of
+            )
+        if sort_key == "relevance":
+            rows = [row[0] for row in rows]
         
-        results = query.limit(100).all()
-        return results
+        next_cursor = None
+        if next_key is not None:
+            next_cursor = encode_cursor({"f": fingerprint, "k": list(next_key), "t": total})
+        
+        # 결과 캐싱: 검색 결과에는 한자 목록만, 한자 내용은 상세 캐시에 저장
+        details = {hanja_detail_key(hanja.traditional): serialize_hanja(hanja) for hanja in rows}
+        await cache.put_many(details, expire=settings.DETAIL_CACHE_TTL)
+        await cache.set(
+            cache_key,
+            {"total": total, "chars": [hanja.traditional for hanja in rows], "next_cursor": next_cursor},
+            settings.SEARCH_CACHE_TTL
+        )
+        return HanjaListResponse(total=total, hanja_list=list(details.values()), next_cursor=next_cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"한자 검색 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"한자 검색 중 오류가 발생했습니다: {str(e)}")
 
+@router.get("/suggest", response_model=List[HanjaSuggestion])
+async def suggest_hanja(
+    prefix: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=settings.SUGGEST_TOP_K, description="최대 결과 수")
+):
+    """자동완성 엔드포인트
+
+    메모리 접두사 색인(정렬된 키 배열)에서 빈도순 상위 결과를 고르므로
+    데이터베이스를 조회하지 않습니다. "ㅅㅜ"처럼 음절을 입력하는 도중에도 동작합니다.
+    """
+    # payload는 이미 직렬화 가능한 dict이므로 응답 모델 검증 없이 바로 반환
+    return JSONResponse(content=suggest_trie.suggest(prefix, limit))
+
 @router.get("/details/{hanja_char}", response_model=HanjaResponse)
 async def get_hanja_details(
     hanja_char: str = Path(..., description="상세 정보를 조회할 한자"),
@@ -99,30 +263,36 @@ async def get_hanja_details(
     """
     특정 한자의 세부 정보를 조회하는 엔드포인트
     """
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"한자 '{hanja_char}'를 찾을 수 없습니다"
+    )
     try:
-        # 캐시 확인
-        cache_key = f"hanja:{hanja_char}"
-        cached_data = await cache.get(cache_key)
+        # 블룸 필터에 없는 한자는 확실히 없으므로 캐시와 DB를 조회하지 않음
+        # (필터가 무효화를 놓쳤을 수 있으면 False이므로 아래에서 DB를 조회)
+        if hanja_negative_cache.definitely_absent(hanja_char):
+            raise not_found
         
-        if cached_data:
-            return cached_data
+        async def load_details():
+            # 최근에 없었던 한자는 DB를 조회하지 않음 (캐시 적중 시에는 확인하지 않도록 적재 중에만)
+            if await hanja_negative_cache.is_missing(hanja_char):
+                return None
+            # 데이터베이스에서 한자 정보 조회
+            hanja = db.query(Hanja).filter(Hanja.traditional == hanja_char).first()
+            if hanja is None:
+                await hanja_negative_cache.add_missing(hanja_char)
+                return None
+            return serialize_hanja(hanja)
         
-        # 데이터베이스에서 한자 정보 조회
-        hanja = db.query(Hanja).filter(Hanja.traditional == hanja_char).first()
-        
-        if not hanja:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"한자 '{hanja_char}'를 찾을 수 없습니다"
-            )
-        
-        # 결과를 HanjaResponse로 변환
-        response = HanjaResponse.model_validate(hanja)
+        # 캐시 확인 (동시 요청이 몰려도 DB 조회는 한 번만 수행)
+        details = await cache.get_or_load(
+            hanja_detail_key(hanja_char), load_details, expire=settings.DETAIL_CACHE_TTL
+        )
         
-        # 캐시에 저장
-        await cache.set(cache_key, response.model_dump())
+        if details is None:
+            raise not_found
         
-        return response
+        return details
     
     except HTTPException:
         raise
@@ -153,9 +323,8 @@ async def toggle_favorite(
         db.commit()
         db.refresh(hanja)
         
-        # 캐시 업데이트
-        await cache.delete(f"hanja:detail:{hanja_char}")
-        await cache.delete("hanja:favorites")
+        # 상세/즐겨찾기 캐시를 새 값으로 갱신
+        await invalidation.emit(FAVORITE_TOGGLED, hanja, db)
         
         return hanja
     
@@ -175,23 +344,42 @@ async def toggle_favorite(
             detail=f"즐겨찾기 토글 중 오류: {str(e)}"
         )
 
+def _iter_favorites(bind):
+    """즐겨찾기 한자를 STREAM_CHUNK_SIZE개씩 읽어 한 행씩 내보냅니다.
+
+    응답 본문은 요청 의존성(get_db)의 세션이 닫힌 뒤에도 이어서 전송되므로
+    스트리밍 전용 세션을 만들고 다 읽거나 중단되면 닫습니다.
+    """
+    session = Session(bind=bind)
+    try:
+        yield from (
+            session.query(Hanja)
+            .filter(Hanja.favorite == True)
+            .order_by(Hanja.id)
+            .yield_per(STREAM_CHUNK_SIZE)
+        )
+    finally:
+        session.close()
+
 @router.get("/favorites", response_model=List[HanjaResponse])
-async def get_favorites(db: Session = Depends(get_db)):
-    """즐겨찾기한 한자 목록 조회 엔드포인트"""
+async def get_favorites(request: Request, db: Session = Depends(get_db)):
+    """즐겨찾기한 한자 목록 조회 엔드포인트
+
+    `Accept: application/x-ndjson` 요청은 서버 측 커서에서 고정 크기 묶음으로
+    읽어 한 줄에 한 한자씩 스트리밍합니다.
+    """
     try:
-        # 캐시 확인
-        cached_data = await cache.get("hanja:favorites")
-        if cached_data:
-            logger.info("캐시에서 즐겨찾기 목록 가져옴")
-            return cached_data
-        
-        # DB에서 조회
-        favorites = db.query(Hanja).filter(Hanja.favorite == True).all()
+        if wants_ndjson(request):
+            return ndjson_response(
+                _iter_favorites(db.get_bind()),
+                lambda hanja: HanjaResponse.model_validate(hanja).model_dump_json()
+            )
         
-        # 캐시 저장
-        await cache.set("hanja:favorites", favorites)
+        # 캐시 확인 (없으면 DB에서 조회해 저장, 변경 시에는 쓰기 경로에서 갱신됨)
+        async def load():
+            return load_favorites(db)
         
-        return favorites
+        return await cache.get_or_load(FAVORITES_KEY, load, expire=settings.DETAIL_CACHE_TTL)
     
     except Exception as e:
         logger.error(f"즐겨찾기 목록 조회 중 오류: {str(e)}")
@@ -207,6 +395,9 @@ async def clear_cache():
     """
     try:
         await cache.clear_cache("*")
+        # 비워진 캐시를 다시 예열 (응답은 기다리지 않음)
+        if settings.WARMUP_ENABLED:
+            cache_warmer.start(SessionLocal)
         return {"message": "캐시가 성공적으로 초기화되었습니다"}
     except Exception as e:
         logger.error(f"캐시 초기화 중 오류: {str(e)}")
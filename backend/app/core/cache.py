@@ -1,58 +1,322 @@
 from functools import wraps
+import asyncio
 import redis
+import redis.asyncio as aioredis
 import json
 import logging
 import time
-from typing import Any, Callable, Optional, Dict, List, Union
+import uuid
+from typing import Any, Awaitable, Callable, Optional, Dict, Iterable, List, Tuple, Union
+from app.core.cache_keys import key_namespace
+from app.core.circuit_breaker import CircuitBreaker
 from app.core.config import settings
+from app.core.local_cache import MISSING, LocalCache
+from app.core import metrics
+from app.core.serializers import SerializationError, make_serializer
+from app.schemas.hanja import HanjaResponse
 
 logger = logging.getLogger(__name__)
 
 class RedisCache:
-    def __init__(self, retry_attempts: int = 3, retry_delay: float = 1.0):
+    def __init__(
+        self,
+        retry_attempts: int = settings.REDIS_CONNECT_RETRIES,
+        retry_delay: float = settings.REDIS_RETRY_DELAY
+    ):
         """Redis 캐시 초기화
 
+        연결 풀만 준비하고 실제 연결 확인은 `start`가 띄운 백그라운드 작업에서
+        수행하므로 임포트나 애플리케이션 시작을 멈추지 않습니다.
+
+        Redis 호출이 연속으로 실패하면 회로 차단기가 열려 이후 호출은 Redis에 가지
+        않고 바로 실패(L1만 사용)하며, 백그라운드 작업이 지수 백오프로 재연결을
+        확인해 복구되면 다시 사용합니다.
+
+        조회는 프로세스 내 L1 캐시를 먼저 확인하고, 없을 때만 Redis(L2)로 갑니다.
+        삭제는 pub/sub 채널로 다른 워커에 알려 각 워커의 L1에서도 제거합니다.
+        Redis가 비활성화되어도 L1은 계속 동작합니다.
+
+        Redis 키는 `{네임스페이스}:v{세대}:{키}` 형식입니다. 전체 삭제는 세대 번호만
+        올려(O(1)) 이전 세대 키를 보이지 않게 하고, 남은 키는 TTL로 만료됩니다.
+
         Args:
             retry_attempts: 연결 재시도 횟수
             retry_delay: 재시도 사이의 지연 시간(초)
         """
-        self.redis_client = None
-        self.enabled = True
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
-        self._connect()
+        # 모든 요청이 공유하는 비동기 연결 풀
+        self.pool = aioredis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,  # 값은 serializer가 만든 bytes
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,  # 타임아웃 설정
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT
+        )
+        self.redis_client = aioredis.Redis(connection_pool=self.pool)
+        # 값 직렬화기 (한자 응답 dict는 필드 이름 없이 값 배열로 저장)
+        self.serializer = make_serializer(
+            settings.CACHE_SERIALIZER,
+            compress_threshold=settings.CACHE_COMPRESS_THRESHOLD,
+            compress_level=settings.CACHE_COMPRESS_LEVEL
+        )
+        self.serializer.register_schema(HanjaResponse.model_fields)
+        # 프로세스 내 L1 캐시와 워커 간 무효화 구독
+        self.local = LocalCache(max_size=settings.L1_CACHE_MAX_SIZE, ttl=settings.L1_CACHE_TTL)
+        self.instance_id = uuid.uuid4().hex
+        # 네임스페이스와 현재 세대 번호 (connect 시 Redis에서 읽음)
+        self.namespace = settings.CACHE_NAMESPACE
+        self.generation = 0
+        self._listener: Optional[asyncio.Task] = None
+        # 무효화 구독을 새로 시작한 횟수 (바뀌었으면 그 사이의 메시지를 놓쳤을 수 있음)
+        self.subscription_epoch = 0
+        # 다른 워커의 무효화 메시지를 받을 때 호출할 함수 (키 목록을 인자로 받음)
+        self._invalidation_listeners: List[Callable[[List[str]], None]] = []
+        # 키별로 진행 중인 적재 작업 (프로세스 내 single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 회로 차단기와 재연결 작업
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.CACHE_BREAKER_FAILURE_THRESHOLD,
+            base_delay=settings.REDIS_RECONNECT_BASE_DELAY,
+            max_delay=settings.REDIS_RECONNECT_MAX_DELAY
+        )
+        self._supervisor: Optional[asyncio.Task] = None
+        # 백그라운드 작업의 첫 연결 확인 완료 (start에서 이벤트 루프마다 생성)
+        self._probed: Optional[asyncio.Event] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Redis를 사용할 수 있는지 여부 (회로가 닫혀 있을 때만 True)"""
+        return self.breaker.closed
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value:
+            self.breaker.record_success()
+        else:
+            self._open_circuit()
+
+    def _open_circuit(self) -> None:
+        was_closed = self.breaker.closed
+        self.breaker.trip()
+        if was_closed:
+            metrics.CACHE_DISABLED.inc()
+            logger.warning(
+                f"Redis 회로 열림: 캐시는 L1만 사용하며 {self.breaker.delay:.1f}초 후 재연결을 확인합니다"
+            )
+
+    def _record_failure(self) -> None:
+        was_closed = self.breaker.closed
+        self.breaker.record_failure()
+        if was_closed and not self.breaker.closed:
+            metrics.CACHE_DISABLED.inc()
+            logger.warning(
+                f"Redis 호출이 연속으로 실패해 회로를 엽니다: {self.breaker.delay:.1f}초 후 재연결을 확인합니다"
+            )
+
+    async def _probe(self) -> bool:
+        """Redis 연결을 확인하고, 성공하면 회로를 닫고 무효화 구독을 시작합니다."""
+        was_closed = self.breaker.closed
+        try:
+            await asyncio.wait_for(self.redis_client.ping(), settings.REDIS_SOCKET_TIMEOUT)
+            await asyncio.wait_for(self._load_generation(), settings.REDIS_SOCKET_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis 연결 확인 실패: {e}")
+            if was_closed:
+                self._open_circuit()
+            else:
+                self.breaker.record_failure()
+            return False
+
+        if not was_closed:
+            # 연결이 끊긴 동안 다른 워커의 무효화를 놓쳤을 수 있으므로 L1을 비움
+            self.local.clear()
+            logger.info("Redis 재연결 성공: 회로를 닫습니다")
+        self.breaker.record_success()
+        self._start_listener()
+        return True
 
-    def _connect(self) -> bool:
-        """Redis 서버에 연결을 시도합니다.
+    async def connect(self) -> bool:
+        """Redis 서버에 연결을 시도합니다. (스크립트처럼 연결을 기다려야 하는 경우에 사용)
 
         Returns:
             bool: 연결 성공 여부
         """
         for attempt in range(self.retry_attempts):
-            try:
-                self.redis_client = redis.from_url(
-                    settings.REDIS_URL,
-                    decode_responses=True,
-                    socket_timeout=2.0,  # 타임아웃 설정
-                    socket_connect_timeout=2.0
-                )
-                # 간단한 연결 확인
-                self.redis_client.ping()
+            if await self._probe():
                 logger.info("Redis 연결 성공")
                 return True
-            except redis.ConnectionError as e:
-                logger.warning(f"Redis 연결 실패 (시도 {attempt+1}/{self.retry_attempts}): {e}")
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(self.retry_delay)
-            except Exception as e:
-                logger.error(f"Redis 초기화 중 예상치 못한 오류: {e}")
-                self.enabled = False
-                break
-        
+            logger.warning(f"Redis 연결 실패 (시도 {attempt+1}/{self.retry_attempts})")
+            if attempt < self.retry_attempts - 1:
+                await asyncio.sleep(self.retry_delay)
+
         logger.warning("Redis 캐시 비활성화됨: 모든 캐싱 작업이 무시됩니다")
-        self.enabled = False
         return False
 
+    def start(self) -> None:
+        """연결 확인과 재연결을 맡는 백그라운드 작업을 시작합니다. (기다리지 않음)"""
+        if self._supervisor is None or self._supervisor.done():
+            self._probed = asyncio.Event()
+            self._supervisor = asyncio.create_task(self._supervise())
+
+    async def wait_until_probed(self, timeout: float) -> None:
+        """`start` 후 첫 연결 확인이 끝날 때까지 기다립니다. (세대 번호가 적용된 뒤에 쓰기 위함)"""
+        if self._probed is None:
+            return
+        try:
+            await asyncio.wait_for(self._probed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _supervise(self) -> None:
+        """회로가 열려 있으면 백오프 후 반열림 상태에서 연결을 확인합니다."""
+        await self._probe()
+        self._probed.set()
+        while True:
+            if self.breaker.closed:
+                # 구독이 끊겼으면 다시 시작
+                self._start_listener()
+                await asyncio.sleep(settings.REDIS_HEALTH_CHECK_INTERVAL)
+                continue
+            await asyncio.sleep(self.breaker.seconds_until_retry())
+            if self.breaker.try_half_open():
+                await self._probe()
+
+    async def close(self) -> None:
+        """연결 풀의 연결을 모두 닫습니다. (애플리케이션 종료 시 호출)"""
+        for task in (self._supervisor, self._listener):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._supervisor = self._listener = None
+        try:
+            await self.pool.disconnect()
+        except Exception as e:
+            logger.warning(f"Redis 연결 종료 중 오류: {e}")
+
+    @property
+    def generation_key(self) -> str:
+        return f"{self.namespace}:generation"
+
+    def _key(self, key: str) -> str:
+        """논리 키를 네임스페이스와 세대가 붙은 Redis 키로 바꿉니다."""
+        return f"{self.namespace}:v{self.generation}:{key}"
+
+    async def _load_generation(self) -> None:
+        value = await self.redis_client.get(self.generation_key)
+        self.generation = int(value) if value else 0
+
+    async def _timed(self, operation: str, command: Awaitable[Any]) -> Any:
+        """Redis 명령의 왕복 시간을 기록하고, 실패하면 오류 수를 올린 뒤 예외를 그대로 전달합니다.
+
+        명령은 REDIS_COMMAND_TIMEOUT 안에 끝나야 하며, 연결 오류나 시간 초과는
+        회로 차단기의 실패로 집계됩니다.
+        """
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(command, settings.REDIS_COMMAND_TIMEOUT)
+            if self.breaker.failures:
+                self.breaker.record_success()
+            return result
+        except (redis.ConnectionError, redis.TimeoutError, asyncio.TimeoutError, OSError):
+            metrics.CACHE_ERRORS.inc(operation=operation)
+            self._record_failure()
+            raise
+        except Exception:
+            metrics.CACHE_ERRORS.inc(operation=operation)
+            raise
+        finally:
+            metrics.REDIS_LATENCY.observe(time.perf_counter() - start, operation=operation)
+
+    @staticmethod
+    def _record_hit(key: str, layer: str) -> None:
+        metrics.CACHE_HITS.inc(namespace=key_namespace(key), layer=layer)
+
+    @staticmethod
+    def _record_miss(key: str) -> None:
+        metrics.CACHE_MISSES.inc(namespace=key_namespace(key))
+
+    @staticmethod
+    def _record_payload(key: str, operation: str, data: bytes) -> None:
+        metrics.CACHE_PAYLOAD_BYTES.observe(len(data), namespace=key_namespace(key), operation=operation)
+
+    def add_invalidation_listener(self, listener: Callable[[List[str]], None]) -> None:
+        """다른 워커가 키를 무효화했을 때 호출될 함수를 등록합니다."""
+        self._invalidation_listeners.append(listener)
+
+    def _start_listener(self) -> None:
+        if not self.enabled:
+            return
+        if self._listener is None or self._listener.done():
+            self.subscription_epoch += 1
+            self._listener = asyncio.create_task(self._listen_invalidations())
+
+    async def _listen_invalidations(self) -> None:
+        """다른 워커가 보낸 무효화 메시지를 받아 L1에서 제거합니다."""
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                self._apply_invalidation(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 구독이 끊기면 다른 워커의 무효화를 놓칠 수 있으므로 L1을 비움
+            logger.warning(f"캐시 무효화 구독 중단: {e}")
+            self.local.clear()
+            try:
+                await self._load_generation()
+            except Exception:
+                pass
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    def _apply_invalidation(self, data: Any) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(message, dict) or message.get("origin") == self.instance_id:
+            return
+        generation = message.get("generation")
+        if isinstance(generation, int) and generation > self.generation:
+            # 다른 워커가 전체 삭제를 수행함
+            self.generation = generation
+            self.local.clear()
+        keys = message.get("keys") or []
+        self.local.delete(keys)
+        for listener in self._invalidation_listeners:
+            try:
+                listener(keys)
+            except Exception as e:
+                logger.warning(f"캐시 무효화 처리 중 오류: {e}")
+        for pattern in message.get("patterns") or ():
+            self.local.delete_pattern(pattern)
+
+    async def _publish_invalidation(self, keys: Iterable[str] = (), patterns: Iterable[str] = ()) -> None:
+        """다른 워커의 L1에서 키를 제거하도록 알립니다."""
+        if not self.enabled:
+            return
+        message = {
+            "origin": self.instance_id,
+            "generation": self.generation,
+            "keys": list(keys),
+            "patterns": list(patterns),
+        }
+        try:
+            await self._timed("publish", self.redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, json.dumps(message)))
+        except Exception as e:
+            logger.warning(f"캐시 무효화 전파 실패: {e}")
+
     def cache_decorator(self, expire_time: int = 3600, key_prefix: str = ""):
         """함수 결과를 캐싱하는 데코레이터
 
@@ -63,43 +327,24 @@ class RedisCache:
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                # 캐시가 비활성화되었거나 클라이언트가 없는 경우 캐싱 없이 함수 실행
-                if not self.enabled or not self.redis_client:
-                    return await func(*args, **kwargs)
-
                 # 캐시 키 생성
                 cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args))}{hash(str(kwargs))}"
-                
-                try:
-                    # 캐시된 데이터 확인
-                    cached_data = self.redis_client.get(cache_key)
-                    if cached_data:
-                        logger.debug(f"캐시 적중: {cache_key}")
-                        return json.loads(cached_data)
-
-                    # 함수 실행
-                    result = await func(*args, **kwargs)
-
-                    # 결과 캐싱
-                    if result:
-                        try:
-                            serialized = json.dumps(result)
-                            self.redis_client.setex(
-                                cache_key,
-                                expire_time,
-                                serialized
-                            )
-                            logger.debug(f"캐시 저장: {cache_key}, 만료 시간: {expire_time}초")
-                        except (TypeError, json.JSONDecodeError) as e:
-                            logger.warning(f"캐시 저장 실패 (직렬화 오류): {e}")
-                        except redis.RedisError as e:
-                            logger.warning(f"캐시 저장 실패 (Redis 오류): {e}")
-
-                    return result
-
-                except Exception as e:
-                    logger.error(f"캐시 작업 중 오류 발생: {e}")
-                    return await func(*args, **kwargs)
+
+                # 캐시된 데이터 확인 (L1 → Redis)
+                cached_data = await self.get(cache_key)
+                if cached_data is not None:
+                    logger.debug(f"캐시 적중: {cache_key}")
+                    return cached_data
+
+                # 함수 실행
+                result = await func(*args, **kwargs)
+
+                # 결과 캐싱
+                if result:
+                    await self.set(cache_key, result, expire_time)
+                    logger.debug(f"캐시 저장: {cache_key}, 만료 시간: {expire_time}초")
+
+                return result
 
             return wrapper
         return decorator
@@ -107,36 +352,39 @@ class RedisCache:
     async def clear_cache(self, pattern: str = "*") -> bool:
         """지정된 패턴과 일치하는 모든 캐시를 삭제합니다.
 
+        전체 삭제("*")는 세대 번호를 올리는 것으로 끝나며, 패턴 삭제는 현재 세대의
+        키만 SCAN으로 조금씩 찾아 UNLINK로 묶어 지우므로 Redis를 오래 막지 않습니다.
+        다른 애플리케이션의 키는 건드리지 않습니다.
+
         Args:
-            pattern: 삭제할 캐시 키 패턴
-            
+            pattern: 삭제할 캐시 키 패턴 (네임스페이스를 뺀 논리 키 기준)
+
         Returns:
             bool: 삭제 성공 여부
         """
+        self.local.delete_pattern(pattern)
         if not self.enabled:
             logger.warning("캐시가 비활성화되어 있어 캐시 삭제를 건너뜁니다")
             return True
-            
-        try:
-            if not self.redis_client:
-                logger.warning("Redis 클라이언트가 초기화되지 않았습니다")
-                return True  # 캐시가 없는 경우 성공으로 간주
 
-            # 패턴이 없으면 모든 키를 삭제
+        try:
+            # 패턴이 없으면 세대를 올려 모든 키를 무효화
             if not pattern or pattern == "*":
-                logger.info("모든 캐시 키를 삭제합니다")
-            else:
-                logger.info(f"패턴 '{pattern}'과 일치하는 캐시 키를 삭제합니다")
+                self.generation = await self.redis_client.incr(self.generation_key)
+                logger.info(f"모든 캐시 키를 무효화했습니다 (세대 {self.generation})")
+                await self._publish_invalidation(patterns=["*"])
+                return True
 
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                self.redis_client.delete(*keys)
-                logger.info(f"{len(keys)}개의 캐시 항목이 삭제되었습니다.")
+            logger.info(f"패턴 '{pattern}'과 일치하는 캐시 키를 삭제합니다")
+            deleted = await self._unlink_matching(self._key(pattern))
+            await self._publish_invalidation(patterns=[pattern])
+            if deleted:
+                logger.info(f"{deleted}개의 캐시 항목이 삭제되었습니다.")
             else:
                 logger.info("삭제할 캐시 키가 없습니다")
-                
+
             return True
-            
+
         except redis.RedisError as e:
             logger.error(f"캐시 삭제 중 Redis 오류: {e}")
             return False
@@ -144,36 +392,455 @@ class RedisCache:
             logger.error(f"캐시 삭제 중 예상치 못한 오류: {e}")
             return False
 
+    async def _unlink_matching(self, match: str) -> int:
+        """SCAN으로 키를 찾아 CACHE_SCAN_COUNT개씩 UNLINK합니다."""
+        count = settings.CACHE_SCAN_COUNT
+        deleted = 0
+        batch: List[str] = []
+        async for key in self.redis_client.scan_iter(match=match, count=count):
+            batch.append(key)
+            if len(batch) >= count:
+                deleted += await self.redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.redis_client.unlink(*batch)
+        return deleted
+
     async def get(self, key: str) -> Optional[Any]:
-        """캐시에서 키에 해당하는 값을 가져옵니다."""
-        if not self.enabled or not self.redis_client:
+        """캐시에서 키에 해당하는 값을 가져옵니다. (L1 → Redis 순서)"""
+        value = self.local.get(key)
+        if value is not MISSING:
+            self._record_hit(key, "l1")
+            return value
+        if not self.enabled:
+            self._record_miss(key)
             return None
-            
+
         try:
-            data = self.redis_client.get(key)
+            data = await self._timed("get", self.redis_client.get(self._key(key)))
             if data:
-                return json.loads(data)
+                value = self.serializer.loads(data)
+                self.local.set(key, value)
+                self._record_hit(key, "redis")
+                self._record_payload(key, "get", data)
+                return value
+        except SerializationError as e:
+            metrics.CACHE_ERRORS.inc(operation="deserialize")
+            logger.error(f"캐시 조회 중 오류: {e}")
+        except Exception as e:
+            logger.error(f"캐시 조회 중 오류: {e}")
+        self._record_miss(key)
+        return None
+
+    async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
+        """값을 L1과 Redis에 저장합니다."""
+        try:
+            serialized = self.serializer.dumps(value)
+        except SerializationError as e:
+            metrics.CACHE_ERRORS.inc(operation="serialize")
+            logger.error(f"캐시 저장 중 오류 (직렬화 오류): {e}")
+            return False
+
+        # 직렬화 가능한 값만 L1에 보관 (ORM 객체 등이 남지 않도록)
+        self.local.set(key, value, expire)
+        metrics.CACHE_SETS.inc(namespace=key_namespace(key))
+        if not self.enabled:
+            return False
+
+        try:
+            await self._timed("set", self.redis_client.setex(self._key(key), expire, serialized))
+            self._record_payload(key, "set", serialized)
+            return True
+        except Exception as e:
+            logger.error(f"캐시 저장 중 오류: {e}")
+            return False
+
+    async def delete(self, *keys: str) -> int:
+        """키를 캐시에서 삭제하고 다른 워커의 L1에도 알립니다.
+
+        Returns:
+            int: Redis에서 삭제된 키 수
+        """
+        if not keys:
+            return 0
+        self.local.delete(keys)
+        if not self.enabled:
+            return 0
+
+        try:
+            deleted = await self._timed("delete", self.redis_client.unlink(*[self._key(key) for key in keys]))
+        except Exception as e:
+            logger.error(f"캐시 삭제 중 오류: {e}")
+            deleted = 0
+        await self._publish_invalidation(keys=list(keys))
+        return deleted
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키의 값을 한 번의 왕복으로 가져옵니다.
+
+        Returns:
+            List: 키 순서대로의 값 목록 (없거나 오류인 항목은 None)
+        """
+        results: List[Optional[Any]] = []
+        missing: List[int] = []
+        for index, key in enumerate(keys):
+            value = self.local.get(key)
+            if value is MISSING:
+                missing.append(index)
+                value = None
+            else:
+                self._record_hit(key, "l1")
+            results.append(value)
+        if not self.enabled or not missing:
+            for index in missing:
+                self._record_miss(keys[index])
+            return results
+
+        # L1에 없는 키만 Redis에서 한 번에 조회
+        try:
+            values = await self._timed("mget", self.redis_client.mget([self._key(keys[index]) for index in missing]))
+        except Exception as e:
+            logger.error(f"캐시 일괄 조회 중 오류: {e}")
+            values = [None] * len(missing)
+
+        for index, value in zip(missing, values):
+            key = keys[index]
+            try:
+                results[index] = self.serializer.loads(value) if value else None
+            except SerializationError:
+                metrics.CACHE_ERRORS.inc(operation="deserialize")
+            if results[index] is None:
+                self._record_miss(key)
+                continue
+            self.local.set(key, results[index])
+            self._record_hit(key, "redis")
+            self._record_payload(key, "get", value)
+        return results
+
+    async def mset(self, mapping: Dict[str, Any], expire: int = 3600) -> bool:
+        """여러 키를 파이프라인으로 한 번의 왕복에 저장합니다. (키마다 만료 시간 적용)"""
+        if not mapping:
+            return False
+
+        try:
+            serialized = {key: self.serializer.dumps(value) for key, value in mapping.items()}
+        except SerializationError as e:
+            metrics.CACHE_ERRORS.inc(operation="serialize")
+            logger.error(f"캐시 일괄 저장 중 오류 (직렬화 오류): {e}")
+            return False
+        for key, value in mapping.items():
+            self.local.set(key, value, expire)
+            metrics.CACHE_SETS.inc(namespace=key_namespace(key))
+        if not self.enabled:
+            return False
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in serialized.items():
+                    pipe.setex(self._key(key), expire, value)
+                    self._record_payload(key, "set", value)
+                await self._timed("mset", pipe.execute())
+            return True
+        except Exception as e:
+            logger.error(f"캐시 일괄 저장 중 오류: {e}")
+            return False
+
+    async def get_counter(self, key: str) -> int:
+        """정수 카운터 값을 조회합니다. (L1 → Redis 순서, 없으면 0)"""
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+        value = 0
+        if self.enabled:
+            try:
+                data = await self._timed("get", self.redis_client.get(self._key(key)))
+                value = int(data) if data else 0
+            except Exception as e:
+                logger.error(f"카운터 조회 중 오류: {e}")
+                return 0
+        self.local.set(key, value)
+        return value
+
+    async def incr(self, key: str) -> int:
+        """정수 카운터를 1 올리고 다른 워커의 L1에도 알립니다.
+
+        Redis를 쓸 수 없으면 이 워커의 L1 값만 올립니다. (다른 워커는 L1 TTL 뒤에 반영)
+
+        Returns:
+            int: 증가한 값
+        """
+        value = None
+        if self.enabled:
+            try:
+                value = await self._timed("incr", self.redis_client.incr(self._key(key)))
+            except Exception as e:
+                logger.error(f"카운터 증가 중 오류: {e}")
+        if value is None:
+            current = self.local.get(key)
+            value = (0 if current is MISSING else current) + 1
+        self.local.set(key, value)
+        await self._publish_invalidation(keys=[key])
+        return value
+
+    async def zscore(self, key: str, member: str) -> Optional[float]:
+        """sorted set 멤버의 점수를 조회합니다. (없거나 Redis를 쓸 수 없으면 None)"""
+        if not self.enabled:
             return None
+        try:
+            return await self._timed("zscore", self.redis_client.zscore(self._key(key), member))
+        except Exception as e:
+            logger.error(f"sorted set 조회 중 오류: {e}")
+            return None
+
+    async def zadd_recent(self, key: str, member: str, ttl: int) -> bool:
+        """현재 시각을 점수로 멤버를 추가하고 ttl보다 오래된 멤버를 정리합니다.
+
+        키 자체도 ttl 뒤에 만료되므로 최근 기록 목록으로 사용할 수 있습니다.
+        """
+        if not self.enabled:
+            return False
+        now = time.time()
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(self._key(key), {member: now})
+                pipe.zremrangebyscore(self._key(key), 0, now - ttl)
+                pipe.expire(self._key(key), ttl)
+                await self._timed("zadd", pipe.execute())
+            return True
+        except Exception as e:
+            logger.error(f"sorted set 저장 중 오류: {e}")
+            return False
+
+    async def zrem(self, key: str, *members: str) -> int:
+        """sorted set에서 멤버를 삭제합니다.
+
+        Returns:
+            int: 삭제된 멤버 수
+        """
+        if not members or not self.enabled:
+            return 0
+        try:
+            return await self._timed("zrem", self.redis_client.zrem(self._key(key), *members))
+        except Exception as e:
+            logger.error(f"sorted set 삭제 중 오류: {e}")
+            return 0
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int = settings.CACHE_TTL,
+        stale_ttl: int = settings.CACHE_STALE_TTL
+    ) -> Optional[Any]:
+        """캐시 값을 반환하고, 없으면 loader로 한 번만 적재합니다.
+
+        - 같은 프로세스의 동시 요청은 진행 중인 적재 작업 하나를 함께 기다립니다.
+        - 워커 간에는 Redis 잠금(SET NX)을 잡은 워커만 loader를 실행하고, 나머지는
+          잠시 Redis에 값이 채워지기를 기다립니다.
+        - 만료 후 stale_ttl 동안은 이전 값을 그대로 응답하고, 잠금을 잡은 요청 하나만
+          새 값을 적재합니다. (stale-while-revalidate)
+
+        값은 {"v": 값, "t": 만료 시각} 형태로 저장되므로 이 메서드로 적재한 키는
+        get/set 대신 이 메서드로만 조회해야 합니다. loader가 None을 반환하면
+        캐싱하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            loader: 원본 데이터를 읽는 비동기 함수
+            expire: 값이 새것으로 취급되는 시간(초)
+            stale_ttl: 만료 후 이전 값을 응답할 수 있는 시간(초)
+        """
+        entry, layer = await self._get_entry(key)
+        if entry is not None and entry["t"] > time.time():
+            self._record_hit(key, layer)
+            return entry["v"]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            # 이미 적재 중: 이전 값이 있으면 바로 응답, 없으면 결과를 함께 기다림
+            if entry is not None:
+                metrics.CACHE_STALE_HITS.inc(namespace=key_namespace(key))
+                return entry["v"]
+            self._record_miss(key)
+            return await asyncio.shield(task)
+
+        self._record_miss(key)
+
+        task = asyncio.ensure_future(self._load_entry(key, loader, expire, stale_ttl, entry))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_entry(self, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """L1과 Redis에서 더 새로운 항목을 찾습니다.
+
+        Returns:
+            (항목 또는 None, 찾은 계층 "l1"/"redis")
+        """
+        entry = self.local.get(key)
+        if entry is not MISSING and entry["t"] > time.time():
+            return entry, "l1"
+        # L1 항목이 오래되었으면 다른 워커가 이미 갱신했는지 Redis를 확인
+        remote = await self._get_remote_entry(key)
+        if remote is not None:
+            self.local.set(key, remote)
+            return remote, "redis"
+        return (None if entry is MISSING else entry), "l1"
+
+    async def _get_remote_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        try:
+            data = await self._timed("get", self.redis_client.get(self._key(key)))
+            entry = self.serializer.loads(data) if data else None
+            if data:
+                self._record_payload(key, "get", data)
         except Exception as e:
             logger.error(f"캐시 조회 중 오류: {e}")
             return None
-            
-    async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
-        """값을 캐시에 저장합니다."""
-        if not self.enabled or not self.redis_client:
+        return entry if isinstance(entry, dict) and "t" in entry else None
+
+    async def put(
+        self,
+        key: str,
+        value: Any,
+        expire: int = settings.CACHE_TTL,
+        stale_ttl: int = settings.CACHE_STALE_TTL
+    ) -> bool:
+        """`get_or_load`용 키에 새 값을 직접 기록하고(write-through) 다른 워커의 L1에서 제거합니다.
+
+        Returns:
+            bool: Redis 저장 성공 여부 (실패하면 호출하는 쪽에서 키를 지워야 함)
+        """
+        stored = await self._set_entry(key, value, expire, stale_ttl)
+        await self._publish_invalidation(keys=[key])
+        return stored
+
+    async def put_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = settings.CACHE_TTL,
+        stale_ttl: int = settings.CACHE_STALE_TTL
+    ) -> bool:
+        """DB에서 막 읽은 값 여러 개를 `get_or_load`용 키에 파이프라인으로 저장합니다."""
+        entries = {key: {"v": value, "t": time.time() + expire} for key, value in mapping.items()}
+        return await self.mset(entries, expire + stale_ttl)
+
+    async def mget_fresh(self, keys: List[str]) -> List[Optional[Any]]:
+        """`get_or_load`용 키 여러 개를 한 번에 조회합니다. 없거나 만료된 항목은 None입니다."""
+        now = time.time()
+        return [
+            entry["v"] if isinstance(entry, dict) and entry.get("t", 0) > now else None
+            for entry in await self.mget(keys)
+        ]
+
+    async def _set_entry(self, key: str, value: Any, expire: int, stale_ttl: int) -> bool:
+        entry = {"v": value, "t": time.time() + expire}
+        try:
+            serialized = self.serializer.dumps(entry)
+        except SerializationError as e:
+            metrics.CACHE_ERRORS.inc(operation="serialize")
+            logger.error(f"캐시 저장 중 오류 (직렬화 오류): {e}")
+            self.local.delete([key])
             return False
-            
+        self.local.set(key, entry, expire + stale_ttl)
+        metrics.CACHE_SETS.inc(namespace=key_namespace(key))
+        if not self.enabled:
+            return True
         try:
-            serialized = json.dumps(value)
-            self.redis_client.setex(key, expire, serialized)
+            await self._timed("set", self.redis_client.setex(self._key(key), expire + stale_ttl, serialized))
+            self._record_payload(key, "set", serialized)
             return True
         except Exception as e:
             logger.error(f"캐시 저장 중 오류: {e}")
             return False
 
+    async def _load_entry(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int,
+        stale_ttl: int,
+        stale: Optional[Dict[str, Any]]
+    ) -> Optional[Any]:
+        lock_key = self._key(f"lock:{key}")
+        token = await self._acquire_lock(lock_key)
+        if token is None:
+            # 다른 워커가 적재 중
+            if stale is not None:
+                return stale["v"]
+            entry = await self._wait_for_entry(key)
+            if entry is not None:
+                return entry["v"]
+            logger.warning(f"캐시 적재 대기 시간 초과, 직접 적재합니다: {key}")
+
+        try:
+            value = await loader()
+            if value is not None:
+                await self._set_entry(key, value, expire, stale_ttl)
+            return value
+        finally:
+            if token:
+                await self._release_lock(lock_key, token)
+
+    async def _acquire_lock(self, lock_key: str) -> Optional[str]:
+        """워커 간 적재 잠금을 잡습니다. Redis를 쓸 수 없으면 잠금 없이 진행합니다.
+
+        Returns:
+            잠금 토큰 (잠금 없이 진행하면 빈 문자열), 다른 워커가 잡고 있으면 None
+        """
+        if not self.enabled:
+            return ""
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._timed("lock", self.redis_client.set(
+                lock_key, token, nx=True, px=int(settings.CACHE_LOCK_TIMEOUT * 1000)
+            ))
+        except Exception as e:
+            logger.warning(f"캐시 잠금 획득 실패: {e}")
+            return ""
+        return token if acquired else None
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        """자신이 잡은 잠금만 해제합니다. (WATCH로 확인과 삭제를 원자적으로 처리)"""
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                await pipe.watch(lock_key)
+                if await pipe.get(lock_key) == token.encode():
+                    pipe.multi()
+                    pipe.unlink(lock_key)
+                    await pipe.execute()
+                else:
+                    await pipe.unwatch()
+        except redis.WatchError:
+            pass
+        except Exception as e:
+            logger.warning(f"캐시 잠금 해제 실패: {e}")
+
+    async def _wait_for_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """다른 워커가 값을 채울 때까지 잠금 유지 시간만큼 기다립니다."""
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            entry = await self._get_remote_entry(key)
+            if entry is not None:
+                self.local.set(key, entry)
+                return entry
+        return None
+
 # 싱글톤 인스턴스 생성
 redis_cache = RedisCache()
 
+metrics.registry.gauge(
+    "hanja_cache_enabled", "Redis 캐시 사용 여부 (1: 사용, 0: 비활성화)", lambda: int(redis_cache.enabled)
+)
+metrics.registry.gauge(
+    "hanja_cache_circuit_open", "Redis 회로 차단기가 열려(또는 반열림) 있는지 여부", lambda: int(not redis_cache.breaker.closed)
+)
+metrics.registry.gauge(
+    "hanja_cache_l1_entries", "프로세스 내 L1 캐시 항목 수", lambda: len(redis_cache.local)
+)
+
 def get_cache() -> RedisCache:
     """Redis 캐시 인스턴스를 반환합니다."""
-    return redis_cache 
\ No newline at end of file
+    return redis_cache
@@ -0,0 +1,48 @@
+"""
+캐시 키 규칙
+
+모든 캐시 키는 이 모듈의 함수로만 만듭니다. 읽는 쪽과 지우는 쪽이 같은 함수를
+쓰므로 키 형식이 어긋나 무효화가 빠지는 일이 없습니다.
+(Redis에는 RedisCache가 네임스페이스와 세대를 앞에 붙여 저장합니다.)
+"""
+import hashlib
+import json
+from typing import Optional
+
+# 한자 상세 정보 키 접두사 (뒤에 traditional 한 글자)
+HANJA_DETAIL_PREFIX = "hanja:detail:"
+
+# 즐겨찾기 목록 키
+FAVORITES_KEY = "hanja:favorites"
+
+
+def hanja_detail_key(traditional: str) -> str:
+    """한자 상세 정보 캐시 키"""
+    return f"{HANJA_DETAIL_PREFIX}{traditional}"
+
+
+# 검색 결과 키 접두사와 전체 삭제용 패턴
+SEARCH_RESULT_PREFIX = "search:"
+SEARCH_RESULT_PATTERN = f"{SEARCH_RESULT_PREFIX}*"
+
+# 검색 결과 세대 카운터 키 (한자가 저장될 때마다 올라가 이전 검색 결과 키를 모두 바꿈)
+SEARCH_GENERATION_KEY = "search-generation"
+
+
+def search_result_key(
+    query: str, mode: str, sort_by: str, limit: int, cursor: Optional[str], generation: int = 0
+) -> str:
+    """검색 결과 캐시 키 (검색 결과 세대와 정규화된 검색 조건의 해시)"""
+    raw = json.dumps([query, mode, sort_by, limit, cursor], ensure_ascii=False, separators=(",", ":"))
+    return f"{SEARCH_RESULT_PREFIX}{generation}:" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def key_namespace(key: str) -> str:
+    """지표 집계용 키 분류 (hanja_detail, favorites, search, 그 외에는 첫 구분자 앞부분)"""
+    if key.startswith(HANJA_DETAIL_PREFIX):
+        return "hanja_detail"
+    if key == FAVORITES_KEY:
+        return "favorites"
+    if key.startswith(SEARCH_RESULT_PREFIX):
+        return "search"
+    return key.split(":", 1)[0] or "other"
@@ -0,0 +1,82 @@
+"""
+Redis 회로 차단기
+
+연속 실패가 임계값에 이르면 회로를 열어(open) 이후 캐시 호출이 Redis에 가지 않고
+바로 실패하게 합니다. 재시도 시각이 지나면 반열림(half-open) 상태에서 한 번만
+확인(probe)하고, 성공하면 닫고(closed) 실패하면 대기 시간을 두 배로 늘려 다시 엽니다.
+"""
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """지수 백오프를 사용하는 회로 차단기"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_threshold: 회로를 여는 연속 실패 횟수
+            base_delay: 처음 열렸을 때 재확인까지의 대기 시간(초)
+            max_delay: 대기 시간 상한(초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.delay = base_delay
+        self.retry_at = 0.0
+        self.trips = 0  # 회로가 열린 횟수
+
+    @property
+    def closed(self) -> bool:
+        return self.state == CLOSED
+
+    def seconds_until_retry(self) -> float:
+        return max(0.0, self.retry_at - self._clock())
+
+    def record_success(self) -> None:
+        """호출 또는 확인이 성공함: 회로를 닫고 대기 시간을 초기화합니다."""
+        self.state = CLOSED
+        self.failures = 0
+        self.delay = self.base_delay
+
+    def record_failure(self) -> None:
+        """호출 또는 확인이 실패함"""
+        if self.state == HALF_OPEN:
+            # 확인 실패: 대기 시간을 늘려 다시 열기
+            self.delay = min(self.delay * 2, self.max_delay)
+            self._open()
+        elif self.state == CLOSED:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.trip()
+
+    def trip(self) -> None:
+        """회로를 즉시 엽니다."""
+        if self.state != OPEN:
+            self.trips += 1
+        self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.retry_at = self._clock() + self.delay
+
+    def try_half_open(self) -> bool:
+        """재시도 시각이 지났으면 반열림 상태로 바꿔 확인을 한 번 허용합니다."""
+        if self.state == OPEN and self._clock() >= self.retry_at:
+            self.state = HALF_OPEN
+            return True
+        return False
@@ -28,7 +28,47 @@ class Settings(BaseSettings):
         "REDIS_URL",
         "redis://localhost:6379/0"
     )
+    REDIS_MAX_CONNECTIONS: int = 50  # 공유 연결 풀 크기
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    REDIS_CONNECT_RETRIES: int = 3  # connect()로 연결을 기다리는 스크립트의 확인 횟수
+    REDIS_RETRY_DELAY: float = 1.0
+    REDIS_COMMAND_TIMEOUT: float = 0.1  # 캐시 명령 하나에 허용하는 시간(초), 넘으면 실패로 집계
+    CACHE_BREAKER_FAILURE_THRESHOLD: int = 3  # 회로를 여는 연속 실패 횟수
+    REDIS_RECONNECT_BASE_DELAY: float = 0.5  # 회로가 열린 뒤 첫 재연결 확인까지의 시간(초), 실패할 때마다 두 배
+    REDIS_RECONNECT_MAX_DELAY: float = 30.0
+    REDIS_HEALTH_CHECK_INTERVAL: float = 5.0  # 회로가 닫혀 있을 때 무효화 구독 상태를 확인하는 간격(초)
     CACHE_TTL: int = 3600  # 1시간
+    DETAIL_CACHE_TTL: int = 86400  # 쓰기 시 갱신되는 상세/즐겨찾기 캐시는 길게 유지
+    SEARCH_CACHE_TTL: int = 600  # 검색 결과(한자 목록) 캐시 유지 시간(초)
+    WARMUP_ENABLED: bool = True  # 시작 시 자주 쓰는 한자를 캐시에 미리 적재
+    WARMUP_TOP_N: int = 2000  # 빈도 상위 몇 개를 적재할지
+    WARMUP_BATCH_SIZE: int = 200  # 파이프라인 한 번에 저장할 항목 수
+    WARMUP_CONCURRENCY: int = 4  # 동시에 실행할 파이프라인 수
+    WARMUP_TIME_BUDGET: float = 10.0  # 예열에 쓸 최대 시간(초), 넘으면 남은 배치는 건너뛰고 준비 완료
+    CACHE_SERIALIZER: str = os.getenv("CACHE_SERIALIZER", "auto")  # auto, msgpack, orjson, json
+    CACHE_COMPRESS_THRESHOLD: int = 1024  # 이 크기(바이트)를 넘는 캐시 값만 zlib 압축 (0이면 압축 안 함)
+    CACHE_COMPRESS_LEVEL: int = 1  # 캐시는 압축률보다 속도가 중요하므로 낮은 수준 사용
+    L1_CACHE_MAX_SIZE: int = 4096  # 프로세스 내 캐시 최대 항목 수 (0이면 사용 안 함)
+    L1_CACHE_TTL: int = 300  # 다른 워커의 무효화를 놓쳐도 이 시간 안에는 갱신됨
+    CACHE_INVALIDATION_CHANNEL: str = "hanja:cache:invalidate"  # 워커 간 L1 무효화 pub/sub 채널
+    CACHE_NAMESPACE: str = os.getenv("CACHE_NAMESPACE", "hanjadb")  # 같은 Redis를 쓰는 다른 앱과 키 구분
+    CACHE_SCAN_COUNT: int = 500  # 패턴 삭제 시 SCAN/UNLINK 한 번에 처리할 키 수
+    CACHE_STALE_TTL: int = 300  # 만료 후에도 갱신되는 동안 이전 값을 응답할 수 있는 시간(초)
+    CACHE_LOCK_TIMEOUT: float = 5.0  # 워커 간 캐시 적재 잠금 유지 시간(초)
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05  # 다른 워커의 적재 결과를 기다릴 때 확인 간격(초)
+    NEGATIVE_CACHE_TTL: int = 300  # 없는 한자 조회 결과를 기억하는 시간(초)
+    SCRAPE_NEGATIVE_CACHE_TTL: int = 86400  # 스크레이핑에 실패한 한자를 다시 시도하지 않는 시간(초)
+    BLOOM_FALSE_POSITIVE_RATE: float = 0.01  # 알려진 한자 블룸 필터의 목표 오탐률
+    BLOOM_REFRESH_INTERVAL: float = 600.0  # 블룸 필터를 DB에서 다시 구축하는 간격(초), 지나면 필터의 "없음"을 믿지 않음
+    BLOOM_CHECK_INTERVAL: float = 5.0  # 블룸 필터를 다시 구축해야 하는지 확인하는 간격(초)
+    
+    # 검색 색인 설정
+    KOREAN_DICTIONARY_DB: str = os.getenv(
+        "KOREAN_DICTIONARY_DB",
+        "../korean_dictionary.db"  # 루트의 create_korean_dictionary.py가 만드는 사전
+    )
+    SUGGEST_TOP_K: int = 10  # 자동완성 접두사마다 미리 계산해 둘 결과 수
+    SUGGEST_SCAN_LIMIT: int = 256  # 키가 이보다 많은 접두사만 상위 결과를 미리 계산
     
     # 테스트 모드 확인
     def is_testing(self) -> bool:
@@ -0,0 +1,105 @@
+"""
+캐시 무효화 레지스트리
+
+쓰기 경로는 캐시 키를 직접 지우지 않고 `invalidation.emit(이벤트, hanja, db)`만
+호출합니다. 이벤트마다 등록된 처리 함수가 영향을 받는 키를 새 값으로 덮어쓰거나
+(write-through) 지우고, 다른 워커의 L1에도 전파합니다. 새 캐시를 추가할 때는
+여기에 처리 함수를 등록하면 모든 쓰기 경로에 함께 적용됩니다.
+"""
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import redis_cache as cache
+from app.core.cache_keys import FAVORITES_KEY, SEARCH_GENERATION_KEY, hanja_detail_key
+from app.core.config import settings
+from app.core.negative_cache import hanja_negative_cache
+from app.models.hanja import Hanja
+from app.schemas.hanja import HanjaResponse
+from app.search import index_hanja
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 이름
+HANJA_SAVED = "hanja_saved"  # 한자 생성/수정
+FAVORITE_TOGGLED = "favorite_toggled"  # 즐겨찾기 상태 변경
+
+Handler = Callable[[str, Hanja, Session], Awaitable[None]]
+
+
+class InvalidationRegistry:
+    """이벤트별 캐시 갱신 함수 목록"""
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+
+    def on(self, *events: str) -> Callable[[Handler], Handler]:
+        """이벤트 처리 함수를 등록하는 데코레이터"""
+        def decorator(handler: Handler) -> Handler:
+            for event in events:
+                self._handlers[event].append(handler)
+            return handler
+        return decorator
+
+    async def emit(self, event: str, hanja: Hanja, db: Session) -> None:
+        """이벤트에 등록된 처리 함수를 순서대로 실행합니다.
+
+        처리 함수가 실패해도 쓰기 요청은 이미 커밋되었으므로 오류를 기록만 합니다.
+        """
+        for handler in self._handlers.get(event, ()):
+            try:
+                await handler(event, hanja, db)
+            except Exception as e:
+                logger.error(f"캐시 무효화 처리 실패 ({event}, {handler.__name__}): {e}")
+
+
+# 싱글톤 인스턴스 생성
+invalidation = InvalidationRegistry()
+
+
+def serialize_hanja(hanja: Hanja) -> dict:
+    """캐시에 저장할 한자 응답 dict"""
+    return HanjaResponse.model_validate(hanja).model_dump(mode="json")
+
+
+def load_favorites(db: Session) -> List[dict]:
+    """캐시에 저장할 즐겨찾기 목록"""
+    rows = db.query(Hanja).filter(Hanja.favorite == True).order_by(Hanja.id).all()
+    return [serialize_hanja(hanja) for hanja in rows]
+
+
+@invalidation.on(HANJA_SAVED)
+async def update_search_indexes(event: str, hanja: Hanja, db: Session) -> None:
+    """메모리 검색 색인과 부정 캐시에 반영"""
+    index_hanja(hanja)
+    await hanja_negative_cache.discard(hanja.traditional)
+
+
+@invalidation.on(HANJA_SAVED, FAVORITE_TOGGLED)
+async def write_through_detail(event: str, hanja: Hanja, db: Session) -> None:
+    """상세 정보 캐시를 새 값으로 덮어씀"""
+    key = hanja_detail_key(hanja.traditional)
+    if not await cache.put(key, serialize_hanja(hanja), expire=settings.DETAIL_CACHE_TTL):
+        await cache.delete(key)
+
+
+@invalidation.on(HANJA_SAVED, FAVORITE_TOGGLED)
+async def write_through_favorites(event: str, hanja: Hanja, db: Session) -> None:
+    """즐겨찾기 목록에 영향이 있으면 목록 캐시를 새 값으로 덮어씀"""
+    if event == HANJA_SAVED and not hanja.favorite:
+        return
+    if not await cache.put(FAVORITES_KEY, load_favorites(db), expire=settings.DETAIL_CACHE_TTL):
+        await cache.delete(FAVORITES_KEY)
+
+
+@invalidation.on(HANJA_SAVED)
+async def clear_search_results(event: str, hanja: Hanja, db: Session) -> None:
+    """검색 결과 세대를 올려 이전 검색 결과 캐시를 무효화
+
+    어떤 검색어의 결과 집합이나 순서가 바뀌었는지 미리 알 수 없으므로 모든 검색 결과
+    키가 바뀌도록 세대 카운터만 INCR합니다(O(1)). 이전 세대 키는 TTL로 만료됩니다.
+    (한자 내용은 상세 캐시에서 채우므로 수정만으로는 영향 없음)
+    """
+    await cache.incr(SEARCH_GENERATION_KEY)
@@ -0,0 +1,78 @@
+"""
+프로세스 내 L1 캐시
+
+Redis 앞에 두는 크기 제한 LRU + TTL 캐시입니다. 자주 조회되는 한자 수천 개는
+Redis 왕복과 JSON 역직렬화 없이 메모리에서 바로 응답합니다. 값은 역직렬화된
+객체를 그대로 공유하므로 호출하는 쪽에서 수정하면 안 됩니다.
+"""
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+# 캐시에 없음을 나타내는 표식 (None도 유효한 값일 수 있으므로 별도 객체 사용)
+MISSING = object()
+
+
+class LocalCache:
+    """크기 제한과 만료 시간을 갖는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_size: int = 4096, ttl: float = 300):
+        """
+        Args:
+            max_size: 최대 항목 수 (초과하면 가장 오래 사용하지 않은 항목부터 제거)
+            ttl: 기본 만료 시간(초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        # 키 → (만료 시각, 값). 끝쪽이 최근에 사용한 항목
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        """값을 반환합니다. 없거나 만료되었으면 MISSING을 반환합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장합니다. ttl은 기본 만료 시간을 넘을 수 없습니다."""
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """키를 제거합니다."""
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        """glob 패턴(Redis KEYS/SCAN 형식)과 일치하는 키를 제거합니다."""
+        if not pattern or pattern == "*":
+            self.clear()
+            return
+        with self._lock:
+            for key in [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
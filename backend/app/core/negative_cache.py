@@ -0,0 +1,203 @@
+"""
+없는 항목에 대한 부정(negative) 캐시
+
+두 단계로 "확실히 없는" 조회를 DB나 스크레이퍼까지 보내지 않습니다.
+
+1. 블룸 필터: 시작 시 알려진 값(`hanja.traditional`) 전체로 구축합니다. 필터에
+   없다고 나오면 확실히 없는 값이므로 DB를 조회하지 않습니다. 다른 워커나 스크립트가
+   추가한 값은 무효화 메시지로만 들어오므로, 메시지를 놓쳤을 수 있는 동안(회로가
+   열렸거나 구독이 다시 시작됨)이나 구축한 지 BLOOM_REFRESH_INTERVAL이 지나면
+   "없음" 판정을 쓰지 않고, 백그라운드 작업이 DB에서 다시 구축합니다.
+2. 최근 실패 목록: 필터를 통과했지만(오탐 또는 삭제된 값) 실제로 없었던 값을
+   짧은 TTL로 기억합니다. Redis sorted set(점수 = 기록 시각)에 두어 워커와 실행
+   사이에 공유하고, Redis가 없으면 프로세스 내 캐시만 사용합니다.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from app.core.cache import RedisCache, redis_cache
+from app.core.cache_keys import HANJA_DETAIL_PREFIX
+from app.core.config import settings
+from app.core.local_cache import MISSING, LocalCache
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 블룸 필터 (오탐은 있지만 미탐은 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: 예상 항목 수
+            error_rate: 목표 오탐률
+        """
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, value: str) -> List[int]:
+        # 64비트 해시 두 개로 k개 위치를 만드는 이중 해싱
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, value: str) -> None:
+        with self._lock:
+            for pos in self._positions(value):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class NegativeCache:
+    """블룸 필터와 최근 실패 목록으로 구성된 부정 캐시"""
+
+    def __init__(self, name: str, ttl: int, cache: RedisCache = redis_cache, key_prefix: Optional[str] = None):
+        """
+        Args:
+            name: Redis 키 이름 (`missing:{name}`)
+            ttl: 실패를 기억하는 시간(초)
+            cache: 키 네임스페이스와 연결을 공유할 RedisCache
+            key_prefix: 이 접두사의 캐시 키가 무효화되면 해당 값을 "있을 수 있음"으로 되돌림
+                        (예: 상세 키 접두사 → 다른 워커의 create_hanja 반영)
+        """
+        self.name = name
+        self.ttl = ttl
+        self.cache = cache
+        self.known: Optional[BloomFilter] = None
+        # 필터를 구축한 시각과 그때의 (구독 epoch, 캐시 세대)
+        self.built_at = 0.0
+        self._built_state: Tuple[int, int] = (0, 0)
+        self._refresher: Optional[asyncio.Task] = None
+        self.local = LocalCache(max_size=settings.L1_CACHE_MAX_SIZE, ttl=ttl)
+        self.key_prefix = key_prefix
+        if key_prefix:
+            cache.add_invalidation_listener(self._on_invalidate)
+
+    @property
+    def redis_key(self) -> str:
+        # RedisCache가 세대를 붙이므로 전체 캐시 삭제 시 실패 목록도 함께 비워짐
+        return f"missing:{self.name}"
+
+    def _subscription_state(self) -> Tuple[int, int]:
+        return (self.cache.subscription_epoch, self.cache.generation)
+
+    def load_known(self, values: Iterable[Optional[str]], state: Optional[Tuple[int, int]] = None) -> None:
+        """알려진 값 전체로 블룸 필터를 다시 구축합니다.
+
+        Args:
+            values: 알려진 값 전체
+            state: 값을 읽기 시작할 때의 구독 상태 (없으면 지금 상태)
+        """
+        state = state or self._subscription_state()
+        values = [value for value in values if value]
+        known = BloomFilter(
+            capacity=max(len(values) * 2, 1024),  # 이후 추가될 값을 위한 여유
+            error_rate=settings.BLOOM_FALSE_POSITIVE_RATE
+        )
+        for value in values:
+            known.add(value)
+        self.known = known
+        self.built_at = time.monotonic()
+        self._built_state = state
+        logger.info(f"부정 캐시 '{self.name}' 블룸 필터 구축: {len(values)}개")
+
+    def add_known(self, value: str) -> None:
+        """새로 생긴 값을 블룸 필터에 추가합니다."""
+        if self.known is not None:
+            self.known.add(value)
+        self.local.delete([value])
+
+    @property
+    def trusted(self) -> bool:
+        """블룸 필터의 "없음" 판정을 믿을 수 있는지 여부
+
+        회로가 닫혀 있고, 구축한 뒤 무효화 구독이 다시 시작되거나 전체 캐시 삭제가
+        없었고, BLOOM_REFRESH_INTERVAL이 지나지 않았을 때만 True입니다.
+        """
+        return (
+            self.known is not None
+            and self.cache.enabled
+            and self._built_state == self._subscription_state()
+            and time.monotonic() - self.built_at < settings.BLOOM_REFRESH_INTERVAL
+        )
+
+    def definitely_absent(self, value: str) -> bool:
+        """블룸 필터 기준으로 확실히 없는 값인지 확인합니다.
+
+        필터를 믿을 수 없으면(`trusted`) False이므로 호출하는 쪽이 DB를 조회합니다.
+        """
+        return self.trusted and value not in self.known
+
+    def start_refresh(self, load_values: Callable[[], Iterable[Optional[str]]]) -> None:
+        """필터를 믿을 수 없게 되면 다시 구축하는 백그라운드 작업을 시작합니다.
+
+        Args:
+            load_values: 알려진 값 전체를 반환하는 함수 (스레드에서 실행)
+        """
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop(load_values))
+
+    async def stop_refresh(self) -> None:
+        """다시 구축하는 작업을 취소합니다. (애플리케이션 종료 시 호출)"""
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._refresher = None
+
+    async def _refresh_loop(self, load_values: Callable[[], Iterable[Optional[str]]]) -> None:
+        while True:
+            await asyncio.sleep(settings.BLOOM_CHECK_INTERVAL)
+            # 회로가 열려 있으면 다시 연결될 때 구독이 새로 시작되므로 그때 구축
+            if self.known is None or self.trusted or not self.cache.enabled:
+                continue
+            state = self._subscription_state()
+            try:
+                self.load_known(await asyncio.to_thread(load_values), state)
+            except Exception as e:
+                logger.warning(f"부정 캐시 '{self.name}' 블룸 필터를 다시 구축하지 못했습니다: {e}")
+
+    async def is_missing(self, value: str) -> bool:
+        """최근에 없다고 기록된 값인지 확인합니다."""
+        if self.local.get(value) is not MISSING:
+            return True
+        score = await self.cache.zscore(self.redis_key, value)
+        if score is None or score <= time.time() - self.ttl:
+            return False
+        self.local.set(value, True, ttl=score + self.ttl - time.time())
+        return True
+
+    async def add_missing(self, value: str) -> None:
+        """없는 값으로 기록합니다."""
+        self.local.set(value, True)
+        await self.cache.zadd_recent(self.redis_key, value, self.ttl)
+
+    async def discard(self, value: str) -> None:
+        """값이 생겼을 때 실패 기록을 지웁니다."""
+        self.add_known(value)
+        await self.cache.zrem(self.redis_key, value)
+
+    def _on_invalidate(self, keys: List[str]) -> None:
+        # 다른 워커에서 값이 생기거나 바뀌었을 수 있으므로 필터에 추가하고 실패 기록을 지움
+        for key in keys:
+            if key.startswith(self.key_prefix):
+                self.add_known(key[len(self.key_prefix):])
+
+
+# 한자 상세 조회용 싱글톤 인스턴스
+hanja_negative_cache = NegativeCache("hanja", ttl=settings.NEGATIVE_CACHE_TTL, key_prefix=HANJA_DETAIL_PREFIX)
@@ -0,0 +1,198 @@
+"""
+캐시 값 직렬화
+
+RedisCache가 Redis에 저장하는 값의 인코딩을 담당합니다.
+
+- 코덱: msgpack → orjson → json 순서로 설치된 것 중 가장 빠른 것을 사용합니다.
+  (`CACHE_SERIALIZER`로 고정 가능)
+- 스키마 인코딩: 등록된 스키마(예: HanjaResponse)와 필드가 같은 dict는 키 이름을
+  빼고 값 배열로만 저장합니다. 한자 목록처럼 같은 모양의 dict가 반복될 때 크기가
+  크게 줄어듭니다.
+- 압축: 인코딩 결과가 임계값보다 크면 zlib으로 압축합니다.
+
+저장 형식은 `[헤더 1바이트][본문]`입니다. 헤더의 하위 4비트는 코덱 ID, 0x10 비트는
+압축 여부이므로 설정이 다른 워커가 저장한 값도 읽을 수 있습니다.
+"""
+import json
+import zlib
+from operator import itemgetter
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+# 헤더 비트
+_CODEC_MASK = 0x0F
+_COMPRESSED = 0x10
+
+# 스키마 인코딩 표식: {"__s": 스키마 ID, "o": 값 배열} 또는 {"__s": 스키마 ID, "r": [값 배열, ...]}
+_SCHEMA_TAG = "__s"
+
+
+class SerializationError(ValueError):
+    """값을 인코딩하거나 디코딩할 수 없음"""
+
+
+class Codec:
+    """bytes ↔ 값 변환 코덱"""
+    codec_id = 0
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    codec_id = 1
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    codec_id = 2
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+def available_codecs() -> Dict[str, Codec]:
+    """설치된 코덱 목록 (이름 → 코덱)"""
+    codecs: Dict[str, Codec] = {"json": Codec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    if msgpack is not None:
+        codecs["msgpack"] = MsgpackCodec()
+    return codecs
+
+
+def schema_id(fields: Sequence[str]) -> int:
+    """필드 목록에서 스키마 ID를 만듭니다. 필드가 바뀌면 ID도 바뀌므로 이전 배포의 값과 섞이지 않습니다."""
+    return zlib.crc32(",".join(fields).encode("utf-8"))
+
+
+class CacheSerializer:
+    """코덱, 스키마 인코딩, 압축을 묶은 캐시 직렬화기"""
+
+    def __init__(self, codec: Optional[Codec] = None, compress_threshold: int = 1024, compress_level: int = 1):
+        """
+        Args:
+            codec: 저장에 사용할 코덱 (기본 json)
+            compress_threshold: 이 크기(바이트)를 넘는 값만 압축 (0 이하면 압축 안 함)
+            compress_level: zlib 압축 수준
+        """
+        self.codec = codec or Codec()
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self._decoders: Dict[int, Callable[[bytes], Any]] = {
+            codec.codec_id: codec.loads for codec in available_codecs().values()
+        }
+        # 필드 집합 → (스키마 ID, 필드 집합, 값 추출 함수), 스키마 ID → 필드 순서
+        self._schemas_by_keys: Dict[FrozenSet[str], Tuple[int, FrozenSet[str], Callable[[dict], tuple]]] = {}
+        self._schemas_by_id: Dict[int, Tuple[str, ...]] = {}
+
+    def register_schema(self, fields: Sequence[str]) -> int:
+        """필드 목록이 같은 dict를 값 배열로 저장하도록 스키마를 등록합니다."""
+        fields = tuple(fields)
+        sid = schema_id(fields)
+        keys = frozenset(fields)
+        getter = itemgetter(*fields) if len(fields) > 1 else (lambda item: (item[fields[0]],))
+        self._schemas_by_keys[keys] = (sid, keys, getter)
+        self._schemas_by_id[sid] = fields
+        return sid
+
+    def dumps(self, value: Any) -> bytes:
+        """값을 헤더가 붙은 bytes로 인코딩합니다."""
+        try:
+            body = self.codec.dumps(self._pack(value) if self._schemas_by_keys else value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise SerializationError(str(e)) from e
+        header = self.codec.codec_id
+        if 0 < self.compress_threshold < len(body):
+            body = zlib.compress(body, self.compress_level)
+            header |= _COMPRESSED
+        return bytes((header,)) + body
+
+    def loads(self, data: bytes) -> Any:
+        """`dumps`로 만든 bytes를 디코딩합니다."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data:
+            raise SerializationError("빈 캐시 값입니다")
+        header, body = data[0], data[1:]
+        decoder = self._decoders.get(header & _CODEC_MASK)
+        if decoder is None:
+            raise SerializationError(f"알 수 없는 코덱입니다: {header & _CODEC_MASK}")
+        try:
+            if header & _COMPRESSED:
+                body = zlib.decompress(body)
+            value = decoder(body)
+        except Exception as e:
+            raise SerializationError(str(e)) from e
+        return self._unpack(value) if self._schemas_by_id else value
+
+    def _pack(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            schema = self._schemas_by_keys.get(frozenset(value))
+            if schema is not None:
+                sid, _, getter = schema
+                return {_SCHEMA_TAG: sid, "o": getter(value)}
+            return {key: self._pack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            if value and isinstance(value[0], dict):
+                schema = self._schemas_by_keys.get(frozenset(value[0]))
+                if schema is not None:
+                    sid, keys, getter = schema
+                    # dict_keys와 frozenset 비교는 C 수준에서 처리되므로 행마다 집합을 만들지 않음
+                    if all(type(item) is dict and item.keys() == keys for item in value):
+                        return {_SCHEMA_TAG: sid, "r": list(map(getter, value))}
+            return [self._pack(item) for item in value]
+        return value
+
+    def _unpack(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if _SCHEMA_TAG in value:
+                fields = self._schemas_by_id.get(value[_SCHEMA_TAG])
+                if fields is None:
+                    raise SerializationError(f"알 수 없는 스키마입니다: {value[_SCHEMA_TAG]}")
+                if "o" in value:
+                    return dict(zip(fields, value["o"]))
+                return [dict(zip(fields, row)) for row in value["r"]]
+            return {key: self._unpack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unpack(item) for item in value]
+        return value
+
+
+def make_serializer(name: str = "auto", compress_threshold: int = 1024, compress_level: int = 1) -> CacheSerializer:
+    """이름으로 직렬화기를 만듭니다. "auto"는 설치된 코덱 중 msgpack → orjson → json 순서로 선택합니다.
+
+    Raises:
+        ValueError: 설치되지 않았거나 알 수 없는 코덱 이름
+    """
+    codecs = available_codecs()
+    if name == "auto":
+        codec = codecs.get("msgpack") or codecs.get("orjson") or codecs["json"]
+    elif name in codecs:
+        codec = codecs[name]
+    else:
+        raise ValueError(f"사용할 수 없는 캐시 직렬화 방식입니다: {name}")
+    return CacheSerializer(codec, compress_threshold=compress_threshold, compress_level=compress_level)
@@ -0,0 +1,29 @@
+"""
+NDJSON 스트리밍 응답
+
+`Accept: application/x-ndjson` 요청에 대해 결과 전체를 메모리에 올리지 않고
+서버 측 커서에서 고정 크기 묶음으로 읽어 한 줄에 한 행씩 내보냅니다.
+(직렬화와 묶음 처리는 루트 사전 API와 함께 쓰는 ndjson_stream 모듈에 있음)
+"""
+from typing import Any, Callable, Iterable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from ndjson_stream import NDJSON_MEDIA_TYPE, STREAM_CHUNK_SIZE, accepts_ndjson, iter_ndjson
+
+__all__ = ["NDJSON_MEDIA_TYPE", "STREAM_CHUNK_SIZE", "iter_ndjson", "wants_ndjson", "ndjson_response"]
+
+
+def wants_ndjson(request: Request) -> bool:
+    """요청의 Accept 헤더가 NDJSON을 원하는지 확인합니다."""
+    return accepts_ndjson(request.headers.get("accept", ""))
+
+
+def ndjson_response(
+    rows: Iterable[Any],
+    serialize: Callable[[Any], str],
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> StreamingResponse:
+    """행 이터레이터를 NDJSON 스트리밍 응답으로 감쌉니다."""
+    return StreamingResponse(iter_ndjson(rows, serialize, chunk_size), media_type=NDJSON_MEDIA_TYPE)
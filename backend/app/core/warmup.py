@@ -0,0 +1,153 @@
+"""
+캐시 예열(warm-up)
+
+배포 직후나 `/clear-cache` 뒤에는 모든 상세/검색 요청이 한꺼번에 캐시를 놓칩니다.
+예열 작업은 빈도(`Hanja.frequency`) 상위 N개와 즐겨찾기 전체를 읽어 상세 캐시와
+즐겨찾기 목록 캐시(L1 + Redis)에 파이프라인으로 미리 채웁니다.
+
+- 배치마다 파이프라인 한 번으로 저장하고, 동시에 실행하는 파이프라인 수를 제한합니다.
+- 시간 예산을 넘기면 남은 배치는 건너뛰고 끝냅니다. (준비 상태를 무한정 늦추지 않음)
+- 예열이 끝나기 전까지 `ready`가 False이므로 준비 상태 점검(`/health/ready`)이
+  실패하고, 새 파드가 전체 비용의 트래픽을 받지 않습니다.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.cache import RedisCache, redis_cache
+from app.core.cache_keys import FAVORITES_KEY, hanja_detail_key
+from app.core.config import settings
+from app.core.invalidation import serialize_hanja
+from app.models.hanja import Hanja
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """자주 조회되는 한자를 캐시에 미리 적재하는 작업"""
+
+    def __init__(self, cache: RedisCache = redis_cache):
+        self.cache = cache
+        self.ready = False
+        self.stats: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """예열을 백그라운드에서 시작합니다. 처음 예열이 끝나면 `ready`가 True가 됩니다.
+
+        `/clear-cache` 뒤의 재예열은 준비 상태를 되돌리지 않습니다. (모든 파드가 동시에
+        준비 해제되지 않도록)
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_in_session(session_factory))
+
+    async def stop(self) -> None:
+        """진행 중인 예열을 취소합니다. (애플리케이션 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+    async def _run_in_session(self, session_factory: Callable[[], Session]) -> None:
+        db = session_factory()
+        try:
+            await self.run(db)
+        finally:
+            db.close()
+
+    async def run(
+        self,
+        db: Session,
+        top_n: int = settings.WARMUP_TOP_N,
+        batch_size: int = settings.WARMUP_BATCH_SIZE,
+        concurrency: int = settings.WARMUP_CONCURRENCY,
+        time_budget: float = settings.WARMUP_TIME_BUDGET
+    ) -> Dict[str, Any]:
+        """빈도 상위 한자와 즐겨찾기를 캐시에 적재합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            top_n: 적재할 빈도 상위 한자 수
+            batch_size: 파이프라인 한 번에 저장할 항목 수
+            concurrency: 동시에 실행할 파이프라인 수
+            time_budget: 최대 실행 시간(초)
+
+        Returns:
+            Dict[str, Any]: 적재 결과 (details, favorites, skipped_batches, elapsed)
+        """
+        start = time.perf_counter()
+        deadline = start + time_budget
+        stats: Dict[str, Any] = {"details": 0, "favorites": 0, "skipped_batches": 0, "elapsed": 0.0}
+        try:
+            # 세대 번호가 적용되기 전에 쓰면 다른 워커가 읽지 못하는 키에 저장되므로 연결 확인을 기다림
+            await self.cache.wait_until_probed(timeout=time_budget)
+
+            try:
+                top = (
+                    db.query(Hanja)
+                    .order_by(Hanja.frequency.desc(), Hanja.id)
+                    .limit(top_n)
+                    .all()
+                )
+                favorites = db.query(Hanja).filter(Hanja.favorite == True).order_by(Hanja.id).all()
+            except SQLAlchemyError as e:
+                logger.error(f"캐시 예열 중 데이터베이스 오류: {e}")
+                return stats
+
+            favorite_values = [serialize_hanja(hanja) for hanja in favorites]
+            details: Dict[str, dict] = {
+                hanja_detail_key(hanja.traditional): serialize_hanja(hanja) for hanja in top
+            }
+            for value in favorite_values:
+                details.setdefault(hanja_detail_key(value["traditional"]), value)
+
+            items = list(details.items())
+            batches: List[Dict[str, dict]] = [
+                dict(items[i:i + batch_size]) for i in range(0, len(items), batch_size)
+            ]
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+            async def write_batch(batch: Dict[str, dict]) -> int:
+                async with semaphore:
+                    await self.cache.put_many(batch, expire=settings.DETAIL_CACHE_TTL)
+                    return len(batch)
+
+            tasks = [asyncio.create_task(write_batch(batch)) for batch in batches]
+            tasks.append(asyncio.create_task(
+                self.cache.put(FAVORITES_KEY, favorite_values, expire=settings.DETAIL_CACHE_TTL)
+            ))
+            done, pending = await asyncio.wait(tasks, timeout=max(deadline - time.perf_counter(), 0))
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(f"캐시 예열 시간 예산({time_budget}초) 초과: {len(pending)}개 작업을 건너뜁니다")
+
+            favorites_task = tasks[-1]
+            for task in done:
+                if task.exception() is not None:
+                    logger.error(f"캐시 예열 배치 실패: {task.exception()}")
+                elif task is not favorites_task:
+                    stats["details"] += task.result()
+            if favorites_task in done and favorites_task.exception() is None:
+                stats["favorites"] = len(favorite_values)
+            stats["skipped_batches"] = len(pending)
+            return stats
+        finally:
+            stats["elapsed"] = round(time.perf_counter() - start, 3)
+            self.stats = stats
+            self.ready = True
+            logger.info(f"캐시 예열 완료: {stats}")
+
+
+# 싱글톤 인스턴스 생성
+cache_warmer = CacheWarmer()
@@ -0,0 +1,114 @@
+"""
+SQLite FTS5 전문 검색 인덱스
+
+`hanja` 테이블을 외부 콘텐츠(external content)로 미러링하는 `hanja_fts`
+가상 테이블과 동기화 트리거를 정의합니다. PostgreSQL 등 SQLite가 아닌
+환경에서는 아무 작업도 하지 않으며, 검색은 기존 LIKE 방식으로 대체됩니다.
+"""
+import logging
+import re
+from typing import Optional
+
+from sqlalchemy import DDL, Table, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "hanja_fts"
+
+# 전문 검색 대상 컬럼 (hanja 테이블의 컬럼명과 동일해야 함)
+FTS_COLUMNS = ("traditional", "simplified", "korean_pronunciation", "meaning")
+
+_columns = ", ".join(FTS_COLUMNS)
+_new_values = ", ".join(f"new.{column}" for column in FTS_COLUMNS)
+_old_values = ", ".join(f"old.{column}" for column in FTS_COLUMNS)
+
+# 가상 테이블과 hanja 테이블 변경을 따라가는 트리거
+FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"{_columns}, content='hanja', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON hanja BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON hanja BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON hanja BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+)
+
+# 검색어에서 FTS5 토큰으로 사용할 부분 (한글, 한자, 영숫자)
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def install_fts(table: Table) -> None:
+    """테이블 생성/삭제 시 FTS5 가상 테이블도 함께 생성/삭제되도록 등록합니다.
+
+    Args:
+        table: 미러링할 hanja 테이블
+    """
+    for statement in FTS_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+    )
+
+
+def ensure_fts(engine: Engine) -> bool:
+    """기존 데이터베이스에 FTS5 인덱스가 없으면 생성하고 재구축합니다.
+
+    `scripts/init_db.py` 등 ORM 밖에서 만들어진 데이터베이스를 위한 함수입니다.
+
+    Returns:
+        bool: FTS5 인덱스 사용 가능 여부
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+
+    try:
+        with engine.begin() as conn:
+            tables = {
+                row[0]
+                for row in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'table'")
+                )
+            }
+            if "hanja" not in tables:
+                logger.info("hanja 테이블이 없어 FTS5 인덱스 생성을 건너뜁니다")
+                return False
+
+            for statement in FTS_DDL:
+                conn.execute(text(statement))
+
+            if FTS_TABLE not in tables:
+                conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                logger.info("FTS5 인덱스를 새로 생성하고 재구축했습니다")
+        return True
+    except Exception as e:
+        logger.warning(f"FTS5 인덱스를 준비하지 못했습니다: {e}")
+        return False
+
+
+def is_fts_available(db: Session) -> bool:
+    """현재 세션의 데이터베이스에서 FTS5 검색을 사용할 수 있는지 확인합니다."""
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """사용자 검색어를 FTS5 MATCH 표현식으로 변환합니다.
+
+    각 단어를 따옴표로 감싼 접두사 검색("수"*)으로 만들고 AND로 결합합니다.
+    토큰이 하나도 없으면 None을 반환합니다.
+
+    Example:
+        >>> build_match_query("물 수")
+        '"물"* "수"*'
+    """
+    terms = _TERM_PATTERN.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
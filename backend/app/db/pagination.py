@@ -0,0 +1,141 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET 대신 마지막으로 반환한 행의 (정렬 값, id)를 커서로 넘겨 다음 페이지를
+인덱스 탐색으로 시작하므로, 깊은 페이지도 첫 페이지와 같은 비용이 듭니다.
+NULL 값은 가장 작은 값으로 취급합니다(SQLite 기본 정렬과 동일). NULL 구간은
+별도 쿼리로 이어 붙여 정렬 컬럼 조건이 항상 인덱스를 탈 수 있게 합니다.
+"""
+import base64
+import heapq
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없거나 다른 검색 조건에서 만들어진 커서"""
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """커서 데이터를 URL에 안전한 문자열로 인코딩합니다."""
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 문자열을 디코딩합니다.
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {e}") from e
+    if not isinstance(data, dict):
+        raise InvalidCursorError("잘못된 커서입니다")
+    return data
+
+
+def keyset_paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+    value_of: Callable[[Any], Tuple[Any, int]],
+) -> Tuple[List[Any], Optional[Tuple[Any, int]]]:
+    """(sort_column, id_column) 순서로 한 페이지를 조회합니다.
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬/limit은 적용하지 않은 상태)
+        sort_column: 정렬 컬럼
+        id_column: 동일 값 사이의 순서를 정하는 고유 컬럼
+        descending: 내림차순 여부
+        after: 이전 페이지 마지막 행의 (정렬 값, id). 첫 페이지는 None
+        limit: 페이지 크기
+        value_of: 결과 행에서 (정렬 값, id)를 꺼내는 함수
+
+    Returns:
+        (페이지 행 목록, 다음 페이지용 키 또는 None)
+    """
+    if descending:
+        ordered = query.order_by(sort_column.desc(), id_column.desc())
+        nulls = query.filter(sort_column.is_(None)).order_by(id_column.desc())
+    else:
+        ordered = query.order_by(sort_column.asc(), id_column.asc())
+        nulls = query.filter(sort_column.is_(None)).order_by(id_column.asc())
+
+    def beyond(value, row_id):
+        # 같은 정렬 값 안에서는 id로 이어서 조회
+        if descending:
+            return and_(sort_column <= value, or_(sort_column < value, id_column < row_id))
+        return and_(sort_column >= value, or_(sort_column > value, id_column > row_id))
+
+    id_beyond = (id_column < after[1] if descending else id_column > after[1]) if after else None
+    non_null = ordered.filter(sort_column.isnot(None))
+
+    # 내림차순: 값 있는 구간 → NULL 구간 / 오름차순: NULL 구간 → 값 있는 구간
+    if after is None:
+        stages = [non_null, nulls] if descending else [nulls, non_null]
+    elif after[0] is None:
+        stages = [nulls.filter(id_beyond)] if descending else [nulls.filter(id_beyond), non_null]
+    else:
+        stages = [ordered.filter(beyond(*after)), nulls] if descending else [ordered.filter(beyond(*after))]
+
+    rows: List[Any] = []
+    for stage in stages:
+        rows.extend(stage.limit(limit + 1 - len(rows)).all())
+        if len(rows) > limit:
+            break
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, value_of(rows[-1])
+    return rows, None
+
+
+def keyset_page_ids(
+    row_ids: Iterable[int],
+    value_of: Callable[[int], Any],
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+) -> Tuple[List[int], Optional[Tuple[Any, int]]]:
+    """메모리에 있는 후보 ID 중 커서 다음의 한 페이지를 (정렬 값, id) 순서로 고릅니다.
+
+    keyset_paginate와 같은 순서(NULL은 가장 작은 값)와 커서 키를 사용하므로,
+    DB에는 고른 페이지의 ID만 조회하면 됩니다. (후보가 많아도 바인딩 변수는 페이지 크기만큼)
+    후보 전체를 정렬하지 않고 커서 다음 키 중 limit + 1개만 힙으로 골라, 페이지마다
+    O(n log limit)로 끝납니다.
+
+    Args:
+        row_ids: 후보 ID
+        value_of: ID의 정렬 값을 반환하는 함수
+        descending: 내림차순 여부
+        after: 이전 페이지 마지막 행의 (정렬 값, id). 첫 페이지는 None
+        limit: 페이지 크기
+
+    Returns:
+        (페이지 ID 목록, 다음 페이지용 키 또는 None)
+    """
+    def order_key(value, row_id):
+        return (value is not None, value if value is not None else 0, row_id)
+
+    keys = (order_key(value_of(row_id), row_id) for row_id in set(row_ids))
+    if after is not None:
+        cursor_key = order_key(*after)
+        keys = (key for key in keys if (key < cursor_key if descending else key > cursor_key))
+    # 다음 페이지 유무를 알기 위해 한 개 더 고름
+    select = heapq.nlargest if descending else heapq.nsmallest
+    page = select(limit + 1, keys)
+
+    page_ids = [key[2] for key in page[:limit]]
+    if len(page) > limit:
+        return page_ids, (value_of(page_ids[-1]), page_ids[-1])
+    return page_ids, None
@@ -1,11 +1,46 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import hanja
+from app.core.cache import redis_cache
 from app.core.config import settings
+from app.core import metrics
+from app.core.negative_cache import hanja_negative_cache
+from app.core.warmup import cache_warmer
+from app.db.fts import ensure_fts
+from app.db.session import SessionLocal, engine
+from app.search import known_hanja, rebuild_hanja_indexes
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 실행되는 작업"""
+    # 기존 데이터베이스에 전문 검색 인덱스 준비
+    ensure_fts(engine)
+    # 부분 문자열 검색용 메모리 색인 구축
+    db = SessionLocal()
+    try:
+        rebuild_hanja_indexes(db)
+    finally:
+        db.close()
+    # Redis 연결 확인과 재연결은 백그라운드에서 수행 (시작을 기다리게 하지 않음)
+    redis_cache.start()
+    # 무효화를 놓쳤을 수 있으면 알려진 한자 블룸 필터를 DB에서 다시 구축
+    hanja_negative_cache.start_refresh(lambda: known_hanja(SessionLocal))
+    # 자주 쓰는 한자를 캐시에 미리 적재 (끝날 때까지 준비 상태 점검 실패)
+    if settings.WARMUP_ENABLED:
+        cache_warmer.start(SessionLocal)
+    else:
+        cache_warmer.ready = True
+    yield
+    await cache_warmer.stop()
+    await hanja_negative_cache.stop_refresh()
+    await redis_cache.close()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -21,17 +56,22 @@ app.add_middleware(
 def read_root():
     return {"message": "Welcome to HanjaDB API"}
 
+@app.get("/health/live", include_in_schema=False)
+def liveness():
+    """프로세스 생존 확인"""
+    return {"status": "ok"}
+
+@app.get("/health/ready", include_in_schema=False)
+def readiness():
+    """트래픽을 받을 준비가 되었는지 확인 (캐시 예열이 끝나야 준비 완료)"""
+    if not cache_warmer.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {"status": "ok", "warmup": cache_warmer.stats, "redis": redis_cache.enabled}
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """Prometheus 형식의 캐시 지표 (워커별 값)"""
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
 # 루트 경로에 라우터 등록 (프리픽스 제거)
 app.include_router(hanja.router)
-
-# 캐시 초기화 엔드포인트를 메인 애플리케이션에 추가
-@app.post("/clear-cache")
-async def clear_cache():
-    """캐시를 초기화합니다."""
-    from app.core.cache import redis_cache
-    try:
-        await redis_cache.clear_cache("*")
-        return {"message": "캐시가 초기화되었습니다."}
-    except Exception as e:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
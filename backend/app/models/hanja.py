@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, Index, Text, Boolean
 from sqlalchemy.sql import func
 from app.db.base_class import Base
+from app.db.fts import install_fts
 
 class Hanja(Base):
     __tablename__ = "hanja"
@@ -30,4 +31,7 @@ class Hanja(Base):
         Index('idx_hanja_search', 'traditional', 'simplified', 'korean_pronunciation'),
         # 정렬을 위한 인덱스
         Index('idx_frequency_created', 'frequency', 'created_at'),
-    ) 
\ No newline at end of file
+    ) 
+
+# SQLite 전문 검색(FTS5) 인덱스 연결
+install_fts(Hanja.__table__)
@@ -2,6 +2,6 @@
 데이터 스키마 정의
 """
 
-from app.schemas.hanja import HanjaBase, HanjaCreate, HanjaUpdate, HanjaResponse, HanjaSearchRequest, HanjaListResponse
+from app.schemas.hanja import HanjaBase, HanjaCreate, HanjaUpdate, HanjaResponse, HanjaSearchRequest, HanjaSuggestion, HanjaListResponse
 
-__all__ = ['HanjaBase', 'HanjaCreate', 'HanjaUpdate', 'HanjaResponse', 'HanjaSearchRequest', 'HanjaListResponse'] 
\ No newline at end of file
+__all__ = ['HanjaBase', 'HanjaCreate', 'HanjaUpdate', 'HanjaResponse', 'HanjaSearchRequest', 'HanjaSuggestion', 'HanjaListResponse'] 
\ No newline at end of file
@@ -2,6 +2,10 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 import re
+import unicodedata
+
+# 지원하는 검색 방식
+SEARCH_MODES = ("fulltext", "substring", "choseong")
 
 class HanjaBase(BaseModel):
     traditional: str = Field(..., min_length=1, max_length=5, description="전통 한자")
@@ -67,21 +71,54 @@ class HanjaResponse(HanjaBase):
 class HanjaSearchRequest(BaseModel):
     """한자 검색 요청 스키마"""
     query: str = Field(..., min_length=1, max_length=50, description="검색어")
-    sort_by: Optional[str] = Field("frequency", description="정렬 기준 (frequency, strokes)")
+    sort_by: Optional[str] = Field("frequency", description="정렬 기준 (frequency, strokes, relevance)")
+    mode: Optional[str] = Field("substring", description="검색 방식 (substring, fulltext, choseong)")
+    limit: int = Field(100, ge=1, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(None, max_length=512, description="이전 응답의 next_cursor")
+    
+    @field_validator('query')
+    @classmethod
+    def normalize_query(cls, v):
+        # 같은 검색어가 같은 결과(및 캐시 키)를 갖도록 NFC 정규화 후 앞뒤 공백 제거
+        v = unicodedata.normalize("NFC", v).strip()
+        if not v:
+            raise ValueError("검색어를 입력해주세요")
+        return v
+    
+    @field_validator('mode')
+    @classmethod
+    def validate_mode(cls, v):
+        if v is None:
+            return "substring"
+        if v not in SEARCH_MODES:
+            raise ValueError(f"mode는 {', '.join(SEARCH_MODES)} 중 하나여야 합니다")
+        return v
     
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "query": "수",
-                "sort_by": "frequency"
+                "sort_by": "frequency",
+                "mode": "fulltext"
             }
         }
     )
 
+class HanjaSuggestion(BaseModel):
+    """자동완성 항목 스키마"""
+    text: str = Field(..., description="표시할 표제어 (한자 또는 단어)")
+    type: str = Field(..., description="항목 종류 (hanja, word)")
+    id: int = Field(..., description="원본 행 ID")
+    hanja: Optional[str] = Field(None, description="한자 표기")
+    korean_pronunciation: Optional[str] = Field(None, description="한국어 발음")
+    meaning: Optional[str] = Field(None, description="의미")
+    frequency: int = Field(0, description="검색 빈도")
+
 class HanjaListResponse(BaseModel):
     """한자 목록 응답"""
     total: int = Field(..., description="총 항목 수")
     hanja_list: List[HanjaResponse] = Field(..., description="한자 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -102,7 +139,8 @@ class HanjaListResponse(BaseModel):
                         "created_at": "2023-06-01T12:00:00",
                         "updated_at": "2023-06-01T12:00:00"
                     }
-                ]
+                ],
+                "next_cursor": None
             }
         }
     ) 
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+메모리 기반 검색 색인
+
+n-gram/초성 색인 구현은 루트 사전 앱과 함께 쓰는 hangul_search 패키지에
+있습니다. (저장소 루트의 pyproject.toml로 설치하며 backend/requirements.txt에 포함)
+"""
+from hangul_search import ChoseongIndex, MeaningIndex, decompose_jamo, extract_choseong
+from app.search.suggest import SuggestTrie
+from app.search.indexes import (
+    meaning_index, choseong_index, suggest_trie, rebuild_hanja_indexes, index_hanja, sort_value,
+    known_hanja
+)
+
+__all__ = [
+    'MeaningIndex', 'ChoseongIndex', 'SuggestTrie', 'decompose_jamo', 'extract_choseong',
+    'meaning_index', 'choseong_index', 'suggest_trie', 'rebuild_hanja_indexes', 'index_hanja',
+    'sort_value', 'known_hanja'
+]
@@ -0,0 +1,159 @@
+"""
+한자 검색용 메모리 색인 인스턴스와 갱신 함수
+
+애플리케이션 시작 시 `rebuild_hanja_indexes`로 전체를 구축하고,
+이후 쓰기 경로(`create_hanja` 등)에서는 `index_hanja`로 해당 행만 갱신합니다.
+자동완성 트라이에는 korean_dictionary.db의 `words.word`도 함께 들어갑니다.
+색인 검색 결과를 메모리에서 정렬해 페이지를 나눌 수 있도록 한자별 정렬 값
+(빈도, 획수)도 함께 보관합니다.
+같은 순회에서 부정 캐시의 알려진 한자 블룸 필터도 구축합니다. (이후 필터만 다시
+구축할 때는 `known_hanja`로 traditional 열만 읽음)
+"""
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.negative_cache import hanja_negative_cache
+from app.models.hanja import Hanja
+from hangul_search import ChoseongIndex, MeaningIndex, index_keys
+from app.search.suggest import SuggestTrie
+
+logger = logging.getLogger(__name__)
+
+# 싱글톤 인스턴스 생성
+meaning_index = MeaningIndex()
+choseong_index = ChoseongIndex()
+suggest_trie = SuggestTrie(
+    top_k=settings.SUGGEST_TOP_K,
+    scan_limit=settings.SUGGEST_SCAN_LIMIT,
+    render=lambda row: _suggest_payload(*row)
+)
+
+# 한자 ID → 정렬 값 (frequency, stroke_count)
+_sort_values: Dict[int, Tuple[Optional[int], Optional[int]]] = {}
+SORT_VALUE_FIELDS = ("frequency", "strokes")
+
+
+def sort_value(row_id: int, sort_key: str) -> Optional[int]:
+    """색인 후보의 정렬 값 (sort_key는 "frequency" 또는 "strokes", 모르는 ID는 None)"""
+    values = _sort_values.get(row_id)
+    return values[SORT_VALUE_FIELDS.index(sort_key)] if values else None
+
+# korean_dictionary.db에서 읽어 온 (id, word, origin) 행 (사전 파일은 읽기 전용이므로 한 번만 로드)
+_dictionary_words: Optional[List[Tuple]] = None
+
+
+def _searchable_fields(hanja: Hanja):
+    """부분 문자열 검색 대상 필드 (기존 LIKE 검색과 동일한 컬럼)"""
+    return (hanja.traditional, hanja.simplified, hanja.korean_pronunciation, hanja.meaning)
+
+
+def _suggest_payload(
+    item_type: str, item_id: int, text: str,
+    pronunciation: Optional[str], meaning: Optional[str], frequency: int, hanja: Optional[str] = None
+) -> Dict[str, Any]:
+    """자동완성 트라이에 보관한 튜플을 응답 dict로 바꿉니다."""
+    return {
+        "text": text,
+        "type": item_type,
+        "id": item_id,
+        "hanja": hanja if item_type == "word" else text,
+        "korean_pronunciation": pronunciation,
+        "meaning": meaning,
+        "frequency": frequency,
+    }
+
+
+def _suggest_item(hanja) -> Tuple[Tuple[str, int], List[str], Tuple, int]:
+    """한자 행을 자동완성 항목(키, 색인 텍스트, payload, 빈도)으로 변환합니다.
+
+    payload는 dict 대신 튜플로 보관하고 응답할 때 `_suggest_payload`로 바꿉니다.
+    """
+    frequency = hanja.frequency or 0
+    payload = ("hanja", hanja.id, hanja.traditional, hanja.korean_pronunciation, hanja.meaning, frequency)
+    texts = [hanja.traditional, hanja.simplified] + index_keys(hanja.korean_pronunciation)
+    return ("hanja", hanja.id), texts, payload, frequency
+
+
+def _dictionary_suggest_items(rows: List[Tuple]):
+    """사전 표제어 행을 자동완성 트라이의 고정 항목(색인 텍스트, payload, 빈도)으로 변환합니다."""
+    for word_id, word, origin in rows:
+        yield (word,), ("word", word_id, word, None, None, 0, origin or None), 0
+
+
+def load_dictionary_words(db_path: Optional[str] = None) -> List[Tuple]:
+    """korean_dictionary.db의 표제어를 (id, word, origin) 행으로 읽어 옵니다.
+
+    사전 파일이 없으면 빈 목록을 반환합니다.
+    """
+    global _dictionary_words
+    if _dictionary_words is not None and db_path is None:
+        return _dictionary_words
+
+    path = db_path or settings.KOREAN_DICTIONARY_DB
+    rows = []
+    if path and os.path.exists(path):
+        try:
+            with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+                rows = conn.execute("SELECT id, word, origin FROM words WHERE word != ''").fetchall()
+            logger.info(f"자동완성용 사전 단어 로드: {len(rows)}개")
+        except sqlite3.Error as e:
+            logger.warning(f"사전 단어를 읽지 못했습니다: {path} - {e}")
+
+    if db_path is None:
+        _dictionary_words = rows
+    return rows
+
+
+def rebuild_hanja_indexes(db: Session) -> bool:
+    """hanja 테이블 전체로 메모리 색인을 다시 구축합니다.
+
+    Returns:
+        bool: 구축 성공 여부
+    """
+    try:
+        rows = db.query(
+            Hanja.id, Hanja.traditional, Hanja.simplified,
+            Hanja.korean_pronunciation, Hanja.meaning, Hanja.frequency, Hanja.stroke_count
+        ).all()
+        meaning_index.build((row.id, _searchable_fields(row)) for row in rows)
+        choseong_index.build((row.id, (row.korean_pronunciation,)) for row in rows)
+        _sort_values.clear()
+        _sort_values.update((row.id, (row.frequency, row.stroke_count)) for row in rows)
+        suggest_trie.build(
+            (_suggest_item(row) for row in rows),
+            _dictionary_suggest_items(load_dictionary_words())
+        )
+        # 없는 한자 조회를 DB까지 보내지 않도록 알려진 한자로 블룸 필터 구축
+        hanja_negative_cache.load_known(row.traditional for row in rows)
+        logger.info(f"검색 색인 구축 완료: {len(meaning_index)}개 한자")
+        return True
+    except Exception as e:
+        logger.warning(f"검색 색인을 구축하지 못했습니다: {e}")
+        return False
+
+
+def known_hanja(session_factory: Callable[[], Session]) -> List[str]:
+    """블룸 필터를 다시 구축할 때 쓰는 전체 한자 목록 (별도 세션으로 조회)"""
+    db = session_factory()
+    try:
+        return [row.traditional for row in db.query(Hanja.traditional)]
+    finally:
+        db.close()
+
+
+def index_hanja(hanja: Hanja) -> None:
+    """한자 한 행의 변경 내용을 메모리 색인에 반영합니다."""
+    if meaning_index.loaded:
+        meaning_index.add(hanja.id, _searchable_fields(hanja))
+    if choseong_index.loaded:
+        choseong_index.add(hanja.id, (hanja.korean_pronunciation,))
+    if suggest_trie.loaded:
+        suggest_trie.add(*_suggest_item(hanja))
+    _sort_values[hanja.id] = (hanja.frequency, hanja.stroke_count)
+    hanja_negative_cache.add_known(hanja.traditional)
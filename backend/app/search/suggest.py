@@ -0,0 +1,264 @@
+"""
+자동완성(typeahead)용 접두사 색인
+
+키는 `decompose_jamo`로 분해한 자모열이므로 "ㅅㅜ"처럼 음절을 입력하는 도중에도
+일치합니다. 노드 객체를 만드는 트라이 대신 키를 정렬된 배열 하나에 두어, 같은
+접두사를 가진 키가 연속 구간이 되도록 합니다. (사전 표제어 수십만 개를 워커마다
+올려도 메모리가 키 문자열과 배열 크기 정도로 유지됨)
+
+- 구간에 키가 scan_limit개보다 많은 접두사(주로 짧은 접두사)는 빈도가 가장 높은
+  k개 항목을 미리 계산해 두고 그대로 돌려줍니다.
+- 나머지 접두사는 `bisect`로 구간을 찾아 그 안(최대 scan_limit개)에서 상위 k개를 고릅니다.
+
+항목 payload는 그대로 보관하고 응답할 때 `render`로 dict로 바꾸므로, 호출하는
+쪽은 dict 대신 작은 튜플을 넘겨 항목당 메모리를 줄일 수 있습니다.
+"""
+import heapq
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from hangul_search import decompose_jamo
+
+# 항목 식별자 (예: ("hanja", 1))
+ItemKey = Tuple[str, Hashable]
+
+# 접두사 구간의 끝을 찾을 때 붙이는 가장 큰 문자
+_KEY_END = chr(0x10FFFF)
+
+
+def suggest_key(text: str) -> str:
+    """자동완성 키를 만듭니다. (NFC 정규화, 분절 기호 제거, 자모 분해)"""
+    text = unicodedata.normalize("NFC", text).strip().lower()
+    text = text.replace("-", "").replace("^", "")
+    return decompose_jamo(text)
+
+
+def _item_keys(texts: Iterable[Optional[str]]) -> Tuple[str, ...]:
+    keys = dict.fromkeys(suggest_key(text) for text in texts if text)
+    return tuple(key for key in keys if key)
+
+
+class _SuggestState:
+    """색인 데이터 (build는 새로 만든 뒤 한 번에 바꿈)"""
+    __slots__ = ("keys", "slots", "labels", "scores", "payloads", "tops", "dynamic", "count")
+
+    def __init__(self):
+        # 정렬된 키와 같은 위치의 항목 번호(slot)
+        self.keys: List[str] = []
+        self.slots = array("l")
+        # slot별 표시용 표제어(삭제된 항목은 None), 빈도, payload
+        self.labels: List[Optional[str]] = []
+        self.scores = array("q")
+        self.payloads: List[Any] = []
+        # 구간이 넓은 접두사 → 미리 계산한 상위 k개 slot
+        self.tops: Dict[str, Tuple[int, ...]] = {}
+        # 개별 갱신할 수 있는 항목 → (slot, 키 목록)
+        self.dynamic: Dict[ItemKey, Tuple[int, Tuple[str, ...]]] = {}
+        self.count = 0
+
+
+class SuggestTrie:
+    """정렬된 키 배열과 넓은 접두사별 상위 k개로 구성된 자동완성 색인
+
+    정렬된 배열은 트라이를 깊이 우선으로 펼친 것과 같아서, 트라이 노드의 하위 트리가
+    배열의 연속 구간에 해당합니다. 상위 k개는 구간이 넓은 노드에만 둡니다.
+    """
+
+    def __init__(
+        self,
+        top_k: int = 10,
+        scan_limit: int = 256,
+        render: Optional[Callable[[Any], Dict[str, Any]]] = None
+    ):
+        """
+        Args:
+            top_k: 접두사마다 돌려줄 최대 결과 수
+            scan_limit: 조회할 때 직접 훑을 최대 구간 크기 (더 넓은 접두사는 미리 계산)
+            render: 보관한 payload를 응답 dict로 바꾸는 함수 (없으면 그대로 반환)
+        """
+        self.top_k = top_k
+        self.scan_limit = scan_limit
+        self.render = render
+        self.loaded = False
+        self._state = _SuggestState()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._state.count
+
+    def build(
+        self,
+        items: Iterable[Tuple[ItemKey, Iterable[Optional[str]], Any, int]],
+        static_items: Iterable[Tuple[Iterable[Optional[str]], Any, int]] = ()
+    ) -> None:
+        """전체를 다시 구축합니다.
+
+        Args:
+            items: (항목 키, 색인할 텍스트 목록, payload, 빈도) - `add`/`remove`로 갱신할 수 있는 항목
+            static_items: (색인할 텍스트 목록, payload, 빈도) - 갱신하지 않는 항목
+                          (항목 키를 보관하지 않아 사전 표제어처럼 많은 항목에 사용)
+
+        텍스트 목록의 첫 번째 값이 표시용 표제어이며 같은 빈도일 때 순위에 쓰입니다.
+        """
+        state = _SuggestState()
+        entries: List[Tuple[str, int]] = []
+
+        def append(texts, payload, score) -> Optional[Tuple[int, Tuple[str, ...]]]:
+            texts = list(texts)
+            keys = _item_keys(texts)
+            if not keys:
+                return None
+            slot = len(state.labels)
+            state.labels.append(texts[0] or "")
+            state.scores.append(score or 0)
+            state.payloads.append(payload)
+            state.count += 1
+            entries.extend((key, slot) for key in keys)
+            return slot, keys
+
+        for item_key, texts, payload, score in items:
+            if item_key in state.dynamic:
+                continue
+            added = append(texts, payload, score)
+            if added is not None:
+                state.dynamic[item_key] = added
+        for texts, payload, score in static_items:
+            append(texts, payload, score)
+
+        entries.sort()
+        state.keys = [key for key, _ in entries]
+        state.slots = array("l", (slot for _, slot in entries))
+        del entries
+        if len(state.keys) > self.scan_limit:
+            self._compute_top(state, "", 0, len(state.keys), recurse=True)
+            state.tops.pop("", None)
+
+        with self._lock:
+            self._state = state
+            self.loaded = True
+
+    def add(self, item_key: ItemKey, texts: Iterable[Optional[str]], payload: Any, score: int) -> None:
+        """항목을 추가하거나 갱신합니다. 영향을 받는 접두사의 상위 목록만 다시 계산합니다."""
+        with self._lock:
+            state = self._state
+            if item_key in state.dynamic:
+                self._remove(state, item_key)
+            texts = list(texts)
+            keys = _item_keys(texts)
+            if not keys:
+                return
+            slot = len(state.labels)
+            state.labels.append(texts[0] or "")
+            state.scores.append(score or 0)
+            state.payloads.append(payload)
+            state.dynamic[item_key] = (slot, keys)
+            state.count += 1
+            for key in keys:
+                index = bisect_right(state.keys, key)
+                state.keys.insert(index, key)
+                state.slots.insert(index, slot)
+            rank = self._rank_key(state)
+            for prefix in _prefixes(keys):
+                top = state.tops.get(prefix)
+                if top is None or slot in top:
+                    continue
+                if len(top) < self.top_k or rank(slot) < rank(top[-1]):
+                    state.tops[prefix] = tuple(sorted(top + (slot,), key=rank)[:self.top_k])
+
+    def remove(self, item_key: ItemKey) -> None:
+        """항목을 제거합니다."""
+        with self._lock:
+            self._remove(self._state, item_key)
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """접두사에 대한 자동완성 결과(payload 목록)를 빈도순으로 반환합니다."""
+        key = suggest_key(prefix)
+        if not key:
+            return []
+        with self._lock:
+            state = self._state
+            top = state.tops.get(key)
+            if top is None:
+                lo, hi = self._range(state, key)
+                top = self._top_of(state, set(state.slots[lo:hi]))
+            payloads = [state.payloads[slot] for slot in top[:limit]]
+        if self.render is None:
+            return payloads
+        return [self.render(payload) for payload in payloads]
+
+    @staticmethod
+    def _range(state: _SuggestState, prefix: str, lo: int = 0, hi: Optional[int] = None) -> Tuple[int, int]:
+        """정렬 배열에서 접두사로 시작하는 키의 구간 [lo, hi)"""
+        hi = len(state.keys) if hi is None else hi
+        lo = bisect_left(state.keys, prefix, lo, hi)
+        return lo, bisect_left(state.keys, prefix + _KEY_END, lo, hi)
+
+    @staticmethod
+    def _rank_key(state: _SuggestState) -> Callable[[int], tuple]:
+        labels, scores = state.labels, state.scores
+        # 빈도 내림차순, 짧은 표제어 우선, 가나다순
+        return lambda slot: (-scores[slot], len(labels[slot]), labels[slot])
+
+    def _top_of(self, state: _SuggestState, candidates: Iterable[int]) -> Tuple[int, ...]:
+        return tuple(heapq.nsmallest(self.top_k, set(candidates), key=self._rank_key(state)))
+
+    def _compute_top(self, state: _SuggestState, prefix: str, lo: int, hi: int, recurse: bool) -> Tuple[int, ...]:
+        """구간 [lo, hi)의 상위 k개를 계산해 저장합니다.
+
+        바로 아래 자식 접두사 중 넓은 것은 그 상위 목록만, 좁은 것은 구간 전체를 후보로
+        씁니다. recurse이면 넓은 자식의 상위 목록도 먼저 계산하고(build), 아니면 저장된
+        목록을 씁니다(항목 삭제 후 갱신).
+        """
+        keys, slots = state.keys, state.slots
+        depth = len(prefix)
+        candidates = []
+        i = lo
+        # 접두사와 같은 키는 구간 맨 앞에 있음
+        while i < hi and len(keys[i]) == depth:
+            candidates.append(slots[i])
+            i += 1
+        while i < hi:
+            child = keys[i][:depth + 1]
+            j = bisect_left(keys, child + _KEY_END, i, hi)
+            child_top = None
+            if j - i > self.scan_limit:
+                child_top = self._compute_top(state, child, i, j, True) if recurse else state.tops.get(child)
+            candidates.extend(slots[i:j] if child_top is None else child_top)
+            i = j
+        top = self._top_of(state, candidates)
+        state.tops[prefix] = top
+        return top
+
+    def _remove(self, state: _SuggestState, item_key: ItemKey) -> None:
+        entry = state.dynamic.pop(item_key, None)
+        if entry is None:
+            return
+        slot, keys = entry
+        for key in keys:
+            lo, hi = bisect_left(state.keys, key), bisect_right(state.keys, key)
+            for index in range(lo, hi):
+                if state.slots[index] == slot:
+                    del state.keys[index]
+                    del state.slots[index]
+                    break
+
+        # 이 항목이 들어 있던 상위 목록만 깊은 접두사부터 자식 목록으로 다시 계산
+        for prefix in sorted(_prefixes(keys), key=len, reverse=True):
+            if slot not in state.tops.get(prefix, ()):
+                continue
+            lo, hi = self._range(state, prefix)
+            if hi - lo > self.scan_limit:
+                self._compute_top(state, prefix, lo, hi, recurse=False)
+            else:
+                del state.tops[prefix]
+        state.labels[slot] = None
+        state.payloads[slot] = None
+        state.count -= 1
+
+
+def _prefixes(keys: Iterable[str]) -> List[str]:
+    """키들의 모든 접두사 (중복 제거)"""
+    return list(dict.fromkeys(key[:depth] for key in keys for depth in range(1, len(key) + 1)))
@@ -25,6 +25,10 @@ logger.info(f"데이터베이스 파일 경로: {DB_PATH}")
 # --- 필요한 모듈 임포트 시도 --- 
 try:
     from app.scrapers.scraper_manager import scraper_manager # 싱글톤 인스턴스
+    from app.core.cache import redis_cache
+    from app.core.config import settings
+    from app.core.cache_keys import hanja_detail_key
+    from app.core.negative_cache import NegativeCache, hanja_negative_cache
     # tqdm 임포트 시도 (선택 사항)
     try:
         from tqdm import tqdm
@@ -51,12 +55,24 @@ HANJA_TO_SCRAPE = [
 # --- 설정 --- 
 REQUEST_DELAY = 1 # 각 한자 스크레이핑 사이의 지연 시간 (초). 웹사이트 부하 감소 목적.
 
+# DB에 있는 한자(블룸 필터)와 최근 스크레이핑에 실패한 한자(Redis)를 기억해
+# 확실히 없는 한자는 DB 조회 없이, 최근 실패한 한자는 스크레이핑 없이 건너뜀
+scrape_negative_cache = NegativeCache("scrape", ttl=settings.SCRAPE_NEGATIVE_CACHE_TTL)
+
 def get_db_connection():
     """SQLite 데이터베이스 연결을 반환합니다."""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # 결과를 딕셔너리 형태로 반환
     return conn
 
+def load_known_hanja():
+    """DB에 있는 한자 목록을 반환합니다."""
+    conn = get_db_connection()
+    try:
+        return [row[0] for row in conn.execute("SELECT traditional FROM hanja")]
+    finally:
+        conn.close()
+
 async def populate_single_hanja(character: str, pbar=None):
     """단일 한자를 처리하는 비동기 함수"""
     current_task_desc = f"처리 중: {character}"
@@ -64,18 +80,25 @@ async def populate_single_hanja(character: str, pbar=None):
     else: logger.info(current_task_desc)
 
     try:
-        # 1. 데이터베이스에서 존재 여부 확인
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT * FROM hanja WHERE traditional = ?", (character,))
-            existing_hanja = cursor.fetchone()
-            if existing_hanja:
-                logger.info(f"'{character}' DB에 이미 존재. 건너뜁니다.")
-                if pbar: pbar.update(1)
-                return 'skipped'
-        finally:
-            conn.close()
+        # 1. 데이터베이스에서 존재 여부 확인 (블룸 필터에 없으면 확실히 없으므로 조회 생략)
+        if not scrape_negative_cache.definitely_absent(character):
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT * FROM hanja WHERE traditional = ?", (character,))
+                existing_hanja = cursor.fetchone()
+                if existing_hanja:
+                    logger.info(f"'{character}' DB에 이미 존재. 건너뜁니다.")
+                    if pbar: pbar.update(1)
+                    return 'skipped'
+            finally:
+                conn.close()
+
+        # 최근 스크레이핑에 실패한 한자는 다시 요청하지 않음
+        if await scrape_negative_cache.is_missing(character):
+            logger.info(f"'{character}' 최근 스크레이핑 실패 기록이 있어 건너뜁니다.")
+            if pbar: pbar.update(1)
+            return 'skipped_missing'
 
         # 2. 스크레이핑 실행
         logger.info(f"'{character}' 데이터 스크레이핑 시작...")
@@ -92,6 +115,7 @@ async def populate_single_hanja(character: str, pbar=None):
                 required_fields = ['traditional', 'korean_pronunciation', 'meaning']
                 if not all(field in scraped_data and scraped_data[field] for field in required_fields):
                     logger.warning(f"'{character}' 필수 데이터 부족: {scraped_data}. 저장하지 않습니다.")
+                    await scrape_negative_cache.add_missing(character)
                     if pbar: pbar.update(1)
                     return 'error_validation'
                 
@@ -112,6 +136,11 @@ async def populate_single_hanja(character: str, pbar=None):
                 query = f"INSERT INTO hanja ({field_names}) VALUES ({placeholders})"
                 cursor.execute(query, values)
                 conn.commit()
+                scrape_negative_cache.add_known(character)
+                # HANJA_SAVED 이벤트를 거치지 않는 쓰기이므로 상세 키 무효화를 직접 전파
+                # (실행 중인 API 워커가 블룸 필터에 추가하고 실패 기록을 지움)
+                await hanja_negative_cache.discard(character)
+                await redis_cache.delete(hanja_detail_key(character))
                 
                 logger.info(f"'{character}' DB 저장 성공.")
                 if pbar: pbar.update(1)
@@ -125,6 +154,7 @@ async def populate_single_hanja(character: str, pbar=None):
                 conn.close()
         else:
             logger.warning(f"'{character}' 데이터 수집 실패 또는 유효하지 않음.")
+            await scrape_negative_cache.add_missing(character)
             if pbar: pbar.update(1)
             return 'error_scrape'
 
@@ -162,11 +192,15 @@ async def main():
         logger.error("먼저 init_db.py 스크립트를 실행해 데이터베이스를 초기화해주세요.")
         return
 
+    # 실행 사이에 실패 기록을 공유하기 위해 Redis 연결 (없으면 이번 실행 안에서만 기억)
+    await redis_cache.connect()
+    scrape_negative_cache.load_known(load_known_hanja())
+
     hanja_list = HANJA_TO_SCRAPE
     total_hanja = len(hanja_list)
     logger.info(f"총 {total_hanja}개의 한자를 처리합니다.")
 
-    results_summary = {'added': 0, 'skipped': 0, 'error_validation': 0, 'error_db': 0, 'error_scrape': 0, 'error_unknown': 0}
+    results_summary = {'added': 0, 'skipped': 0, 'skipped_missing': 0, 'error_validation': 0, 'error_db': 0, 'error_scrape': 0, 'error_unknown': 0}
 
     # 배치 크기 설정 (동시에 처리할 최대 한자 수)
     batch_size = 5
@@ -182,13 +216,15 @@ async def main():
         await process_batch(batch, results_summary)
         
         # 배치 처리 결과 중간 보고
-        logger.info(f"현재까지 처리 결과: 추가됨={results_summary['added']}, 건너뜀={results_summary['skipped']}, 오류={results_summary['error_validation'] + results_summary['error_db'] + results_summary['error_scrape'] + results_summary['error_unknown']}")
+        logger.info(f"현재까지 처리 결과: 추가됨={results_summary['added']}, 건너뜀={results_summary['skipped'] + results_summary['skipped_missing']}, 오류={results_summary['error_validation'] + results_summary['error_db'] + results_summary['error_scrape'] + results_summary['error_unknown']}")
+
+    await redis_cache.close()
 
     end_time = time.time()
     duration = end_time - start_time
     logger.info("===== 데이터베이스 채우기 완료 =====")
     logger.info(f"총 처리 시간: {duration:.2f} 초")
-    logger.info(f"처리 결과: 추가됨={results_summary['added']}, 건너뜀={results_summary['skipped']}, 유효성오류={results_summary['error_validation']}, DB오류={results_summary['error_db']}, 스크랩오류={results_summary['error_scrape']}, 기타오류={results_summary['error_unknown']}")
+    logger.info(f"처리 결과: 추가됨={results_summary['added']}, 건너뜀={results_summary['skipped']}, 최근실패로건너뜀={results_summary['skipped_missing']}, 유효성오류={results_summary['error_validation']}, DB오류={results_summary['error_db']}, 스크랩오류={results_summary['error_scrape']}, 기타오류={results_summary['error_unknown']}")
 
 if __name__ == "__main__":
     # Windows에서 asyncio 정책 설정 (필요한 경우)
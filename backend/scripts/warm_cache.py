@@ -0,0 +1,70 @@
+# backend/scripts/warm_cache.py
+"""
+캐시 예열 스크립트
+
+빈도 상위 한자와 즐겨찾기를 Redis 캐시에 미리 적재합니다. 배포 직후나 캐시를
+비운 뒤 서버를 띄우지 않고 예열할 때 사용합니다.
+
+    python scripts/warm_cache.py --top-n 5000 --concurrency 8 --budget 30
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# --- 로깅 설정 ---
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# --- 프로젝트 경로 설정 ---
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+from app.core.cache import redis_cache
+from app.core.config import settings
+from app.core.warmup import cache_warmer
+from app.db.session import SessionLocal
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="빈도 상위 한자와 즐겨찾기를 캐시에 미리 적재합니다.")
+    parser.add_argument("--top-n", type=int, default=settings.WARMUP_TOP_N, help="적재할 빈도 상위 한자 수")
+    parser.add_argument("--batch-size", type=int, default=settings.WARMUP_BATCH_SIZE, help="파이프라인 한 번에 저장할 항목 수")
+    parser.add_argument("--concurrency", type=int, default=settings.WARMUP_CONCURRENCY, help="동시에 실행할 파이프라인 수")
+    parser.add_argument("--budget", type=float, default=settings.WARMUP_TIME_BUDGET, help="최대 실행 시간(초)")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    if not await redis_cache.connect():
+        logger.error("Redis에 연결할 수 없어 예열을 중단합니다.")
+        return 1
+
+    db = SessionLocal()
+    try:
+        stats = await cache_warmer.run(
+            db,
+            top_n=args.top_n,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            time_budget=args.budget
+        )
+    finally:
+        db.close()
+        await redis_cache.close()
+
+    logger.info(
+        f"예열 결과: 상세={stats['details']}개, 즐겨찾기={stats['favorites']}개, "
+        f"건너뛴 작업={stats['skipped_batches']}개, 소요 시간={stats['elapsed']}초"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    # Windows에서 asyncio 정책 설정 (필요한 경우)
+    if sys.platform == "win32" and sys.version_info >= (3, 8):
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    sys.exit(asyncio.run(main()))
@@ -2,6 +2,12 @@ import pytest
 import os
 import logging
 from typing import Generator, Dict, Any
+
+# 애플리케이션 엔진이 실제 데이터베이스 파일을 열지 않도록 테스트 모드 설정
+os.environ.setdefault("TESTING", "true")
+# Redis가 없는 테스트 환경에서 시작 시 연결 재시도로 기다리지 않도록 설정
+os.environ.setdefault("REDIS_CONNECT_RETRIES", "1")
+
 from sqlalchemy import create_engine, Column, String, Integer, MetaData, Table
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -11,6 +17,9 @@ from app.main import app
 from app.db.session import get_db
 from app.db.base_class import Base
 from app.models.hanja import Hanja  # Hanja 모델 불러오기
+from app.search import rebuild_hanja_indexes
+from app.core.cache import redis_cache
+from app.core.negative_cache import hanja_negative_cache
 
 # 테스트용 데이터베이스 URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -78,7 +87,13 @@ def client(db_session):
     db_session.add(test_hanja)
     db_session.commit()
     
+    # 이전 테스트가 프로세스 내 캐시에 남긴 값 제거
+    redis_cache.local.clear()
+    hanja_negative_cache.local.clear()
+    
     with TestClient(app) as test_client:
+        # 시작 시 구축된 메모리 색인을 테스트 데이터베이스 기준으로 다시 구축
+        rebuild_hanja_indexes(db_session)
         yield test_client
     
     # 테스트 후 의존성 주입 원복
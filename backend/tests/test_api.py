@@ -1,7 +1,15 @@
+import asyncio
+import time
 import pytest
 import logging
 from unittest import mock
-from app.core.cache import redis_cache
+from app.core.cache import RedisCache, redis_cache
+from app.core.cache_keys import FAVORITES_KEY, hanja_detail_key
+from app.core.local_cache import MISSING
+from app.core.warmup import CacheWarmer
+from app.models.hanja import Hanja
+from app.search import meaning_index, rebuild_hanja_indexes
+from app.search.suggest import SuggestTrie, suggest_key
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG)
@@ -23,7 +31,11 @@ def mock_redis_cache():
 
 def test_clear_cache(client, mock_redis_cache):
     """캐시 초기화 API 테스트 (Redis 모킹)"""
-    response = client.post("/clear-cache")
+    from app.core.config import settings
+    from app.core.warmup import cache_warmer
+
+    with mock.patch.object(cache_warmer, "start") as mock_start:
+        response = client.post("/clear-cache")
     logger.debug(f"응답: {response.status_code} - {response.text}")
     
     # API 호출 성공 검증
@@ -32,6 +44,8 @@ def test_clear_cache(client, mock_redis_cache):
     
     # Redis 모킹 함수 호출 검증
     mock_redis_cache.assert_called_once()
+    # 비운 캐시를 다시 예열
+    assert mock_start.called == settings.WARMUP_ENABLED
 
 @pytest.mark.parametrize("route,status_code", [
     ("/search", 200),
@@ -83,7 +97,7 @@ def test_create_hanja(client, db_session):
     # 검색 API를 통해 찾을 수 있는지 확인
     search_response = client.post("/search", json={"query": "도"})
     assert search_response.status_code == 200
-    search_results = search_response.json()
+    search_results = search_response.json()["hanja_list"]
     assert len(search_results) >= 1
     assert any(item["traditional"] == "道" for item in search_results)
     
@@ -92,4 +106,320 @@ def test_create_hanja(client, db_session):
     assert details_response.status_code == 200
     details = details_response.json()
     assert details["traditional"] == "道"
-    assert details["meaning"] == "길, 도리, 방법" 
\ No newline at end of file
+    assert details["meaning"] == "길, 도리, 방법" 
+def test_search_fulltext_and_substring_modes(client, db_session):
+    """FTS5 전문 검색과 부분 문자열 검색 방식 테스트"""
+    from app.models.hanja import Hanja
+    db_session.add_all([
+        Hanja(traditional="水", korean_pronunciation="수", meaning="물 수", stroke_count=4, frequency=100),
+        Hanja(traditional="手", korean_pronunciation="수", meaning="손 수", stroke_count=4, frequency=300),
+        Hanja(traditional="秀", korean_pronunciation="수", meaning="빼어날 수", stroke_count=7, frequency=50),
+    ])
+    db_session.commit()
+    rebuild_hanja_indexes(db_session)
+
+    # 기본 방식은 부분 문자열 검색이므로 단어 중간도 찾음
+    response = client.post("/search", json={"query": "어날"})
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["秀"]
+
+    # 전문 검색: 빈도순 정렬 유지
+    response = client.post("/search", json={"query": "수", "mode": "fulltext", "sort_by": "frequency"})
+    assert response.status_code == 200
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["手", "水", "秀"]
+
+    # 전문 검색: 여러 단어는 모두 일치해야 함
+    response = client.post("/search", json={"query": "물 수", "mode": "fulltext", "sort_by": "relevance"})
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["水"]
+
+    # 부분 문자열 검색은 단어 중간도 찾음
+    response = client.post("/search", json={"query": "어날", "mode": "substring"})
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["秀"]
+
+    # 수정 내용이 트리거로 FTS 인덱스에 반영되는지 확인
+    hanja = db_session.query(Hanja).filter(Hanja.traditional == "秀").first()
+    hanja.meaning = "빼어날 수, 이삭"
+    db_session.commit()
+    response = client.post("/search", json={"query": "이삭", "mode": "fulltext"})
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["秀"]
+
+    # 알 수 없는 검색 방식은 거부
+    response = client.post("/search", json={"query": "수", "mode": "unknown"})
+    assert response.status_code == 422
+
+def test_meaning_index_incremental_update(client):
+    """create_hanja 업서트가 n-gram 색인에 바로 반영되는지 테스트"""
+    hanja_data = {
+        "traditional": "山",
+        "korean_pronunciation": "산",
+        "meaning": "메 산",
+        "stroke_count": 3,
+    }
+    response = client.post("/", json=hanja_data)
+    assert response.status_code == 201
+    hanja_id = response.json()["id"]
+    assert meaning_index.search("메 산") == [hanja_id]
+
+    # 뜻이 바뀌면 이전 n-gram에서는 제거되고 새 n-gram에 추가됨
+    response = client.post("/", json={**hanja_data, "meaning": "뫼 산, 산봉우리"})
+    assert response.status_code == 201
+    assert meaning_index.search("메 산") == []
+    assert meaning_index.search("봉우") == [hanja_id]
+
+    response = client.post("/search", json={"query": "산봉우리", "mode": "substring"})
+    assert [item["traditional"] for item in response.json()["hanja_list"]] == ["山"]
+
+def test_search_choseong_mode(client):
+    """초성/자모 접두사 검색 테스트"""
+    for hanja_data in (
+        {"traditional": "水", "korean_pronunciation": "수", "meaning": "물 수", "frequency": 100},
+        {"traditional": "山", "korean_pronunciation": "산", "meaning": "메 산", "frequency": 200},
+        {"traditional": "月", "korean_pronunciation": "월", "meaning": "달 월", "frequency": 300},
+    ):
+        assert client.post("/", json=hanja_data).status_code == 201
+
+    def search(query):
+        response = client.post("/search", json={"query": query, "mode": "choseong"})
+        assert response.status_code == 200
+        return [item["traditional"] for item in response.json()["hanja_list"]]
+
+    assert search("ㅅ") == ["山", "水"]
+    assert search("ㅅㅜ") == ["水"]
+    assert search("사") == ["山"]
+    # 이중모음은 입력 순서대로 분해되어 "우"까지 입력한 상태도 일치
+    assert search("우") == ["月"]
+    assert search("ㅎ") == []
+
+def test_suggest(client):
+    """자동완성 트라이 테스트 (빈도순 상위 결과, 증분 갱신)"""
+    for hanja_data in (
+        {"traditional": "水", "korean_pronunciation": "수", "meaning": "물 수", "frequency": 100},
+        {"traditional": "手", "korean_pronunciation": "수", "meaning": "손 수", "frequency": 300},
+        {"traditional": "山", "korean_pronunciation": "산", "meaning": "메 산", "frequency": 200},
+    ):
+        assert client.post("/", json=hanja_data).status_code == 201
+
+    def suggest(prefix, **params):
+        response = client.get("/suggest", params={"prefix": prefix, **params})
+        assert response.status_code == 200
+        return [item["text"] for item in response.json()]
+
+    assert suggest("ㅅ") == ["手", "山", "水"]
+    assert suggest("ㅅ", limit=2) == ["手", "山"]
+    assert suggest("수") == ["手", "水"]
+    assert suggest("水") == ["水"]
+    assert suggest("ㅎ") == []
+
+    # 빈도가 바뀌면 해당 경로의 상위 목록만 다시 계산됨
+    response = client.post("/", json={"traditional": "水", "korean_pronunciation": "수",
+                                      "meaning": "물 수", "frequency": 500})
+    assert response.status_code == 201
+    assert suggest("ㅅ") == ["水", "手", "山"]
+
+    # 발음이 바뀌면 이전 접두사에서는 사라짐
+    response = client.post("/", json={"traditional": "山", "korean_pronunciation": "뫼",
+                                      "meaning": "메 산", "frequency": 200})
+    assert response.status_code == 201
+    assert suggest("ㅅ") == ["水", "手"]
+    assert suggest("ㅁ") == ["山"]
+
+def test_suggest_trie_precomputed_prefixes():
+    """구간이 넓은 접두사의 미리 계산된 상위 목록이 직접 고른 결과와 같은지 (갱신 후 포함)"""
+    words = ["사과", "사람", "사랑", "산", "산수", "수박", "수", "손", "소리", "사"]
+    trie = SuggestTrie(top_k=3, scan_limit=2)
+    trie.build(
+        [(("hanja", 1), ["水", "수"], "水", 50), (("hanja", 2), ["山", "산"], "山", 5)],
+        (((word,), word, index) for index, word in enumerate(words))
+    )
+    assert trie._state.tops
+
+    def expected(prefix):
+        items = {word: index for index, word in enumerate(words)}
+        items.update(extra)
+        key = suggest_key(prefix)
+        matches = [text for text in items if any(suggest_key(k).startswith(key) for k in aliases.get(text, [text]))]
+        return sorted(matches, key=lambda text: (-items[text], len(text), text))[:3]
+
+    extra = {"水": 50, "山": 5}
+    aliases = {"水": ["水", "수"], "山": ["山", "산"]}
+    prefixes = ["ㅅ", "사", "삭", "산", "ㅅㅗ", "수", "ㅅㅏ"]
+    for prefix in prefixes:
+        assert trie.suggest(prefix) == expected(prefix), prefix
+
+    trie.add(("hanja", 2), ["山", "산"], "山", 100)
+    trie.remove(("hanja", 1))
+    extra = {"山": 100}
+    for prefix in prefixes:
+        assert trie.suggest(prefix) == expected(prefix), prefix
+    assert len(trie) == len(words) + 1
+
+def test_search_keyset_pagination(client, db_session):
+    """키셋 커서 페이지네이션 테스트 (NULL 정렬 값 포함)"""
+    from app.models.hanja import Hanja
+    db_session.add_all([
+        Hanja(traditional=chr(0x4E00 + i), korean_pronunciation="일", meaning=f"한 일 {i}",
+              stroke_count=None if i % 4 == 0 else i % 3 + 1,
+              frequency=None if i % 5 == 0 else i % 3)
+        for i in range(1, 12)
+    ])
+    db_session.commit()
+    rebuild_hanja_indexes(db_session)
+
+    for sort_by in ("frequency", "strokes"):
+        expected = client.post("/search", json={"query": "일", "sort_by": sort_by}).json()
+        assert expected["total"] == 11
+        assert expected["next_cursor"] is None
+
+        # 메모리 색인 후보(substring, choseong)도 SQL 키셋과 같은 순서로 페이지를 나눔
+        for mode, query in (("fulltext", "일"), ("substring", "일"), ("choseong", "ㅇ")):
+            pages, cursor = [], None
+            while True:
+                body = {"query": query, "mode": mode, "sort_by": sort_by, "limit": 3}
+                if cursor:
+                    body["cursor"] = cursor
+                response = client.post("/search", json=body)
+                assert response.status_code == 200
+                data = response.json()
+                assert data["total"] == 11
+                assert len(data["hanja_list"]) <= 3
+                pages.extend(item["id"] for item in data["hanja_list"])
+                cursor = data["next_cursor"]
+                if cursor is None:
+                    break
+            assert pages == [item["id"] for item in expected["hanja_list"]], mode
+
+    # 다른 검색 조건의 커서나 잘못된 커서는 거부
+    first = client.post("/search", json={"query": "일", "limit": 3}).json()
+    response = client.post("/search", json={"query": "한", "limit": 3, "cursor": first["next_cursor"]})
+    assert response.status_code == 400
+    response = client.post("/search", json={"query": "일", "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_favorites_ndjson_stream(client, db_session):
+    """즐겨찾기 목록 NDJSON 스트리밍 테스트"""
+    import json
+    from app.models.hanja import Hanja
+    db_session.add_all([
+        Hanja(traditional=char, korean_pronunciation="수", meaning="뜻", favorite=True)
+        for char in ("水", "山")
+    ])
+    db_session.commit()
+
+    # 본문은 요청 세션이 정리된 뒤에도 전송되므로 요청 세션을 쓰지 않고 전용 세션으로 읽음
+    with mock.patch.object(db_session, "query", side_effect=AssertionError("request session used")):
+        response = client.get("/favorites", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["traditional"] for line in lines] == ["水", "山"]
+
+def test_details_negative_cache(client):
+    """없는 한자는 404이고, 새로 생성하면 바로 조회되는지 테스트
+
+    테스트 환경에는 Redis가 없어 회로가 열리므로 블룸 필터 대신 DB와 최근 실패 목록으로 거름
+    """
+    from app.core.negative_cache import hanja_negative_cache
+
+    assert client.get("/details/試").status_code == 404
+    assert client.get("/details/試").status_code == 404
+
+    response = client.post("/", json={
+        "traditional": "試",
+        "korean_pronunciation": "시",
+        "meaning": "시험할 시",
+        "stroke_count": 13
+    })
+    assert response.status_code == 201
+    assert not hanja_negative_cache.definitely_absent("試")
+    assert client.get("/details/試").json()["meaning"] == "시험할 시"
+
+def test_details_cache_hit_skips_negative_cache(client, monkeypatch):
+    """상세 캐시에 적중하면 부정 캐시(Redis)를 확인하지 않는지 테스트"""
+    from app.core.negative_cache import hanja_negative_cache
+
+    calls = []
+
+    async def is_missing(value):
+        calls.append(value)
+        return False
+
+    monkeypatch.setattr(hanja_negative_cache, "is_missing", is_missing)
+    assert client.get("/details/道").status_code == 200
+    assert client.get("/details/道").status_code == 200
+    assert calls == ["道"]
+
+def test_write_paths_update_cached_entries(client):
+    """쓰기 경로가 상세/즐겨찾기 캐시를 새 값으로 갱신하는지 테스트"""
+    assert client.get("/favorites").json() == []
+    assert client.get("/details/道").json()["meaning"] == "길, 도리, 방법"
+
+    assert client.post("/favorite/道").status_code == 200
+    assert [item["traditional"] for item in client.get("/favorites").json()] == ["道"]
+
+    client.post("/", json={"traditional": "道", "korean_pronunciation": "도", "meaning": "길 도"})
+    assert client.get("/details/道").json()["meaning"] == "길 도"
+    assert client.get("/favorites").json()[0]["meaning"] == "길 도"
+
+def test_search_results_are_cached(client, db_session):
+    """같은 검색은 캐시에서 응답하고, 한자 생성 시 검색 캐시가 비워지는지 테스트"""
+    from app.models.hanja import Hanja
+
+    # 직접 추가한 행도 트리거로 바로 검색되는 전문 검색 방식으로 확인
+    first = client.post("/search", json={"query": "도", "mode": "fulltext"}).json()
+    assert [item["traditional"] for item in first["hanja_list"]] == ["道"]
+
+    # API를 거치지 않은 변경은 캐시된 결과에 보이지 않음 (공백/정규화가 달라도 같은 키)
+    db_session.add(Hanja(traditional="導", korean_pronunciation="도", meaning="인도할 도", frequency=10))
+    db_session.commit()
+    assert client.post("/search", json={"query": " 도 ", "mode": "fulltext"}).json() == first
+
+    client.post("/", json={"traditional": "島", "korean_pronunciation": "도", "meaning": "섬 도", "frequency": 5})
+    refreshed = client.post("/search", json={"query": "도", "mode": "fulltext"}).json()
+    assert [item["traditional"] for item in refreshed["hanja_list"]] == ["道", "導", "島"]
+
+def test_metrics_endpoint(client):
+    """캐시 지표가 Prometheus 형식으로 노출되는지 테스트"""
+    client.get("/details/道")
+    client.get("/details/道")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'hanja_cache_hits_total{namespace="hanja_detail",layer="l1"}' in body
+    assert 'hanja_cache_misses_total{namespace="hanja_detail"}' in body
+    assert "# TYPE hanja_cache_redis_seconds histogram" in body
+    assert "hanja_cache_enabled " in body
+
+
+def test_readiness_after_warmup(client):
+    """시작 시 캐시 예열이 끝나면 준비 상태 점검이 성공하는지 테스트"""
+    assert client.get("/health/live").status_code == 200
+    for _ in range(50):
+        response = client.get("/health/ready")
+        if response.status_code == 200:
+            break
+        time.sleep(0.1)
+    assert response.status_code == 200
+    assert "warmup" in response.json()
+
+
+def test_cache_warmer_loads_top_and_favorites(db_session):
+    """빈도 상위 한자와 즐겨찾기가 상세/즐겨찾기 캐시에 적재되는지 테스트"""
+    db_session.add_all([
+        Hanja(traditional="水", korean_pronunciation="수", meaning="물", frequency=900),
+        Hanja(traditional="山", korean_pronunciation="산", meaning="메", frequency=10, favorite=True),
+        Hanja(traditional="月", korean_pronunciation="월", meaning="달", frequency=5),
+    ])
+    db_session.commit()
+    cache = RedisCache(retry_attempts=1)
+    cache.enabled = False  # L1만 사용
+    warmer = CacheWarmer(cache)
+
+    stats = asyncio.run(warmer.run(db_session, top_n=1, batch_size=1))
+
+    assert warmer.ready
+    assert stats["details"] == 2 and stats["favorites"] == 1
+    assert cache.local.get(hanja_detail_key("水"))["v"]["meaning"] == "물"
+    assert cache.local.get(hanja_detail_key("山")) is not MISSING
+    assert cache.local.get(hanja_detail_key("月")) is MISSING
+    assert [item["traditional"] for item in cache.local.get(FAVORITES_KEY)["v"]] == ["山"]
@@ -0,0 +1,379 @@
+import asyncio
+import pytest
+from app.core.cache import RedisCache
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.core.local_cache import MISSING, LocalCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_cache(server=None) -> RedisCache:
+    cache = RedisCache(retry_attempts=1)
+    cache.redis_client = fakeredis.aioredis.FakeRedis(server=server)
+    return cache
+
+
+@pytest.fixture
+def cache():
+    """fakeredis를 사용하는 RedisCache 픽스처"""
+    cache = make_cache()
+    assert asyncio.run(cache.connect())
+    asyncio.run(cache.close())
+    return cache
+
+
+def test_batch_get_set_delete(cache):
+    """파이프라인 일괄 저장/조회/삭제 테스트"""
+    async def scenario():
+        assert await cache.mset({"hanja:水": {"meaning": "물 수"}, "hanja:山": {"meaning": "메 산"}})
+        assert await cache.mget(["hanja:水", "hanja:山", "hanja:月"]) == [
+            {"meaning": "물 수"}, {"meaning": "메 산"}, None
+        ]
+        assert await cache.delete("hanja:水", "hanja:山") == 2
+        assert await cache.get("hanja:水") is None
+
+    asyncio.run(scenario())
+
+
+def test_disabled_cache_is_noop():
+    """연결에 실패하면 캐시 작업이 모두 무시되는지 테스트"""
+    cache = RedisCache(retry_attempts=1)
+    cache.enabled = False
+
+    async def scenario():
+        assert await cache.get("key") is None
+        assert await cache.set("key", 1) is False
+        assert await cache.mget(["a", "b"]) == [None, None]
+        assert await cache.delete("key") == 0
+
+    asyncio.run(scenario())
+
+
+def test_circuit_breaker_backoff():
+    """연속 실패 시 회로가 열리고, 반열림 확인 실패마다 대기 시간이 두 배가 되는지 테스트"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, base_delay=1.0, max_delay=3.0, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.seconds_until_retry() == 1.0
+    assert not breaker.try_half_open()
+
+    now[0] = 1.0
+    assert breaker.try_half_open() and breaker.state == HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.delay == 2.0
+
+    now[0] = 3.0
+    assert breaker.try_half_open()
+    breaker.record_failure()
+    assert breaker.delay == 3.0  # 상한
+
+    now[0] = 6.0
+    assert breaker.try_half_open()
+    breaker.record_success()
+    assert breaker.closed and breaker.delay == 1.0 and breaker.trips == 1
+
+
+def test_cache_reconnects_after_outage():
+    """Redis가 끊기면 회로가 열려 바로 실패하고, 복구 후 확인에 성공하면 다시 사용하는지 테스트"""
+    server = fakeredis.FakeServer()
+    cache = make_cache(server)
+
+    async def scenario():
+        assert await cache.connect()
+        await cache.set("key", "value")
+        cache.local.clear()
+
+        server.connected = False
+        for _ in range(cache.breaker.failure_threshold):
+            assert await cache.get("other") is None
+        assert not cache.enabled
+
+        # 회로가 열린 동안은 Redis에 가지 않음
+        assert await cache.get("key") is None
+        assert await cache.set("key", "new") is False
+
+        server.connected = True
+        cache.breaker.retry_at = 0
+        assert cache.breaker.try_half_open()
+        assert await cache._probe()
+        assert cache.enabled
+        assert await cache.get("key") == "value"
+        await cache.close()
+
+    asyncio.run(scenario())
+
+
+def test_local_cache_lru_and_ttl():
+    """L1 캐시의 크기 제한(LRU)과 만료 테스트"""
+    local = LocalCache(max_size=2, ttl=60)
+    local.set("a", 1)
+    local.set("b", 2)
+    assert local.get("a") == 1  # a를 최근 사용으로 갱신
+    local.set("c", 3)
+    assert local.get("b") is MISSING
+    assert local.get("a") == 1
+
+    local.set("d", 4, ttl=0)
+    assert local.get("d") is MISSING
+
+
+def test_invalidation_reaches_other_workers():
+    """한 워커의 삭제가 pub/sub으로 다른 워커의 L1까지 지우는지 테스트"""
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker_a, worker_b = make_cache(server), make_cache(server)
+        assert await worker_a.connect() and await worker_b.connect()
+        try:
+            await worker_a.set("hanja:水", {"meaning": "물 수"})
+            assert await worker_b.get("hanja:水") == {"meaning": "물 수"}
+
+            # Redis 값이 사라져도 worker_b는 L1에서 응답
+            await worker_a.redis_client.delete(worker_a._key("hanja:水"))
+            assert await worker_b.get("hanja:水") == {"meaning": "물 수"}
+
+            await asyncio.sleep(0.05)  # 구독 준비 대기
+            await worker_a.delete("hanja:水")
+            for _ in range(50):
+                if worker_b.local.get("hanja:水") is MISSING:
+                    break
+                await asyncio.sleep(0.01)
+            assert await worker_b.get("hanja:水") is None
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    asyncio.run(scenario())
+
+
+def test_external_insert_reaches_bloom_filter():
+    """API 밖의 쓰기(populate_db)가 보낸 상세 키 무효화로 다른 워커의 블룸 필터가 갱신되는지 테스트"""
+    from app.core.cache_keys import HANJA_DETAIL_PREFIX, hanja_detail_key
+    from app.core.negative_cache import NegativeCache
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        api, script = make_cache(server), make_cache(server)
+        api_negative = NegativeCache("hanja", ttl=60, cache=api, key_prefix=HANJA_DETAIL_PREFIX)
+        script_negative = NegativeCache("hanja", ttl=60, cache=script)
+        assert await api.connect() and await script.connect()
+        try:
+            api_negative.load_known(["一"])
+            await api_negative.add_missing("試")
+            assert api_negative.definitely_absent("試")
+
+            await asyncio.sleep(0.05)  # 구독 준비 대기
+            await script_negative.discard("試")
+            await script.delete(hanja_detail_key("試"))
+            for _ in range(50):
+                if not api_negative.definitely_absent("試"):
+                    break
+                await asyncio.sleep(0.01)
+            assert not api_negative.definitely_absent("試")
+            assert not await api_negative.is_missing("試")
+        finally:
+            await api.close()
+            await script.close()
+
+    asyncio.run(scenario())
+
+
+def test_bloom_filter_untrusted_after_missed_invalidations(cache, monkeypatch):
+    """무효화를 놓쳤을 수 있으면 블룸 필터의 "없음"을 쓰지 않고 DB에서 다시 구축하는지 테스트"""
+    from app.core.config import settings
+    from app.core.negative_cache import NegativeCache
+
+    monkeypatch.setattr(settings, "BLOOM_CHECK_INTERVAL", 0.01)
+    negative = NegativeCache("test", ttl=60, cache=cache)
+    negative.load_known(["一"])
+    assert negative.definitely_absent("試")
+
+    # 회로가 열려 있는 동안에는 pub/sub 메시지를 받을 수 없음
+    cache.enabled = False
+    assert not negative.definitely_absent("試")
+    cache.enabled = True
+    assert negative.definitely_absent("試")
+
+    # 구독이 다시 시작되면 그 사이 다른 워커나 스크립트가 추가한 값이 빠졌을 수 있음
+    cache.subscription_epoch += 1
+    assert not negative.definitely_absent("試")
+
+    async def scenario():
+        negative.start_refresh(lambda: ["一", "試"])
+        try:
+            for _ in range(100):
+                if negative.trusted:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await negative.stop_refresh()
+
+    asyncio.run(scenario())
+    assert negative.trusted
+    assert not negative.definitely_absent("試")
+    assert negative.definitely_absent("龘")
+
+    # 오래된 필터도 믿지 않음
+    monkeypatch.setattr(settings, "BLOOM_REFRESH_INTERVAL", 0)
+    assert not negative.definitely_absent("龘")
+
+
+def test_clear_cache_is_namespaced(cache):
+    """패턴 삭제는 SCAN/UNLINK로, 전체 삭제는 세대 증가로 처리되는지 테스트"""
+    async def scenario():
+        await cache.redis_client.set("other-app:key", "keep")
+        await cache.mset({"hanja:水": 1, "hanja:山": 2, "search:abc": 3})
+        cache.local.clear()
+
+        assert await cache.clear_cache("hanja:*")
+        assert await cache.mget(["hanja:水", "hanja:山", "search:abc"]) == [None, None, 3]
+
+        generation = cache.generation
+        assert await cache.clear_cache("*")
+        assert cache.generation == generation + 1
+        assert await cache.get("search:abc") is None
+        # 다른 애플리케이션의 키는 그대로 유지
+        assert await cache.redis_client.get("other-app:key") == b"keep"
+
+    asyncio.run(scenario())
+
+
+def test_search_generation_invalidates_other_workers():
+    """검색 결과 세대 증가가 SCAN 없이 다른 워커의 검색 결과 키까지 바꾸는지 테스트"""
+    from app.core.cache_keys import SEARCH_GENERATION_KEY, search_result_key
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker_a, worker_b = make_cache(server), make_cache(server)
+        assert await worker_a.connect() and await worker_b.connect()
+        try:
+            generation = await worker_b.get_counter(SEARCH_GENERATION_KEY)
+            assert generation == 0
+            old_key = search_result_key("도", "substring", "frequency", 20, None, generation)
+            await worker_b.set(old_key, {"total": 1})
+
+            await asyncio.sleep(0.05)  # 구독 준비 대기
+            assert await worker_a.incr(SEARCH_GENERATION_KEY) == 1
+            for _ in range(50):
+                if worker_b.local.get(SEARCH_GENERATION_KEY) is MISSING:
+                    break
+                await asyncio.sleep(0.01)
+            generation = await worker_b.get_counter(SEARCH_GENERATION_KEY)
+            assert generation == 1
+            assert search_result_key("도", "substring", "frequency", 20, None, generation) != old_key
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_coalesces_concurrent_misses():
+    """같은 키에 대한 동시 요청이 원본을 한 번만 읽는지 테스트 (워커 두 개)"""
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"meaning": "물 수"}
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker_a, worker_b = make_cache(server), make_cache(server)
+        requests = [worker.get_or_load("hanja:水", loader) for worker in (worker_a, worker_b) for _ in range(10)]
+        results = await asyncio.gather(*requests)
+        assert results == [{"meaning": "물 수"}] * 20
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_get_or_load_serves_stale_while_revalidating(cache):
+    """만료된 값은 갱신하는 동안 이전 값으로 응답하는지 테스트"""
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "new"
+
+    async def scenario():
+        await cache._set_entry("hanja:水", "old", expire=-1, stale_ttl=60)
+        results = await asyncio.gather(*[cache.get_or_load("hanja:水", loader) for _ in range(5)])
+        # 갱신을 맡은 요청만 새 값을 받고 나머지는 이전 값을 받음
+        assert sorted(results) == ["new"] + ["old"] * 4
+        assert await cache.get_or_load("hanja:水", loader) == "new"
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_negative_cache_shared_between_workers():
+    """블룸 필터와 Redis 최근 실패 목록 테스트"""
+    from app.core.negative_cache import BloomFilter, NegativeCache
+
+    bloom = BloomFilter(capacity=100)
+    for ch in "一二三":
+        bloom.add(ch)
+    assert all(ch in bloom for ch in "一二三")
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker_a = NegativeCache("test", ttl=60, cache=make_cache(server))
+        worker_b = NegativeCache("test", ttl=60, cache=make_cache(server))
+        worker_a.load_known(["一", "二"])
+        assert worker_a.definitely_absent("龘")
+        assert not worker_a.definitely_absent("一")
+
+        await worker_a.add_missing("二")
+        assert await worker_b.is_missing("二")
+        await worker_a.discard("二")
+        worker_b.local.clear()
+        assert not await worker_b.is_missing("二")
+
+    asyncio.run(scenario())
+
+
+def test_negative_cache_failures_trip_circuit(cache):
+    """부정 캐시의 Redis 호출도 회로 차단기의 실패로 집계되는지 테스트"""
+    import redis
+    from app.core.negative_cache import NegativeCache
+
+    class DownRedis:
+        async def zscore(self, *args):
+            raise redis.ConnectionError("down")
+
+    cache.redis_client = DownRedis()
+    negative = NegativeCache("test", ttl=60, cache=cache)
+
+    async def scenario():
+        for _ in range(cache.breaker.failure_threshold):
+            assert not await negative.is_missing("一")
+        assert not cache.enabled
+        # 회로가 열린 뒤에는 Redis를 호출하지 않음
+        cache.redis_client = None
+        assert not await negative.is_missing("一")
+
+    asyncio.run(scenario())
+
+
+def test_serializer_schema_and_compression():
+    """스키마 인코딩과 압축을 거친 값이 그대로 복원되는지 테스트"""
+    from app.core.serializers import Codec, CacheSerializer, available_codecs
+    from app.schemas.hanja import HanjaResponse
+
+    rows = [
+        HanjaResponse(id=i, traditional="水", korean_pronunciation="수", meaning=f"물 {i}").model_dump(mode="json")
+        for i in range(50)
+    ]
+    value = {"v": rows, "t": 1.5}
+    for codec in available_codecs().values():
+        serializer = CacheSerializer(codec, compress_threshold=256)
+        serializer.register_schema(HanjaResponse.model_fields)
+        data = serializer.dumps(value)
+        assert serializer.loads(data) == value
+        assert len(data) < len(CacheSerializer(codec, compress_threshold=0).dumps(value))
+
+    # 다른 코덱으로 저장한 값도 헤더를 보고 읽음
+    assert CacheSerializer(list(available_codecs().values())[-1]).loads(CacheSerializer(Codec()).dumps([1, "a"])) == [1, "a"]
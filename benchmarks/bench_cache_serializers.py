@@ -0,0 +1,87 @@
+"""
+캐시 직렬화 벤치마크: json.dumps vs CacheSerializer
+
+RedisCache가 저장하는 한자 응답 목록(즐겨찾기/검색 결과 크기)을 기존 방식(json 문자열)과
+코덱·스키마 인코딩·압축 조합별로 인코딩해 저장 크기와 인코딩/디코딩 시간을 비교합니다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_cache_serializers.py
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.serializers import CacheSerializer, available_codecs  # noqa: E402
+from app.schemas.hanja import HanjaResponse  # noqa: E402
+
+REPEAT = 200
+
+
+CHARS = "道水山人日月火木金土天地心手口目耳足力大小中上下東西南北春夏秋冬"
+READINGS = "도수산인일월화목금토천지심수구목이족력대소중상하동서남북춘하추동"
+MEANINGS = ["길, 도리", "물", "메, 산", "사람", "날, 해", "달", "불", "나무", "쇠, 금", "흙"]
+
+
+def sample_hanja(count):
+    """상세 응답과 같은 모양의 한자 dict 목록 (필드 값은 행마다 다름)"""
+    return [
+        HanjaResponse(
+            id=i + 1,
+            traditional=CHARS[i % len(CHARS)],
+            simplified=CHARS[(i * 7) % len(CHARS)],
+            korean_pronunciation=READINGS[i % len(READINGS)],
+            chinese_pronunciation=f"pin{i % 97}",
+            radical=CHARS[(i * 3) % len(CHARS)],
+            stroke_count=i % 30 + 1,
+            meaning=f"{MEANINGS[i % len(MEANINGS)]} {READINGS[i % len(READINGS)]} ({i})",
+            examples=f"{CHARS[i % len(CHARS)]}{CHARS[(i + 5) % len(CHARS)]}: 예문 {i * 31 % 1000}",
+            frequency=(i * 7919) % 5000,
+            created_at=f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00",
+        ).model_dump(mode="json")
+        for i in range(count)
+    ]
+
+
+def measure(dumps, loads, value):
+    encode, decode = [], []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        data = dumps(value)
+        encode.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        loads(data)
+        decode.append(time.perf_counter() - start)
+    return len(data), statistics.median(encode) * 1e6, statistics.median(decode) * 1e6
+
+
+def variants():
+    # 변경 전: json.dumps 문자열 (decode_responses=True로 UTF-8 인코딩/디코딩 포함)
+    yield "json (기존)", lambda v: json.dumps(v).encode("utf-8"), lambda d: json.loads(d.decode("utf-8"))
+    for name, codec in available_codecs().items():
+        plain = CacheSerializer(codec, compress_threshold=0)
+        yield name, plain.dumps, plain.loads
+        schema = CacheSerializer(codec, compress_threshold=0)
+        schema.register_schema(HanjaResponse.model_fields)
+        yield f"{name}+스키마", schema.dumps, schema.loads
+        packed = CacheSerializer(codec, compress_threshold=1024)
+        packed.register_schema(HanjaResponse.model_fields)
+        yield f"{name}+스키마+zlib", packed.dumps, packed.loads
+
+
+def main():
+    for count in (1, 20, 100):
+        value = sample_hanja(count) if count > 1 else sample_hanja(1)[0]
+        print(f"\n한자 {count}개")
+        print(f"{'방식':<20} | {'크기 (B)':>9} | {'인코딩 (µs)':>11} | {'디코딩 (µs)':>11}")
+        print("-" * 62)
+        for name, dumps, loads in variants():
+            size, encode, decode = measure(dumps, loads, value)
+            print(f"{name:<20} | {size:>9} | {encode:>11.1f} | {decode:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+관련 단어 조회 벤치마크: N+1 쿼리 vs 단일 쿼리
+
+korean_dictionary_api.search_word가 일치한 단어마다 related_words를 따로
+조회하던 방식과 fetch_words_with_related의 단일 쿼리 방식을 일치 행 수별로 비교합니다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_related_words.py
+"""
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from korean_dictionary_api import fetch_words_with_related  # noqa: E402
+
+RELATED_PER_WORD = 3
+REPEAT = 5
+
+
+def create_sample_db(path, matched_rows):
+    """일치할 단어 matched_rows개와 일치하지 않는 단어 같은 수를 가진 사전을 만듭니다."""
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE words (id INTEGER PRIMARY KEY AUTOINCREMENT, word TEXT NOT NULL, meaning TEXT);
+        CREATE TABLE related_words (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, word_id INTEGER, related_word TEXT, relation_type TEXT
+        );
+        CREATE INDEX idx_word ON words (word);
+        CREATE INDEX idx_related_word ON related_words (word_id);
+    ''')
+    words = [(f'사랑{i}', '뜻') for i in range(matched_rows)] + [(f'미움{i}', '뜻') for i in range(matched_rows)]
+    conn.executemany('INSERT INTO words (word, meaning) VALUES (?, ?)', words)
+    conn.executemany(
+        'INSERT INTO related_words (word_id, related_word, relation_type) VALUES (?, ?, ?)',
+        [(word_id, f'관련{word_id}-{n}', '비슷한말')
+         for word_id in range(1, len(words) + 1) for n in range(RELATED_PER_WORD)]
+    )
+    conn.commit()
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def fetch_n_plus_one(conn, word):
+    """변경 전 방식: 단어 조회 후 단어마다 관련 단어 쿼리를 실행"""
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM words WHERE word LIKE ?', (f'%{word}%',))
+    words = [dict(row) for row in cursor.fetchall()]
+    for word_data in words:
+        cursor.execute(
+            'SELECT related_word, relation_type FROM related_words WHERE word_id = ?',
+            (word_data['id'],)
+        )
+        word_data['related_words'] = [dict(row) for row in cursor.fetchall()]
+    return words
+
+
+def measure(func, conn, word):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func(conn, word)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, len(result)
+
+
+def main():
+    print(f"{'일치 행 수':>10} | {'N+1 (ms)':>10} | {'단일 쿼리 (ms)':>14} | {'배율':>6}")
+    print('-' * 52)
+    for matched_rows in (10, 100, 1000, 10000, 50000):
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = create_sample_db(os.path.join(tmp, 'bench.db'), matched_rows)
+            try:
+                before, count_before = measure(fetch_n_plus_one, conn, '사랑')
+                after, count_after = measure(fetch_words_with_related, conn, '사랑')
+                assert count_before == count_after == matched_rows
+            finally:
+                conn.close()
+        print(f"{matched_rows:>10} | {before:>10.2f} | {after:>14.2f} | {before / after:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
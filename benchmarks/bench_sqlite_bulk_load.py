@@ -0,0 +1,113 @@
+"""
+SQLite 적재 벤치마크: 행마다 execute vs 배치 커밋 vs 대량 적재 모드
+
+같은 단어 행을 인덱스가 있는 words 테이블에 세 가지 방식으로 넣고 초당 행 수를
+비교합니다. XML 파싱 비용을 빼기 위해 행은 미리 만들어 둡니다.
+
+- 행마다 execute: 변경 전 app.import_xml_to_db (기본 PRAGMA, 인덱스 유지)
+- 배치 커밋: executemany + 배치마다 커밋 (증분 임포트 경로)
+- 대량 적재: sqlite_bulk.bulk_load (인덱스 보류, 저널/동기화 끔, 하나의 트랜잭션)
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_sqlite_bulk_load.py [--rows 200000] [--xml data/raw/파일.xml]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dictionary_xml import IMPORT_BATCH_SIZE, batched, iter_items  # noqa: E402
+from sqlite_bulk import bulk_load  # noqa: E402
+
+SCHEMA = '''
+    CREATE TABLE words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        target_code TEXT, word TEXT, word_unit TEXT, word_type TEXT, pronunciation TEXT,
+        origin TEXT, pos_info TEXT, study_info TEXT, lexical_info TEXT, conju_info TEXT,
+        example TEXT, meaning TEXT
+    );
+    CREATE UNIQUE INDEX idx_words_target_code ON words (target_code);
+    CREATE INDEX idx_word ON words (word);
+    CREATE INDEX idx_origin ON words (origin);
+'''
+
+INSERT_SQL = '''
+    INSERT INTO words (
+        target_code, word, word_unit, word_type, pronunciation,
+        origin, pos_info, study_info, lexical_info, conju_info,
+        example, meaning
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def synthetic_rows(count):
+    """words 테이블 모양의 임의 행 (표제어 순서가 섞이도록 target_code와 다르게 생성)"""
+    return [
+        (str(383000 + i), f'단어{(i * 7919) % count}', '단어', '고유어', f'발음{i}',
+         f'漢字{i % 5000}', '명사', '', '', '', f'예문 {i}', f'품사: 명사 | 뜻 {i}')
+        for i in range(count)
+    ]
+
+
+def xml_rows(xml_file):
+    """실제 사전 XML에서 만든 행 (app.word_row와 같은 변환)"""
+    from app import word_row
+    return [row for row in (word_row(item) for item in iter_items(xml_file)) if row is not None]
+
+
+def load_row_by_row(conn, rows):
+    cursor = conn.cursor()
+    for row in rows:
+        cursor.execute(INSERT_SQL, row)
+    conn.commit()
+
+
+def load_batched(conn, rows):
+    for batch in batched(rows, IMPORT_BATCH_SIZE):
+        conn.executemany(INSERT_SQL, batch)
+        conn.commit()
+
+
+def load_bulk(conn, rows):
+    with bulk_load(conn, ['words']):
+        for batch in batched(rows, IMPORT_BATCH_SIZE):
+            conn.executemany(INSERT_SQL, batch)
+
+
+def measure(loader, rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'bench.db'))
+        try:
+            conn.executescript(SCHEMA)
+            start = time.perf_counter()
+            loader(conn, rows)
+            elapsed = time.perf_counter() - start
+            assert conn.execute('SELECT COUNT(*) FROM words').fetchone()[0] == len(rows)
+        finally:
+            conn.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000, help="임의 행 수 (--xml이 없을 때)")
+    parser.add_argument('--xml', help="행을 만들 사전 XML 파일")
+    args = parser.parse_args()
+
+    rows = xml_rows(args.xml) if args.xml else synthetic_rows(args.rows)
+    print(f"행 수: {len(rows)}")
+    print(f"{'방식':<16} | {'시간 (s)':>9} | {'행/초':>10} | {'배율':>6}")
+    print('-' * 50)
+    baseline = None
+    for name, loader in (('행마다 execute', load_row_by_row), ('배치 커밋', load_batched), ('대량 적재', load_bulk)):
+        elapsed = measure(loader, rows)
+        baseline = baseline or elapsed
+        print(f"{name:<16} | {elapsed:>9.2f} | {len(rows) / elapsed:>10.0f} | {baseline / elapsed:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+"""
+사전 XML item 필드 추출 벤치마크: 필드마다 find vs 한 번의 순회
+
+변경 전 추출 함수(필드마다 `find`를 두 번 호출, 한자 정규식을 호출마다 다시 찾음)와
+dictionary_xml.extract_record 기반의 현재 함수를 같은 item에 실행해 결과가 같은지
+확인하고 item당 시간을 비교합니다. 파싱 시간을 빼기 위해 item은 미리 읽어 둡니다.
+
+실행 (저장소 루트에서):
+    python benchmarks/bench_xml_extract.py [data/raw/파일.xml ...]
+"""
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+import create_korean_dictionary  # noqa: E402
+import import_hanja  # noqa: E402
+
+REPEAT = 5
+
+
+def legacy_app_word_row(item):
+    """변경 전 app.import_xml_to_db의 행 변환"""
+    word_info = item.find('word_info')
+    if word_info is None:
+        return None
+    word_data = {
+        'target_code': item.find('target_code').text if item.find('target_code') is not None else None,
+        'word': word_info.find('word').text if word_info.find('word') is not None else '',
+        'word_unit': word_info.find('word_unit').text if word_info.find('word_unit') is not None else '',
+        'word_type': word_info.find('word_type').text if word_info.find('word_type') is not None else '',
+        'pronunciation': word_info.find('pronunciation_info').text if word_info.find('pronunciation_info') is not None else '',
+        'origin': word_info.find('origin').text if word_info.find('origin') is not None else '',
+        'pos_info': word_info.find('pos_info').text if word_info.find('pos_info') is not None else '',
+        'study_info': word_info.find('study_info').text if word_info.find('study_info') is not None else '',
+        'lexical_info': word_info.find('lexical_info').text if word_info.find('lexical_info') is not None else '',
+        'conju_info': word_info.find('conju_info').text if word_info.find('conju_info') is not None else '',
+        'example': word_info.find('example').text if word_info.find('example') is not None else ''
+    }
+    meaning_parts = []
+    if word_data['pos_info']:
+        meaning_parts.append(f"품사: {word_data['pos_info']}")
+    if word_data['study_info']:
+        meaning_parts.append(f"학습 정보: {word_data['study_info']}")
+    if word_data['lexical_info']:
+        meaning_parts.append(f"어휘 정보: {word_data['lexical_info']}")
+    if word_data['conju_info']:
+        meaning_parts.append(f"활용 정보: {word_data['conju_info']}")
+    word_data['meaning'] = ' | '.join(meaning_parts) if meaning_parts else ''
+    return tuple(word_data.values())
+
+
+def legacy_dictionary_word_row(item):
+    """변경 전 create_korean_dictionary.import_data_from_xml의 행 변환"""
+    target_code = _text_or_empty(item, 'target_code')
+    word_info = item.find('word_info')
+    if word_info is None:
+        return None
+    word = _text_or_empty(word_info, 'word')
+    if not word:
+        return None
+    meanings = []
+    for tag, label in (('pos_info', '품사'), ('study_info', '학습 정보'),
+                       ('lexical_info', '어휘 정보'), ('conju_info', '활용 정보')):
+        found = word_info.find(tag)
+        if found is not None and found.text:
+            meanings.append(f"{label}: {found.text.strip()}")
+    return (
+        target_code, word, _text_or_empty(word_info, 'word_unit'), _text_or_empty(word_info, 'word_type'),
+        _text_or_empty(word_info, 'pronunciation_info'), _text_or_empty(word_info, 'origin'),
+        _text_or_empty(word_info, 'pos_info'), _text_or_empty(word_info, 'study_info'),
+        ' | '.join(meanings) if meanings else '', _text_or_empty(word_info, 'example')
+    )
+
+
+def _text_or_empty(element, path):
+    found = element.find(path)
+    return found.text.strip() if found is not None and found.text is not None else ''
+
+
+def legacy_extract_hanja_from_text(text):
+    """변경 전 import_hanja.extract_hanja_from_text (중복 패턴 4개를 호출마다 검색)"""
+    if not text:
+        return None
+    patterns = [
+        r'[가-힣]+\(([一-龥]+)\)',
+        r'[가-힣]+[（(]([一-龥]+)[)）]',
+        r'[가-힣]+[（(]([一-龥]+)[)）]',
+        r'[가-힣]+[（(]([一-龥]+)[)）]',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1)
+    match = re.search(r'[一-龥]+', text)
+    if match:
+        return match.group(0)
+    return None
+
+
+def _text(element, path):
+    found = element.find(path)
+    return found.text.strip() if found is not None and found.text else ''
+
+
+def legacy_hanja_parse_item(item):
+    """변경 전 import_hanja.parse_xml_file의 item 처리 (findall 네 번)"""
+    word_info = item.find('word_info')
+    if word_info is None:
+        return None
+    word_text = _text(word_info, 'word')
+    if not word_text:
+        return None
+    hanja = legacy_extract_hanja_from_text(word_text)
+    if not hanja:
+        for child in word_info:
+            if child.text:
+                hanja = legacy_extract_hanja_from_text(child.text)
+                if hanja:
+                    break
+    if not hanja:
+        return None
+    meanings = [d for d in (_text(s, 'definition') for s in word_info.findall('.//sense_info')) if d]
+    meaning = '; '.join(meanings) if meanings else ''
+    reading = ''
+    for pron_info in word_info.findall('.//pronunciation_info/pronunciation'):
+        if pron_info.text:
+            reading = pron_info.text.strip()
+            break
+    radical = ''
+    stroke_count = 0
+    for info in word_info.findall('.//info'):
+        info_text = info.text if info.text else ''
+        if '부수' in info_text:
+            radical = info_text.split('：')[-1].strip()
+            break
+        elif '획수' in info_text:
+            try:
+                stroke_count = int(info_text.split('：')[-1].strip())
+                break
+            except ValueError:
+                pass
+    words = []
+    for sense_info in word_info.findall('.//sense_info'):
+        for example in sense_info.findall('.//example_info/example'):
+            if example.text:
+                example_hanja = legacy_extract_hanja_from_text(example.text)
+                if example_hanja:
+                    words.append((hanja, example_hanja, meaning))
+    return (hanja, meaning, reading, radical, stroke_count), words
+
+
+def hanja_parse_item(item):
+    """현재 import_hanja.parse_item에서 변경 전과 같은 필드만 남김 (target_code, 단어 제외)"""
+    parsed = import_hanja.parse_item(item)
+    if parsed is None:
+        return None
+    entry, words = parsed
+    return entry[2:], [(entry[2],) + word[1:] for word in words]
+
+
+def load_items(paths):
+    items = []
+    for path in paths:
+        items.extend(ET.parse(path).getroot().findall('item'))
+    return items
+
+
+def measure(func, items):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) / len(items) * 1e6
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob('data/raw/*.xml'))
+    items = load_items(paths)
+    print(f"item 수: {len(items)}")
+    print(f"{'추출 함수':<28} | {'변경 전 (µs)':>12} | {'변경 후 (µs)':>12} | {'배율':>6}")
+    print('-' * 68)
+    cases = (
+        ('app.word_row', legacy_app_word_row, app.word_row),
+        ('create_korean_dictionary', legacy_dictionary_word_row, create_korean_dictionary.word_row),
+        ('import_hanja.parse_item', legacy_hanja_parse_item, hanja_parse_item),
+    )
+    for name, before_func, after_func in cases:
+        for item in items:
+            assert before_func(item) == after_func(item), name
+        before = measure(before_func, items)
+        after = measure(after_func, items)
+        print(f"{name:<28} | {before:>12.2f} | {after:>12.2f} | {before / after:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,53 +1,81 @@
-import xml.etree.ElementTree as ET
+"""
+사전 XML 스키마 프로파일러
+
+각 XML 파일의 앞쪽 item N개만 스트리밍으로 읽어 태그 경로별 등장 횟수, 필드
+포함률(해당 경로가 한 번 이상 나온 item 비율)과 예시 값을 출력합니다. 임포트
+스크립트는 구조를 기록하지 않으므로 새 덤프의 구조를 확인할 때 이 스크립트를
+사용합니다.
+
+    python check_xml.py                          # data/raw/*.xml, 파일마다 item 1000개
+    python check_xml.py --sample 5000 data/raw/1435291_436134.xml
+"""
+import argparse
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-import logging
 
-logging.basicConfig(level=logging.INFO)
+from dictionary_xml import iter_items
+
+DEFAULT_SAMPLE_SIZE = 1000
+# 예시 값 최대 길이
+EXAMPLE_WIDTH = 40
+
+
+def profile_items(items):
+    """item 목록의 태그 경로별 (등장 횟수, 포함 item 수, 예시 값)과 item 수를 구합니다."""
+    occurrences = Counter()
+    coverage = Counter()
+    examples = {}
+    item_count = 0
+    for item in items:
+        item_count += 1
+        seen = set()
+        stack = [(child, child.tag) for child in item]
+        while stack:
+            elem, path = stack.pop()
+            occurrences[path] += 1
+            seen.add(path)
+            text = elem.text.strip() if elem.text else ''
+            if text and path not in examples:
+                examples[path] = text
+            stack.extend((child, f"{path}/{child.tag}") for child in elem)
+        coverage.update(seen)
+    return occurrences, coverage, examples, item_count
+
+
+def profile_file(xml_file, sample_size):
+    """파일 앞쪽 item sample_size개를 프로파일링해 출력합니다."""
+    occurrences, coverage, examples, item_count = profile_items(islice(iter_items(xml_file), sample_size))
 
-def check_xml_structure():
-    data_dir = Path('data/raw')
-    xml_files = list(data_dir.glob('*.xml'))
-    
+    print(f"\n파일: {xml_file.name} (item {item_count}개 표본)")
+    if not item_count:
+        print("item을 찾을 수 없습니다.")
+        return
+    print(f"{'태그 경로':<60} {'등장':>8} {'포함률':>7}  예시 값")
+    print('-' * 120)
+    for path in sorted(occurrences):
+        example = examples.get(path, '').replace('\n', ' ')[:EXAMPLE_WIDTH]
+        print(f"{path:<60} {occurrences[path]:>8} {coverage[path] / item_count:>7.1%}  {example}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사전 XML 파일의 태그 빈도와 필드 포함률을 표본으로 확인합니다.")
+    parser.add_argument('files', nargs='*', type=Path, help="XML 파일 (기본: data/raw/*.xml)")
+    parser.add_argument('--sample', type=int, default=DEFAULT_SAMPLE_SIZE, help="파일마다 읽을 item 수")
+    args = parser.parse_args()
+
+    xml_files = args.files or sorted(Path('data/raw').glob('*.xml'))
     if not xml_files:
         print("XML 파일을 찾을 수 없습니다.")
         return
-        
+
     print(f"\n총 XML 파일 수: {len(xml_files)}")
-    
     for xml_file in xml_files:
         try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            
-            # 루트 태그 확인
-            print(f"\n파일: {xml_file.name}")
-            print(f"루트 태그: {root.tag}")
-            
-            # 전체 항목 수 확인
-            items = root.findall('.//item')
-            print(f"전체 항목 수: {len(items)}")
-            
-            # 첫 번째 항목의 자세한 구조 확인
-            if items:
-                first_item = items[0]
-                print("\n첫 번째 항목의 상세 구조:")
-                
-                # target_code 확인
-                target_code = first_item.find('target_code')
-                if target_code is not None:
-                    print(f"대상 코드: {target_code.text}")
-                
-                # word_info 확인
-                word_info = first_item.find('word_info')
-                if word_info is not None:
-                    print("\nword_info 태그의 모든 자식 태그:")
-                    for child in word_info:
-                        print(f"태그: {child.tag}")
-                        print(f"값: {child.text}")
-                        print("---")
-            
+            profile_file(xml_file, args.sample)
         except Exception as e:
             print(f"{xml_file.name} 처리 중 오류 발생: {str(e)}")
 
+
 if __name__ == '__main__':
-    check_xml_structure() 
\ No newline at end of file
+    main()
@@ -1,9 +1,11 @@
 import sqlite3
 import logging
 import os
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from dictionary_xml import RECORD_FIELDS, batched, extract_record, iter_items
+from sqlite_bulk import bulk_load
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -57,51 +59,41 @@ def create_database():
         conn.commit()
         logging.info("데이터베이스가 성공적으로 생성되었습니다.")
         
-        # XML 파일에서 데이터 가져오기
-        import_data_from_xml(conn)
+        # XML 파일에서 데이터 가져오기 (새로 만든 데이터베이스이므로 대량 적재 모드 사용)
+        with bulk_load(conn, ['words', 'related_words']):
+            import_data_from_xml(conn)
         
     except Exception as e:
         logging.error(f"데이터베이스 생성 중 오류 발생: {str(e)}")
     finally:
         conn.close()
 
-def extract_text_safely(elem, path):
-    """XML 요소에서 안전하게 텍스트를 추출"""
-    sub_elem = elem.find(path)
-    return sub_elem.text.strip() if sub_elem is not None and sub_elem.text is not None else ''
+# 의미 정보로 합칠 필드: (레코드 위치, 표시 이름)
+MEANING_FIELDS = tuple(
+    (RECORD_FIELDS.index(tag), label)
+    for tag, label in (('pos_info', '품사'), ('study_info', '학습 정보'),
+                       ('lexical_info', '어휘 정보'), ('conju_info', '활용 정보'))
+)
 
-def extract_meaning(elem):
-    """의미 정보 추출"""
-    meanings = []
-    
-    # pos_info에서 의미 추출
-    pos_info = elem.find('pos_info')
-    if pos_info is not None and pos_info.text:
-        meanings.append(f"품사: {pos_info.text.strip()}")
-    
-    # study_info에서 의미 추출
-    study_info = elem.find('study_info')
-    if study_info is not None and study_info.text:
-        meanings.append(f"학습 정보: {study_info.text.strip()}")
-    
-    # lexical_info에서 의미 추출
-    lexical_info = elem.find('lexical_info')
-    if lexical_info is not None and lexical_info.text:
-        meanings.append(f"어휘 정보: {lexical_info.text.strip()}")
+def word_row(item):
+    """item 요소를 words 테이블 행으로 변환 (단어가 없으면 None)"""
+    record = extract_record(item, default='')
+    if record is None:
+        return None
+        
+    (target_code, word, word_unit, word_type, pronunciation, origin,
+     pos_info, study_info, _, _, example) = [value.strip() if value else '' for value in record]
+    if not word:  # 단어가 있는 경우만 저장
+        return None
     
-    # conju_info에서 의미 추출
-    conju_info = elem.find('conju_info')
-    if conju_info is not None and conju_info.text:
-        meanings.append(f"활용 정보: {conju_info.text.strip()}")
+    # 의미 정보 추출
+    meaning = ' | '.join([f"{label}: {record[index].strip()}" for index, label in MEANING_FIELDS if record[index]])
     
-    return ' | '.join(meanings) if meanings else ''
-
-def extract_pronunciation(elem):
-    """발음 정보 추출"""
-    pronunciation_info = elem.find('pronunciation_info')
-    if pronunciation_info is not None and pronunciation_info.text:
-        return pronunciation_info.text.strip()
-    return ''
+    return (
+        target_code, word, word_unit, word_type, 
+        pronunciation, origin, pos_info, study_info,
+        meaning, example
+    )
 
 def import_data_from_xml(conn):
     """XML 파일에서 데이터를 가져와 데이터베이스에 저장"""
@@ -121,35 +113,10 @@ def import_data_from_xml(conn):
         total_words = 0
         for xml_file in xml_files:
             try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                
-                words_data = []
-                for item in root.findall('.//item'):
-                    target_code = extract_text_safely(item, 'target_code')
-                    word_info = item.find('word_info')
-                    if word_info is None:
-                        continue
-                        
-                    word = extract_text_safely(word_info, 'word')
-                    word_unit = extract_text_safely(word_info, 'word_unit')
-                    word_type = extract_text_safely(word_info, 'word_type')
-                    pronunciation = extract_pronunciation(word_info)
-                    origin = extract_text_safely(word_info, 'origin')
-                    pos_info = extract_text_safely(word_info, 'pos_info')
-                    study_info = extract_text_safely(word_info, 'study_info')
-                    meaning = extract_meaning(word_info)
-                    example = extract_text_safely(word_info, 'example')
-                    
-                    if word:  # 단어가 있는 경우만 저장
-                        words_data.append((
-                            target_code, word, word_unit, word_type, 
-                            pronunciation, origin, pos_info, study_info,
-                            meaning, example
-                        ))
-                
-                if words_data:
-                    # 배치 처리로 데이터 삽입
+                # item을 하나씩 읽어 배치 단위로 삽입 (파일 전체를 메모리에 올리지 않음)
+                rows = (row for row in (word_row(item) for item in iter_items(xml_file)) if row is not None)
+                file_words = 0
+                for words_data in batched(rows):
                     cursor.executemany('''
                         INSERT INTO words (
                             target_code, word, word_unit, word_type,
@@ -158,10 +125,12 @@ def import_data_from_xml(conn):
                         )
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ''', words_data)
-                    
+                    file_words += len(words_data)
+                
+                if file_words:
                     conn.commit()
-                    total_words += len(words_data)
-                    logging.info(f"{xml_file.name}에서 {len(words_data)}개의 단어를 가져왔습니다.")
+                    total_words += file_words
+                    logging.info(f"{xml_file.name}에서 {file_words}개의 단어를 가져왔습니다.")
                 
             except Exception as e:
                 logging.error(f"{xml_file.name} 처리 중 오류 발생: {str(e)}")
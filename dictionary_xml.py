@@ -0,0 +1,88 @@
+"""
+국립국어원 사전 XML 스트리밍 파서
+
+`ET.parse`는 파일 전체의 DOM을 만들기 때문에 100MB짜리 덤프 하나에 수 GB의
+메모리를 사용합니다. 여기서는 `iterparse`로 `<item>`을 하나씩 완성되는 대로
+넘겨주고, 처리가 끝난 요소는 바로 지워 파일 크기와 관계없이 메모리 사용량이
+일정하도록 합니다. (app.py, import_hanja.py, create_korean_dictionary.py 공용)
+
+    rows = (to_row(item) for item in iter_items(xml_file))
+    for batch in batched(rows, IMPORT_BATCH_SIZE):
+        cursor.executemany(INSERT_SQL, batch)
+"""
+import xml.etree.ElementTree as ET
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TypeVar, Union
+
+# 한 번의 executemany로 삽입할 행 수
+IMPORT_BATCH_SIZE = 5000
+
+ITEM_TAG = 'item'
+
+T = TypeVar('T')
+
+# extract_record가 반환하는 레코드의 필드 순서 (0번은 item의 target_code, 나머지는 word_info의 자식 태그)
+RECORD_FIELDS = (
+    'target_code', 'word', 'word_unit', 'word_type', 'pronunciation_info', 'origin',
+    'pos_info', 'study_info', 'lexical_info', 'conju_info', 'example'
+)
+# word_info 자식 태그 → 레코드 위치
+_WORD_INFO_SLOTS = {tag: index for index, tag in enumerate(RECORD_FIELDS) if index > 0}
+
+
+def iter_items(xml_file: Union[str, Path]) -> Iterator[ET.Element]:
+    """XML 파일의 `<item>` 요소를 하나씩 반환합니다.
+
+    반환된 요소는 다음 항목으로 넘어가면 지워지므로, 필요한 값은 반복 안에서
+    꺼내야 합니다. (요소 자체를 모으거나 `batched`로 묶으면 안 됨)
+    """
+    depth = 0
+    root = None
+    for event, elem in ET.iterparse(str(xml_file), events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if root is None:
+                root = elem
+            continue
+        depth -= 1
+        # 루트 바로 아래의 item만 항목으로 취급 (하위 요소는 item과 함께 지워짐)
+        if depth == 1 and elem.tag == ITEM_TAG:
+            yield elem
+            elem.clear()
+            # 루트에 남은 처리된 자식 참조 제거
+            root.clear()
+
+
+def extract_record(item: ET.Element, default: Optional[str] = None) -> Optional[List[Optional[str]]]:
+    """item에서 RECORD_FIELDS 순서의 텍스트 목록을 추출합니다. (word_info가 없으면 None)
+
+    필드마다 `find`로 word_info를 다시 검색하지 않고 자식을 한 번만 순회하며
+    태그별 위치에 바로 넣습니다. 같은 태그가 여러 번 나오면 `find`처럼 첫 번째
+    요소의 값을 쓰고, 없는 필드는 default입니다.
+    """
+    word_info = item.find('word_info')
+    if word_info is None:
+        return None
+
+    record: List[Optional[str]] = [default] * len(RECORD_FIELDS)
+    target_code = item.find('target_code')
+    if target_code is not None:
+        record[0] = target_code.text
+    slots = _WORD_INFO_SLOTS
+    # 뒤에서부터 채워 같은 태그의 첫 번째 값이 남도록 함
+    for child in word_info[::-1]:
+        slot = slots.get(child.tag)
+        if slot is not None:
+            record[slot] = child.text
+    return record
+
+
+def batched(iterable: Iterable[T], size: int = IMPORT_BATCH_SIZE) -> Iterator[List[T]]:
+    """값을 size개씩 묶어 반환합니다."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
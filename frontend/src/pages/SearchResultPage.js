@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useLocation, useNavigate, Link } from 'react-router-dom';
 import axios from 'axios'; // axios 임포트
 import {
@@ -63,8 +63,14 @@ const SearchResultPage = () => {
   const [page, setPage] = useState(1);
   const [sortBy, setSortBy] = useState('frequency'); // 기본 정렬: 빈도순
   const [filterBy, setFilterBy] = useState('all');
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // 응답이 늦게 도착해도 최신 검색의 결과에만 이어 붙이도록 검색마다 증가
+  const searchId = useRef(0);
   
   const itemsPerPage = 8;
+  const pageSize = 100; // 서버에서 한 번에 받아 올 결과 수
   
   // 페이지 변경 시 스크롤을 맨 위로 이동
   useEffect(() => {
@@ -79,57 +85,81 @@ const SearchResultPage = () => {
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [location.search]); // location.search가 변경될 때마다 실행
 
-  const handleSearch = async (queryToSearch = searchQuery) => {
+  // 정렬은 서버에서 하므로 커서를 따라 받은 페이지를 그대로 이어 붙이면 됨
+  const fetchPage = (queryToSearch, sortKey, cursor = null) => {
+    return axios.post(`${API_BASE_URL}/hanja/search`, {
+      query: queryToSearch.trim(),
+      sort_by: sortKey,
+      limit: pageSize,
+      cursor
+    });
+  };
+
+  const handleSearch = async (queryToSearch = searchQuery, sortKey = sortBy) => {
     if (!queryToSearch.trim()) return;
     
+    const currentSearch = ++searchId.current;
     setLoading(true);
     setError(null);
     setPage(1); // 새 검색 시 페이지 1로 초기화
     
     try {
-      // 백엔드 API 호출
-      const response = await axios.post(`${API_BASE_URL}/hanja/search`, { 
-        query: queryToSearch.trim() 
-      });
+      // 백엔드 API 호출 (첫 페이지)
+      const response = await fetchPage(queryToSearch, sortKey);
+      if (currentSearch !== searchId.current) return;
       
-      // 데이터 정렬 (초기 로드 시)
-      const sortedData = sortData(response.data, sortBy);
-      setResults(sortedData);
+      setResults(response.data.hanja_list);
+      setTotal(response.data.total);
+      setNextCursor(response.data.next_cursor || null);
 
     } catch (err) {
       console.error("Search API error:", err);
       if (err.response && err.response.status === 404) {
         setError('검색 결과가 없습니다.');
         setResults([]); // 결과 없음 명시적 처리
+        setTotal(0);
+        setNextCursor(null);
       } else {
         setError('검색 중 오류가 발생했습니다. 백엔드 서버 상태를 확인해주세요.');
       }
     } finally {
-      setLoading(false);
+      if (currentSearch === searchId.current) setLoading(false);
     }
   };
   
+  // 보고 있는 페이지가 아직 받지 않은 구간이면 next_cursor로 다음 페이지를 받아 옴
+  useEffect(() => {
+    if (loading || loadingMore || !nextCursor || page * itemsPerPage <= results.length) return;
+    
+    const currentSearch = searchId.current;
+    setLoadingMore(true);
+    fetchPage(initialQuery, sortBy, nextCursor)
+      .then((response) => {
+        if (currentSearch !== searchId.current) return;
+        setResults((prev) => [...prev, ...response.data.hanja_list]);
+        setNextCursor(response.data.next_cursor || null);
+      })
+      .catch((err) => {
+        console.error("Search API error:", err);
+        if (currentSearch !== searchId.current) return;
+        setError('검색 결과를 더 불러오지 못했습니다.');
+        setNextCursor(null);
+      })
+      .finally(() => setLoadingMore(false));
+  // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [page, results.length, nextCursor, loading]);
+  
   const handleSubmit = (e) => {
     e.preventDefault();
     // URL 업데이트하여 useEffect 트리거
     navigate(`/search?q=${encodeURIComponent(searchQuery.trim())}`);
   };
   
-  // 데이터 정렬 함수
-  const sortData = (data, sortKey) => {
-    return [...data].sort((a, b) => {
-      if (sortKey === 'frequency') return (b.frequency || 0) - (a.frequency || 0);
-      if (sortKey === 'strokes') return (a.stroke_count || 0) - (b.stroke_count || 0);
-      // 다른 정렬 기준 추가 가능
-      return 0;
-    });
-  };
-
+  // 받은 페이지만 다시 정렬하면 전체 순서와 달라지므로 새 정렬로 처음부터 다시 검색
   const handleSortChange = (event) => {
     const newSortBy = event.target.value;
     setSortBy(newSortBy);
-    const sortedResults = sortData(results, newSortBy);
-    setResults(sortedResults);
+    handleSearch(initialQuery, newSortBy);
   };
   
   const handleFilterChange = (event) => {
@@ -137,8 +167,8 @@ const SearchResultPage = () => {
     // TODO: 필터링 로직 구현 (API 재호출 또는 클라이언트 측 필터링)
   };
   
-  // 현재 페이지에 표시할 결과 계산
-  const maxPage = Math.ceil(results.length / itemsPerPage);
+  // 현재 페이지에 표시할 결과 계산 (페이지 수는 아직 받지 않은 결과까지 포함한 총 개수 기준)
+  const maxPage = Math.ceil(total / itemsPerPage);
   const currentResults = results.slice(
     (page - 1) * itemsPerPage,
     page * itemsPerPage
@@ -199,7 +229,7 @@ const SearchResultPage = () => {
         <Box sx={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', flexWrap: 'wrap', gap: 2, mb: 3 }}>
           <Box>
             <Typography variant="body2" color="text.secondary">
-              총 {results.length}개의 결과
+              총 {total}개의 결과
             </Typography>
           </Box>
           
@@ -256,7 +286,7 @@ const SearchResultPage = () => {
       ) : (
         <>
           <Grid container spacing={3}>
-            {loading ? (
+            {loading || (loadingMore && currentResults.length === 0) ? (
               renderSkeletons()
             ) : currentResults.map((result) => (
               <Grid item key={result.id || result.traditional} xs={12} sm={6} md={3}>
@@ -0,0 +1,15 @@
+"""
+한국어 부분 문자열/초성 검색용 메모리 색인
+
+루트 사전 앱(search_index.py)과 백엔드(backend/app/search)가 함께 사용합니다.
+외부 의존성 없이 표준 라이브러리만 사용합니다.
+"""
+
+from hangul_search.ngram import MeaningIndex, normalize_text
+from hangul_search.jamo import ChoseongIndex, decompose_jamo, extract_choseong, index_keys, is_choseong_query
+from hangul_search.trie import PrefixTrie
+
+__all__ = [
+    'MeaningIndex', 'ChoseongIndex', 'PrefixTrie', 'normalize_text',
+    'decompose_jamo', 'extract_choseong', 'index_keys', 'is_choseong_query'
+]
@@ -0,0 +1,161 @@
+"""
+한글 자모/초성 접두사 색인
+
+"ㅅ", "ㅅㅇ"처럼 초성만 입력하거나 "ㅅㅜ", "수ㅇ"처럼 음절을 입력하는 도중인
+검색어를 처리합니다. 색인할 때 한 번만 음절을 자모로 분해해 트라이에 넣으므로
+검색 시에는 행마다 분해하지 않고 O(접두사 길이)로 후보 노드를 찾습니다.
+"""
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from hangul_search.trie import PrefixTrie
+
+# 한글 음절 범위와 자모 표
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ",
+             "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 겹받침/이중모음을 입력 순서대로 풀어 쓴 형태 ("닭" 입력 중의 "달ㄱ"도 일치하도록)
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+# 호환용 자음 범위 (ㄱ-ㅎ): 검색어가 모두 자음이면 초성 검색으로 처리
+_CONSONANTS = frozenset(CHOSEONG) | frozenset("ㄳㄵㄶㄺㄻㄼㄽㄾㄿㅀㅄ")
+
+# 색인 키를 만들 단위 (한글 음절/자모 연속 구간)
+_HANGUL_RUN = re.compile(r"[가-힣ㄱ-ㆎ]+")
+
+
+def _split_syllable(ch: str) -> Optional[Tuple[str, str, str]]:
+    code = ord(ch)
+    if not HANGUL_BASE <= code <= HANGUL_LAST:
+        return None
+    offset = code - HANGUL_BASE
+    return (
+        CHOSEONG[offset // (21 * 28)],
+        JUNGSEONG[(offset // 28) % 21],
+        JONGSEONG[offset % 28],
+    )
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 입력 순서의 자모열로 분해합니다. ("수영" → "ㅅㅜㅇㅕㅇ")"""
+    result = []
+    for ch in text:
+        parts = _split_syllable(ch)
+        jamos = parts if parts else (ch,)
+        for jamo in jamos:
+            if jamo:
+                result.append(COMPOUND_JAMO.get(jamo, jamo))
+    return "".join(result)
+
+
+def extract_choseong(text: str) -> str:
+    """한글 음절의 초성만 추출합니다. ("수영" → "ㅅㅇ")"""
+    result = []
+    for ch in text:
+        parts = _split_syllable(ch)
+        if parts:
+            result.append(parts[0])
+        elif ch in _CONSONANTS:
+            result.append(ch)
+    return "".join(result)
+
+
+def is_choseong_query(query: str) -> bool:
+    """검색어가 자음(초성)만으로 이루어져 있는지 확인합니다."""
+    return bool(query) and all(ch in _CONSONANTS for ch in query)
+
+
+def index_keys(text: Optional[str]) -> List[str]:
+    """텍스트에서 색인 키(한글 연속 구간)를 추출합니다.
+
+    "희멀끔-하다" → ["희멀끔하다"], "수, 주" → ["수", "주"]
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize("NFC", text)
+    # 표준국어대사전 표제어의 분절 기호(-, ^)는 단어의 일부로 봄
+    text = text.replace("-", "").replace("^", "")
+    return _HANGUL_RUN.findall(text)
+
+
+class ChoseongIndex:
+    """초성 트라이와 자모 트라이로 구성된 한글 접두사 색인"""
+
+    def __init__(self):
+        self.loaded = False
+        self._choseong = PrefixTrie()
+        self._jamo = PrefixTrie()
+        self._keys: Dict[int, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, rows: Iterable[Tuple[int, Iterable[Optional[str]]]]) -> None:
+        """(행 ID, 필드 목록) 목록으로 색인 전체를 구축합니다."""
+        choseong, jamo = PrefixTrie(), PrefixTrie()
+        keys: Dict[int, Tuple[str, ...]] = {}
+        for row_id, fields in rows:
+            row_keys = self._row_keys(fields)
+            keys[row_id] = row_keys
+            for key in row_keys:
+                choseong.insert(extract_choseong(key), row_id)
+                jamo.insert(decompose_jamo(key), row_id)
+
+        with self._lock:
+            self._choseong, self._jamo, self._keys = choseong, jamo, keys
+            self.loaded = True
+
+    @staticmethod
+    def _row_keys(fields: Iterable[Optional[str]]) -> Tuple[str, ...]:
+        keys = []
+        for field in fields:
+            for key in index_keys(field):
+                if key not in keys:
+                    keys.append(key)
+        return tuple(keys)
+
+    def add(self, row_id: int, fields: Iterable[Optional[str]]) -> None:
+        """행 하나를 추가하거나 갱신합니다."""
+        row_keys = self._row_keys(fields)
+        with self._lock:
+            old_keys = self._keys.get(row_id, ())
+            if old_keys == row_keys:
+                return
+            for key in set(old_keys) - set(row_keys):
+                self._choseong.remove(extract_choseong(key), row_id)
+                self._jamo.remove(decompose_jamo(key), row_id)
+            for key in set(row_keys) - set(old_keys):
+                self._choseong.insert(extract_choseong(key), row_id)
+                self._jamo.insert(decompose_jamo(key), row_id)
+            self._keys[row_id] = row_keys
+
+    def remove(self, row_id: int) -> None:
+        """행 하나를 색인에서 제거합니다."""
+        with self._lock:
+            for key in self._keys.pop(row_id, ()):
+                self._choseong.remove(extract_choseong(key), row_id)
+                self._jamo.remove(decompose_jamo(key), row_id)
+
+    def search(self, query: str) -> Set[int]:
+        """초성 또는 자모 접두사에 일치하는 행 ID 집합을 반환합니다.
+
+        자음만 입력된 경우("ㅅㅇ")는 초성 트라이에서, 그 외("ㅅㅜ", "수ㅇ")는
+        자모 트라이에서 접두사로 찾습니다.
+        """
+        query = "".join(index_keys(query))
+        if not query:
+            return set()
+        if is_choseong_query(query):
+            return self._choseong.search_prefix(query)
+        return self._jamo.search_prefix(decompose_jamo(query))
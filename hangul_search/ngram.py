@@ -0,0 +1,146 @@
+"""
+글자(음절) 단위 n-gram 역색인
+
+짧은 한국어 뜻풀이("물 수", "길, 도리, 방법")를 부분 문자열로 검색하기 위해
+1~3글자 n-gram마다 행 ID의 정렬된 배열(posting)을 유지합니다. 검색 시에는
+검색어의 n-gram posting을 메모리에서 교집합한 뒤 원문으로 한 번 더 확인하므로
+`LIKE '%검색어%'` 전체 스캔 없이 정확한 결과를 얻습니다.
+"""
+from array import array
+from bisect import bisect_left, insort
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 여러 필드를 하나의 문서로 합칠 때 쓰는 구분자 (검색어에 나올 수 없는 문자)
+FIELD_SEPARATOR = "\x1f"
+
+
+def normalize_text(text: str) -> str:
+    """색인/검색에 사용할 형태(NFC, 소문자)로 정규화합니다."""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+class MeaningIndex:
+    """음절 n-gram → 정렬된 행 ID 배열로 구성된 메모리 역색인"""
+
+    def __init__(self, max_n: int = 3):
+        """
+        Args:
+            max_n: 색인할 n-gram의 최대 길이 (1글자 검색을 위해 1-gram부터 색인)
+        """
+        self.max_n = max_n
+        self.loaded = False
+        self._postings: Dict[str, array] = {}
+        self._documents: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _grams(self, document: str, n: Optional[int] = None) -> Set[str]:
+        """문서에서 n-gram 집합을 추출합니다. 공백이나 필드 구분자를 포함한 n-gram은 제외합니다."""
+        sizes = range(1, self.max_n + 1) if n is None else (n,)
+        grams = set()
+        for size in sizes:
+            for start in range(len(document) - size + 1):
+                gram = document[start:start + size]
+                if FIELD_SEPARATOR in gram or any(ch.isspace() for ch in gram):
+                    continue
+                grams.add(gram)
+        return grams
+
+    @staticmethod
+    def _make_document(fields: Iterable[Optional[str]]) -> str:
+        return FIELD_SEPARATOR.join(normalize_text(field) for field in fields if field)
+
+    def build(self, rows: Iterable[Tuple[int, Iterable[Optional[str]]]]) -> None:
+        """(행 ID, 필드 목록) 목록으로 색인 전체를 구축합니다.
+
+        구축이 끝난 뒤 한 번에 교체하므로 구축 중에도 기존 색인으로 검색할 수 있습니다.
+        """
+        documents: Dict[int, str] = {}
+        postings: Dict[str, List[int]] = {}
+        for row_id, fields in rows:
+            document = self._make_document(fields)
+            documents[row_id] = document
+            for gram in self._grams(document):
+                postings.setdefault(gram, []).append(row_id)
+
+        compact = {gram: array("q", sorted(ids)) for gram, ids in postings.items()}
+        with self._lock:
+            self._documents = documents
+            self._postings = compact
+            self.loaded = True
+
+    def add(self, row_id: int, fields: Iterable[Optional[str]]) -> None:
+        """행 하나를 추가하거나 갱신합니다 (전체 재구축 없이 해당 posting만 수정)."""
+        document = self._make_document(fields)
+        with self._lock:
+            old_document = self._documents.get(row_id)
+            if old_document == document:
+                return
+            old_grams = self._grams(old_document) if old_document is not None else set()
+            new_grams = self._grams(document)
+
+            for gram in old_grams - new_grams:
+                self._discard(gram, row_id)
+            for gram in new_grams - old_grams:
+                posting = self._postings.setdefault(gram, array("q"))
+                insort(posting, row_id)
+            self._documents[row_id] = document
+
+    def remove(self, row_id: int) -> None:
+        """행 하나를 색인에서 제거합니다."""
+        with self._lock:
+            document = self._documents.pop(row_id, None)
+            if document is None:
+                return
+            for gram in self._grams(document):
+                self._discard(gram, row_id)
+
+    def _discard(self, gram: str, row_id: int) -> None:
+        posting = self._postings.get(gram)
+        if posting is None:
+            return
+        position = bisect_left(posting, row_id)
+        if position < len(posting) and posting[position] == row_id:
+            posting.pop(position)
+        if not posting:
+            del self._postings[gram]
+
+    def search(self, query: str) -> List[int]:
+        """검색어를 부분 문자열로 포함하는 행 ID를 오름차순으로 반환합니다."""
+        query = normalize_text(query).strip()
+        if not query:
+            return []
+
+        # 가능한 가장 긴 n-gram을 사용해 posting 크기를 줄임
+        words = query.split()
+        n = min(self.max_n, min(len(word) for word in words))
+        grams = set()
+        for word in words:
+            grams |= self._grams(word, n)
+
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = [row_id for row_id in candidates if _contains(posting, row_id)]
+            if not candidates:
+                return []
+
+        # n-gram 교집합은 후보일 뿐이므로 원문으로 최종 확인
+        documents = self._documents
+        return [row_id for row_id in candidates if query in documents.get(row_id, "")]
+
+
+def _contains(posting: array, row_id: int) -> bool:
+    position = bisect_left(posting, row_id)
+    return position < len(posting) and posting[position] == row_id
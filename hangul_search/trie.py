@@ -0,0 +1,80 @@
+"""
+접두사 검색용 트라이
+"""
+from typing import Dict, Iterator, Optional, Set
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Optional[Set[int]] = None
+
+
+class PrefixTrie:
+    """문자열 키 → 행 ID 집합을 저장하고 접두사로 찾는 트라이
+
+    접두사에 해당하는 노드는 O(접두사 길이)로 찾고, 결과는 그 노드의
+    하위 트리만 순회하므로 전체 키를 훑지 않습니다.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def insert(self, key: str, row_id: int) -> None:
+        node = self._root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            node = child
+        if node.ids is None:
+            node.ids = set()
+        node.ids.add(row_id)
+
+    def remove(self, key: str, row_id: int) -> None:
+        """키에서 행 ID를 제거하고 비게 된 노드를 정리합니다."""
+        path = []
+        node = self._root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                return
+            path.append((node, ch))
+            node = child
+        if not node.ids:
+            return
+        node.ids.discard(row_id)
+        if not node.ids:
+            node.ids = None
+
+        for parent, ch in reversed(path):
+            child = parent.children[ch]
+            if child.ids or child.children:
+                break
+            del parent.children[ch]
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def iter_prefix(self, prefix: str) -> Iterator[int]:
+        """접두사로 시작하는 모든 키의 행 ID를 순회합니다 (중복 가능)."""
+        node = self._find(prefix)
+        if node is None:
+            return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.ids:
+                yield from node.ids
+            stack.extend(node.children.values())
+
+    def search_prefix(self, prefix: str) -> Set[int]:
+        """접두사로 시작하는 모든 키의 행 ID 집합을 반환합니다."""
+        return set(self.iter_prefix(prefix))
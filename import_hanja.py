@@ -1,12 +1,17 @@
+import argparse
 import os
 import sqlite3
-import xml.etree.ElementTree as ET
 from pathlib import Path
 import logging
+import multiprocessing
+import queue
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 import re
 
+from dictionary_xml import IMPORT_BATCH_SIZE, iter_items
+from sqlite_bulk import bulk_load, is_empty
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -14,8 +19,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DB_PATH = 'hanja.db'
+# 진행 상황을 기록할 item 간격 (XML 구조 확인은 check_xml.py 사용)
+PROGRESS_INTERVAL = 50000
+
+class OutdatedSchemaError(RuntimeError):
+    """이전 형식의 한자 데이터베이스"""
+
+def check_schema(conn):
+    """이전 형식(표제어 전체가 hanja 행, hanja_words에 word_id 없음)이면 OutdatedSchemaError
+
+    이전 형식의 여러 글자 hanja 행과 표제어에 연결되지 않은 예문 단어는 다시 가져와도
+    지울 수 없으므로, 이어서 가져오지 않고 새 파일로 다시 만들도록 안내합니다.
+    """
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(hanja_words)')}
+    if columns and 'word_id' not in columns:
+        db_file = conn.execute('PRAGMA database_list').fetchone()[2] or DB_PATH
+        raise OutdatedSchemaError(
+            f"{db_file}은(는) 이전 형식의 한자 데이터베이스입니다. "
+            f"파일을 지우거나 --db로 새 경로를 지정해 다시 가져오세요."
+        )
+
 def create_tables(conn):
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성
+
+    - hanja: 글자 하나당 한 행 (한 글자 표제어에서 뜻/음/부수/획수를 채움)
+    - words: 한자어 표제어 (target_code로 구분, hanja는 한자 표기 전체)
+    - word_hanja: 표제어를 글자 단위로 나눈 (hanja_id, word_id, position) 연결 테이블
+    - hanja_words: 표제어 첫 글자와 표제어(word_id)에 연결한 예문 속 한자 단어
+
+    표제어 전체를 hanja 행으로 저장하던 이전 형식의 데이터베이스는 새 행과 섞이지
+    않도록 거부합니다. (OutdatedSchemaError)
+    """
+    check_schema(conn)
     cursor = conn.cursor()
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS hanja (
@@ -27,56 +63,137 @@ def create_tables(conn):
         stroke_count INTEGER
     )
     ''')
-    
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS words (
+        id INTEGER PRIMARY KEY,
+        target_code TEXT UNIQUE,
+        word TEXT,
+        hanja TEXT,
+        meaning TEXT,
+        reading TEXT
+    )
+    ''')
+
+    # 단어 → 글자는 기본 키, 글자 → 단어는 보조 인덱스로 조회
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS word_hanja (
+        word_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        hanja_id INTEGER NOT NULL,
+        PRIMARY KEY (word_id, position),
+        FOREIGN KEY (word_id) REFERENCES words (id),
+        FOREIGN KEY (hanja_id) REFERENCES hanja (id)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_word_hanja_hanja ON word_hanja (hanja_id, word_id, position)
+    ''')
+
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS hanja_words (
         id INTEGER PRIMARY KEY,
         hanja_id INTEGER,
+        word_id INTEGER,
         word TEXT,
         meaning TEXT,
-        FOREIGN KEY (hanja_id) REFERENCES hanja (id)
+        FOREIGN KEY (hanja_id) REFERENCES hanja (id),
+        FOREIGN KEY (word_id) REFERENCES words (id)
     )
     ''')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_hanja_words_word ON hanja_words (word_id)
+    ''')
     conn.commit()
 
-def insert_hanja_batch(conn, hanja_data, words_data):
-    """한자 데이터를 일괄 삽입"""
+# 한 글자 표제어의 정보로 글자 행을 채움 (다시 가져오면 새 값으로 갱신, 빈 값은 기존 값 유지)
+UPSERT_CHARACTER_SQL = '''
+INSERT INTO hanja (character, meaning, reading, radical, stroke_count)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(character) DO UPDATE SET
+    meaning = COALESCE(NULLIF(excluded.meaning, ''), hanja.meaning),
+    reading = COALESCE(NULLIF(excluded.reading, ''), hanja.reading),
+    radical = COALESCE(NULLIF(excluded.radical, ''), hanja.radical),
+    stroke_count = COALESCE(NULLIF(excluded.stroke_count, 0), hanja.stroke_count)
+'''
+
+# 다시 가져오면 target_code 기준으로 갱신
+UPSERT_WORD_SQL = '''
+INSERT INTO words (target_code, word, hanja, meaning, reading)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(target_code) DO UPDATE SET
+    word = excluded.word, hanja = excluded.hanja,
+    meaning = excluded.meaning, reading = excluded.reading
+'''
+
+def select_ids(cursor, table, column, values):
+    """{값: id} 조회 (values는 중복 없는 목록)"""
+    if not values:
+        return {}
+    placeholders = ','.join('?' * len(values))
+    cursor.execute(f'SELECT id, {column} FROM {table} WHERE {column} IN ({placeholders})', values)
+    return {row[1]: row[0] for row in cursor.fetchall()}
+
+def insert_hanja_batch(conn, hanja_data, words_data, bulk=False):
+    """한자어 표제어, 글자, 글자-단어 연결, 예문 단어를 일괄 삽입
+
+    hanja_data 행은 (target_code, 단어, 한자 표기, 뜻, 음, 부수, 획수),
+    words_data 행은 (target_code, 예문 한자 단어, 뜻)입니다. 이미 가져온 표제어를
+    다시 가져오면 그 표제어의 연결과 예문 단어를 지우고 새로 넣습니다.
+
+    대량 적재 모드(bulk)에서는 저널이 없어 롤백할 수 없으므로 오류를 그대로
+    올려 쓰기 프로세스를 중단합니다.
+    """
     if not hanja_data:
         return 0
-        
+
     cursor = conn.cursor()
     try:
-        # 한자 데이터 삽입
+        # 글자 삽입: 한 글자 표제어는 정보와 함께, 나머지 글자는 빈 행으로
+        cursor.executemany(UPSERT_CHARACTER_SQL, [
+            (h[2], h[3], h[4], h[5], h[6]) for h in hanja_data if len(h[2]) == 1
+        ])
+        characters = list({c for h in hanja_data for c in h[2]})
+        cursor.executemany('INSERT OR IGNORE INTO hanja (character) VALUES (?)', [(c,) for c in characters])
+        hanja_ids = select_ids(cursor, 'hanja', 'character', characters)
+
+        # 표제어 삽입 (이미 가져온 표제어는 딸린 연결과 예문 단어를 먼저 지움)
+        spellings = {h[0]: h[2] for h in hanja_data}
+        target_codes = list(spellings)
+        reimported = [(i,) for i in select_ids(cursor, 'words', 'target_code', target_codes).values()]
+        if reimported:
+            cursor.executemany('DELETE FROM word_hanja WHERE word_id = ?', reimported)
+            cursor.executemany('DELETE FROM hanja_words WHERE word_id = ?', reimported)
+        cursor.executemany(UPSERT_WORD_SQL, [(h[0], h[1], h[2], h[3], h[4]) for h in hanja_data])
+        word_ids = select_ids(cursor, 'words', 'target_code', target_codes)
+
+        # 표제어를 글자 단위로 분해해 연결 (배치 안에 같은 표제어가 다시 나오면 마지막 표기)
         cursor.executemany('''
-        INSERT OR IGNORE INTO hanja (character, meaning, reading, radical, stroke_count)
-        VALUES (?, ?, ?, ?, ?)
-        ''', hanja_data)
-        
-        # 삽입된 한자의 ID 조회
-        placeholders = ','.join('?' * len(hanja_data))
-        cursor.execute(f'''
-        SELECT id, character FROM hanja WHERE character IN ({placeholders})
-        ''', [h[0] for h in hanja_data])
-        
-        hanja_ids = {row[1]: row[0] for row in cursor.fetchall()}
-        
-        # 단어 데이터 삽입
-        word_data_with_ids = []
-        for word in words_data:
-            hanja_id = hanja_ids.get(word[0])
-            if hanja_id:
-                word_data_with_ids.append((hanja_id, word[1], word[2]))
-        
+        INSERT OR REPLACE INTO word_hanja (word_id, position, hanja_id)
+        VALUES (?, ?, ?)
+        ''', [
+            (word_ids[code], position, hanja_ids[c])
+            for code, spelling in spellings.items()
+            for position, c in enumerate(spelling)
+        ])
+
+        # 예문 단어 삽입 (표제어 첫 글자와 표제어에 연결)
+        word_data_with_ids = [
+            (hanja_ids[spellings[word[0]][0]], word_ids[word[0]], word[1], word[2])
+            for word in words_data
+        ]
         if word_data_with_ids:
             cursor.executemany('''
-            INSERT INTO hanja_words (hanja_id, word, meaning)
-            VALUES (?, ?, ?)
+            INSERT INTO hanja_words (hanja_id, word_id, word, meaning)
+            VALUES (?, ?, ?, ?)
             ''', word_data_with_ids)
-        
+
         conn.commit()
         return len(hanja_data)
     except Exception as e:
         logging.error(f"데이터 삽입 중 오류 발생: {str(e)}")
+        if bulk:
+            raise
         conn.rollback()
         return 0
 
@@ -90,197 +207,321 @@ def extract_text_safely(element, path, default=''):
         pass
     return default
 
+# 한글(한자) 형식 (반각/전각 괄호 모두 허용)
+HANGUL_WITH_HANJA = re.compile(r'[가-힣]+[（(]([一-龥]+)[)）]')
+# 괄호 없이 이어진 한자
+HANJA_RUN = re.compile(r'[一-龥]+')
+
 def extract_hanja_from_text(text):
     """텍스트에서 한자 추출 (한글(한자) 형식)"""
     if not text:
         return None
     
-    # 한글(한자) 패턴 매칭 - 더 유연한 패턴
-    patterns = [
-        r'[가-힣]+\(([一-龥]+)\)',  # 기본 패턴
-        r'[가-힣]+[（(]([一-龥]+)[)）]',  # 다양한 괄호 지원
-        r'[가-힣]+[（(]([一-龥]+)[)）]',  # 전각 괄호 지원
-        r'[가-힣]+[（(]([一-龥]+)[)）]',  # 반각 괄호 지원
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1)
+    match = HANGUL_WITH_HANJA.search(text)
+    if match:
+        return match.group(1)
     
     # 괄호 없이 한자만 있는 경우
-    hanja_pattern = r'[一-龥]+'
-    match = re.search(hanja_pattern, text)
+    match = HANJA_RUN.search(text)
     if match:
         return match.group(0)
     
     return None
 
-def parse_xml_file(file_path):
-    """XML 파일에서 한자 데이터 추출"""
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        hanja_data = []
-        words_data = []
-        
-        # XML 구조 분석
-        logging.info(f"XML 루트 태그: {root.tag}")
-        for child in root:
-            logging.info(f"자식 태그: {child.tag}")
-            if child.tag == 'item':
-                for subchild in child:
-                    logging.info(f"  - item 자식 태그: {subchild.tag}")
-                    if subchild.tag == 'word_info':
-                        for info in subchild:
-                            logging.info(f"    - word_info 자식 태그: {info.tag}")
-        
-        # 모든 item 태그를 찾아서 처리
-        items = root.findall('.//item')
-        logging.info(f"총 {len(items)}개의 item 태그 발견")
-        
-        for item in items:
-            try:
-                # word_info 태그에서 단어 정보 추출
-                word_info = item.find('word_info')
-                if word_info is None:
-                    continue
-                
-                # 단어 추출
-                word_text = extract_text_safely(word_info, 'word')
-                if not word_text:
-                    continue
-                
-                # 한자 추출
-                hanja = extract_hanja_from_text(word_text)
-                if not hanja:
-                    # word_info의 다른 태그에서 한자 찾기
-                    for child in word_info:
-                        if child.text:
-                            hanja = extract_hanja_from_text(child.text)
-                            if hanja:
-                                break
-                
-                if not hanja:
-                    continue
-                
-                # 의미 추출
-                meanings = []
-                for sense_info in word_info.findall('.//sense_info'):
-                    definition = extract_text_safely(sense_info, 'definition')
-                    if definition:
-                        meanings.append(definition)
-                
-                meaning = '; '.join(meanings) if meanings else ''
-                
-                # 발음 추출
-                reading = ''
-                for pron_info in word_info.findall('.//pronunciation_info/pronunciation'):
-                    if pron_info is not None and pron_info.text:
-                        reading = pron_info.text.strip()
+def parse_item(item):
+    """item 요소에서 (표제어 행, 예문 단어 행 목록)을 추출
+
+    한자가 없거나, 다시 가져올 때 표제어를 찾을 target_code가 없으면 None
+    """
+    target_code = extract_text_safely(item, 'target_code')
+    if not target_code:
+        return None
+    
+    # word_info 태그에서 단어 정보 추출
+    word_info = item.find('word_info')
+    if word_info is None:
+        return None
+    
+    # 단어 추출
+    word_text = extract_text_safely(word_info, 'word')
+    if not word_text:
+        return None
+    
+    # 한자 추출
+    hanja = extract_hanja_from_text(word_text)
+    if not hanja:
+        # word_info의 다른 태그에서 한자 찾기
+        for child in word_info:
+            if child.text:
+                hanja = extract_hanja_from_text(child.text)
+                if hanja:
+                    break
+    
+    if not hanja:
+        return None
+    
+    # 의미, 발음, 부수/획수, 예문을 word_info 하위 트리 한 번의 순회로 추출
+    meanings = []
+    examples = []
+    reading = ''
+    radical = ''
+    stroke_count = 0
+    info_done = False
+    for elem in word_info.iter():
+        tag = elem.tag
+        if tag == 'sense_info':
+            for child in elem:
+                if child.tag == 'definition':
+                    if child.text and child.text.strip():
+                        meanings.append(child.text.strip())
+                    break
+        elif tag == 'example_info':
+            for child in elem:
+                if child.tag == 'example' and child.text:
+                    examples.append(child.text)
+        elif tag == 'pronunciation_info':
+            if not reading:
+                for child in elem:
+                    if child.tag == 'pronunciation' and child.text:
+                        reading = child.text.strip()
                         break
-                
-                # 부수와 획수 정보 추출
-                radical = ''
-                stroke_count = 0
-                
-                for info in word_info.findall('.//info'):
-                    info_text = info.text if info.text else ''
-                    if '부수' in info_text:
-                        try:
-                            radical = info_text.split('：')[-1].strip()
-                            break
-                        except:
-                            pass
-                    elif '획수' in info_text:
-                        try:
-                            stroke_count = int(info_text.split('：')[-1].strip())
-                            break
-                        except:
-                            pass
-                
-                # 한자 데이터 추가
-                hanja_data.append((
-                    hanja,
-                    meaning,
-                    reading,
-                    radical,
-                    stroke_count
-                ))
-                
-                # 예문 추출
-                for sense_info in word_info.findall('.//sense_info'):
-                    for example_info in sense_info.findall('.//example_info/example'):
-                        example_text = example_info.text
-                        if example_text:
-                            example_hanja = extract_hanja_from_text(example_text)
-                            if example_hanja:
-                                words_data.append((hanja, example_hanja, meaning))
+        elif tag == 'info' and not info_done:
+            # 부수 또는 획수 중 먼저 읽은 값 하나만 사용
+            info_text = elem.text if elem.text else ''
+            if '부수' in info_text:
+                radical = info_text.split('：')[-1].strip()
+                info_done = True
+            elif '획수' in info_text:
+                try:
+                    stroke_count = int(info_text.split('：')[-1].strip())
+                    info_done = True
+                except ValueError:
+                    pass
+    
+    meaning = '; '.join(meanings) if meanings else ''
+    
+    # 예문에서 한자 단어 추출
+    words = []
+    for example_text in examples:
+        example_hanja = extract_hanja_from_text(example_text)
+        if example_hanja:
+            words.append((target_code, example_hanja, meaning))
+    
+    return (target_code, word_text, hanja, meaning, reading, radical, stroke_count), words
+
+def parse_xml_file(file_path, batch_size=IMPORT_BATCH_SIZE):
+    """XML 파일에서 한자 데이터를 배치 단위로 추출
+
+    item을 하나씩 읽어 처리하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Yields:
+        (hanja_data, words_data): 최대 batch_size개의 표제어 행과 해당 예문 단어 행
+    """
+    hanja_data = []
+    words_data = []
+    item_count = 0
+    total_hanja = 0
+    total_words = 0
+    start_time = time.perf_counter()
+    try:
+        for item in iter_items(file_path):
+            item_count += 1
+            if item_count % PROGRESS_INTERVAL == 0:
+                elapsed = time.perf_counter() - start_time
+                logging.info(f"{file_path}: {item_count}개 item 처리 중 ({item_count / elapsed:.0f}개/초)")
             
+            try:
+                parsed = parse_item(item)
             except Exception as e:
                 logging.error(f"항목 파싱 중 오류 발생: {str(e)}")
                 continue
+            if parsed is None:
+                continue
+            
+            hanja_row, word_rows = parsed
+            hanja_data.append(hanja_row)
+            words_data.extend(word_rows)
+            if len(hanja_data) >= batch_size:
+                total_hanja += len(hanja_data)
+                total_words += len(words_data)
+                yield hanja_data, words_data
+                hanja_data, words_data = [], []
         
         if hanja_data:
-            logging.info(f"{file_path}에서 {len(hanja_data)}개의 한자와 {len(words_data)}개의 단어 추출됨")
+            total_hanja += len(hanja_data)
+            total_words += len(words_data)
+            yield hanja_data, words_data
         
-        return hanja_data, words_data
+        elapsed = time.perf_counter() - start_time
+        logging.info(
+            f"{file_path}: item {item_count}개에서 한자 {total_hanja}개, 단어 {total_words}개 추출 "
+            f"({elapsed:.1f}초, {item_count / max(elapsed, 1e-9):.0f}개/초)"
+        )
     except Exception as e:
         logging.error(f"XML 파싱 오류: {file_path} - {str(e)}")
-        return [], []
 
-def process_file(file_path):
-    """개별 파일 처리"""
+# 파싱 프로세스 → 쓰기 프로세스 큐에 쌓아 둘 최대 배치 수 (메모리 상한)
+QUEUE_BATCHES_PER_WORKER = 2
+# 큐가 가득 찼을 때와 파일 처리를 기다릴 때 쓰기 프로세스 실패 여부를 확인하는 간격(초)
+QUEUE_PUT_TIMEOUT = 1.0
+
+# 파싱 프로세스 전역 상태 (_init_parser에서 설정)
+_batch_queue = None
+_abort_event = None
+
+def _init_parser(batch_queue, abort_event):
+    """파싱 프로세스 초기화: 쓰기 프로세스로 가는 큐를 받아 둠"""
+    global _batch_queue, _abort_event
+    _batch_queue = batch_queue
+    _abort_event = abort_event
+
+def _put_batch(item):
+    # 큐가 가득 차면 기다리되, 쓰기 프로세스가 실패했으면 중단
+    while True:
+        try:
+            _batch_queue.put(item, timeout=QUEUE_PUT_TIMEOUT)
+            return
+        except queue.Full:
+            if _abort_event.is_set():
+                # 아무도 읽지 않는 큐에 남은 배치를 비우느라 프로세스 종료가 멈추지 않도록 함
+                _batch_queue.cancel_join_thread()
+                raise RuntimeError("쓰기 프로세스가 중단되어 파싱을 멈춥니다")
+
+def parse_file_to_queue(file_path):
+    """파싱 프로세스에서 실행: 파일을 배치 단위로 파싱해 쓰기 프로세스 큐에 넣음
+
+    파일이 끝나면 같은 큐에 None을 넣습니다. 한 프로세스가 넣은 항목은 순서대로
+    전달되므로, 쓰기 프로세스가 None을 받으면 그 파일의 배치는 모두 받은 것입니다.
+    """
+    logging.info(f"파일 처리 중: {file_path}")
+    parsed_count = 0
     try:
-        logging.info(f"파일 처리 중: {file_path}")
-        
-        # 각 스레드마다 새로운 데이터베이스 연결 생성
-        conn = sqlite3.connect('hanja.db')
-        create_tables(conn)
-        
-        hanja_data, words_data = parse_xml_file(file_path)
-        processed_count = 0
-        
-        if hanja_data:
-            processed_count = insert_hanja_batch(conn, hanja_data, words_data)
-            if processed_count > 0:
-                logging.info(f"{file_path}에서 {processed_count}개의 한자 처리됨")
-        
-        conn.close()
-        return processed_count
+        for batch in parse_xml_file(file_path):
+            _put_batch(batch)
+            parsed_count += len(batch[0])
+    finally:
+        if not _abort_event.is_set():
+            _put_batch(None)
+    return parsed_count
+
+def write_batches(batch_queue, abort_event, result_queue, db_path, file_count=1):
+    """쓰기 프로세스에서 실행: 큐의 배치를 하나의 연결로 순서대로 삽입
+
+    SQLite 쓰기는 한 연결에서만 하므로 `database is locked` 경합이 없습니다.
+    파일 끝 표시(None)를 file_count개 받으면 종료하고 삽입한 한자 수를
+    result_queue에 넣습니다. 실패하면 abort_event를 설정하고 -1을 넣습니다.
+    """
+    total = 0
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            create_tables(conn)
+            # 빈 데이터베이스에 처음 적재할 때만 대량 적재 모드 사용
+            bulk = is_empty(conn, 'words')
+            with bulk_load(conn, ['hanja', 'words', 'word_hanja', 'hanja_words']) if bulk else nullcontext():
+                remaining = file_count
+                while remaining:
+                    batch = batch_queue.get()
+                    if batch is None:
+                        remaining -= 1
+                        continue
+                    hanja_data, words_data = batch
+                    total += insert_hanja_batch(conn, hanja_data, words_data, bulk)
+        finally:
+            conn.close()
     except Exception as e:
-        logging.error(f"파일 처리 중 오류 발생: {file_path} - {str(e)}")
-        return 0
+        logging.error(f"쓰기 프로세스 오류: {str(e)}")
+        abort_event.set()
+        total = -1
+    result_queue.put(total)
+
+def main(workers=None, db_path=DB_PATH):
+    """data/raw의 XML 파일을 병렬로 파싱해 한자 데이터베이스에 저장
 
-def main():
+    파일마다 파싱 프로세스(multiprocessing.Pool)가 배치를 만들어 크기 제한 큐에
+    넣고, 쓰기 프로세스 하나가 큐에서 꺼내 트랜잭션 단위 executemany로 삽입합니다.
+    파싱이 GIL에 묶이지 않으므로 코어 수에 비례해 빨라집니다.
+
+    쓰기 프로세스가 실패하거나 죽으면 아무도 큐를 읽지 않으므로, 파싱 프로세스가
+    큐에 넣거나 종료하며 남은 배치를 비우다가 멈추지 않도록 풀을 강제 종료합니다.
+
+    Returns:
+        int: 삽입한 한자 수 (실패하면 -1, 가져올 파일이 없으면 None)
+    """
     data_dir = Path('data/raw')
     if not data_dir.exists():
         logging.error("데이터 디렉토리를 찾을 수 없습니다.")
         return
     
-    xml_files = list(data_dir.glob('*.xml'))
+    xml_files = sorted(data_dir.glob('*.xml'))
     total_files = len(xml_files)
-    total_hanja = 0
-    processed_files = 0
+    if not xml_files:
+        logging.error("XML 파일을 찾을 수 없습니다.")
+        return
+    workers = workers or min(os.cpu_count() or 1, total_files)
+    
+    batch_queue = multiprocessing.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+    result_queue = multiprocessing.Queue()
+    abort_event = multiprocessing.Event()
+    writer = multiprocessing.Process(
+        target=write_batches, args=(batch_queue, abort_event, result_queue, db_path, total_files)
+    )
+    writer.start()
     
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_to_file = {
-            executor.submit(process_file, str(file)): file 
+    start_time = time.time()
+    parsed_hanja = 0
+    processed_files = 0
+    pool = multiprocessing.Pool(workers, initializer=_init_parser, initargs=(batch_queue, abort_event))
+    try:
+        pending = {
+            file: pool.apply_async(parse_file_to_queue, (str(file),))
             for file in xml_files
         }
-        
-        for future in as_completed(future_to_file):
-            file = future_to_file[future]
-            try:
-                hanja_count = future.result()
-                total_hanja += hanja_count
-                processed_files += 1
-                logging.info(f"처리된 파일 수: {processed_files}/{total_files} (총 {total_hanja}개 한자)")
-            except Exception as e:
-                logging.error(f"파일 처리 중 오류 발생: {file} - {str(e)}")
+        while pending and writer.is_alive():
+            for file, result in list(pending.items()):
+                if not result.ready():
+                    continue
+                del pending[file]
+                try:
+                    parsed_hanja += result.get()
+                    processed_files += 1
+                    logging.info(f"처리된 파일 수: {processed_files}/{total_files} (총 {parsed_hanja}개 한자 파싱)")
+                except Exception as e:
+                    logging.error(f"파일 처리 중 오류 발생: {file} - {str(e)}")
+            if pending:
+                next(iter(pending.values())).wait(QUEUE_PUT_TIMEOUT)
+        # 모든 파일의 끝 표시를 받으면 쓰기 프로세스가 끝남 (파싱 프로세스의 큐도 모두 비워짐)
+        writer.join()
+    finally:
+        if writer.exitcode == 0 and not abort_event.is_set():
+            pool.close()
+        else:
+            # 쓰기 프로세스 실패 또는 중단: 기다리지 않고 파싱 프로세스를 종료
+            abort_event.set()
+            pool.terminate()
+            if writer.is_alive():
+                writer.terminate()
+            writer.join()
+        pool.join()
+    try:
+        total_hanja = result_queue.get(timeout=QUEUE_PUT_TIMEOUT)
+    except queue.Empty:
+        total_hanja = -1
+    
+    if total_hanja < 0:
+        logging.error("쓰기 프로세스 오류로 임포트가 완료되지 않았습니다.")
+        return -1
     
-    logging.info(f"총 {total_hanja}개의 한자 데이터가 처리되었습니다.")
+    elapsed = time.time() - start_time
+    logging.info(
+        f"총 {total_hanja}개의 한자 데이터가 처리되었습니다. "
+        f"({elapsed:.1f}초, 파싱 프로세스 {workers}개, {parsed_hanja / max(elapsed, 1e-9):.0f}행/초)"
+    )
+    return total_hanja
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="XML 사전 파일에서 한자 데이터를 가져옵니다.")
+    parser.add_argument('--workers', type=int, default=None, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--db', default=DB_PATH, help="저장할 SQLite 데이터베이스 파일")
+    args = parser.parse_args()
+    main(workers=args.workers, db_path=args.db)
@@ -0,0 +1,97 @@
+"""
+XML 임포트 진행 기록(manifest)
+
+`data/raw/*.xml` 파일마다 크기, 수정 시각, 내용 해시와 마지막으로 커밋한 item
+위치를 `import_manifest` 테이블에 기록합니다.
+
+- 크기와 수정 시각이 그대로인 완료 파일은 해시 계산 없이 건너뜁니다.
+- 수정 시각만 바뀌고 내용 해시가 같으면 기록만 갱신하고 건너뜁니다.
+- 중간에 멈춘 파일은 마지막으로 커밋한 배치 다음 item부터 다시 가져옵니다.
+- 내용이 바뀐 파일은 처음부터 다시 가져옵니다. (행은 upsert되므로 중복되지 않음)
+
+배치 삽입과 `checkpoint`를 같은 트랜잭션에서 커밋해야 위치 기록이 실제로
+저장된 행과 어긋나지 않습니다.
+"""
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """파일 내용의 SHA-256 해시 (1MB 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImportManifest:
+    """파일별 임포트 진행 상태"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS import_manifest (
+                file_name TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                sha256 TEXT NOT NULL,
+                items_done INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+
+    def start_offset(self, path: Path) -> Optional[int]:
+        """파일을 가져올 시작 item 위치를 반환합니다. (변경 없이 완료된 파일이면 None)"""
+        stat = path.stat()
+        row = self.conn.execute(
+            'SELECT size, mtime, sha256, items_done, completed FROM import_manifest WHERE file_name = ?',
+            (path.name,)
+        ).fetchone()
+        if row and row[4] and row[0] == stat.st_size and row[1] == stat.st_mtime:
+            return None
+
+        digest = file_sha256(path)
+        offset = 0
+        if row and row[2] == digest:
+            if row[4]:
+                # 내용은 같고 수정 시각만 바뀜
+                self.conn.execute(
+                    'UPDATE import_manifest SET size = ?, mtime = ? WHERE file_name = ?',
+                    (stat.st_size, stat.st_mtime, path.name)
+                )
+                self.conn.commit()
+                return None
+            offset = row[3]
+
+        self.conn.execute('''
+            INSERT INTO import_manifest (file_name, size, mtime, sha256, items_done, completed)
+            VALUES (?, ?, ?, ?, ?, 0)
+            ON CONFLICT(file_name) DO UPDATE SET
+                size = excluded.size, mtime = excluded.mtime, sha256 = excluded.sha256,
+                items_done = excluded.items_done, completed = 0, updated_at = CURRENT_TIMESTAMP
+        ''', (path.name, stat.st_size, stat.st_mtime, digest, offset))
+        self.conn.commit()
+        return offset
+
+    def checkpoint(self, path: Path, items_done: int) -> None:
+        """처리한 item 수를 기록합니다. (커밋은 호출하는 쪽에서 배치와 함께)"""
+        self.conn.execute(
+            'UPDATE import_manifest SET items_done = ?, updated_at = CURRENT_TIMESTAMP WHERE file_name = ?',
+            (items_done, path.name)
+        )
+
+    def complete(self, path: Path, items_done: int) -> None:
+        """파일 임포트 완료를 기록하고 커밋합니다."""
+        self.conn.execute(
+            'UPDATE import_manifest SET items_done = ?, completed = 1, updated_at = CURRENT_TIMESTAMP '
+            'WHERE file_name = ?',
+            (items_done, path.name)
+        )
+        self.conn.commit()
@@ -1,12 +1,17 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Union
 import sqlite3
+import json
 import logging
 import os
+import time
+
+from ndjson_stream import NDJSON_MEDIA_TYPE, STREAM_CHUNK_SIZE, accepts_ndjson, iter_ndjson
 
 app = FastAPI(title="한국어 사전 API")
 
@@ -41,12 +46,71 @@ class RelatedWord(BaseModel):
     related_word: str
     relation_type: str
 
+class WordListResponse(BaseModel):
+    total: int
+    words: List[dict]
+    next_cursor: Optional[int] = None
+
 # 데이터베이스 연결
 def get_db():
     conn = sqlite3.connect('korean_dictionary.db')
     conn.row_factory = sqlite3.Row
     return conn
 
+# import_hanja.py가 만드는 한자 데이터베이스 (글자 ↔ 단어 연결 테이블 word_hanja 포함)
+HANJA_DB_PATH = os.getenv('HANJA_DB_PATH', 'hanja.db')
+
+def get_hanja_db():
+    conn = sqlite3.connect(HANJA_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def iter_words(after_id: int = 0):
+    """words 테이블을 커서에서 STREAM_CHUNK_SIZE개씩 읽어 한 행씩 내보냅니다.
+
+    결과 전체를 리스트로 만들지 않으므로 사전 크기와 관계없이 메모리 사용량이 일정합니다.
+    (스트리밍 중 다른 스레드에서 이어 읽을 수 있도록 check_same_thread=False로 연결)
+    """
+    conn = sqlite3.connect('korean_dictionary.db', check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        cursor = conn.execute('SELECT * FROM words WHERE id > ? ORDER BY id', (after_id,))
+        while True:
+            rows = cursor.fetchmany(STREAM_CHUNK_SIZE)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+def word_json(row) -> str:
+    return json.dumps(dict(row), ensure_ascii=False)
+
+def iter_words_json_array(after_id: int = 0):
+    """이전 응답 형식(단어 dict 배열)을 한 번에 만들지 않고 STREAM_CHUNK_SIZE개씩 내보냅니다."""
+    yield b"["
+    separator = ""
+    batch = []
+    for row in iter_words(after_id):
+        batch.append(word_json(row))
+        if len(batch) >= STREAM_CHUNK_SIZE:
+            yield (separator + ",".join(batch)).encode("utf-8")
+            separator, batch = ",", []
+    if batch:
+        yield (separator + ",".join(batch)).encode("utf-8")
+    yield b"]"
+
+# 전체 단어 수 캐시 (COUNT(*)는 테이블 전체를 훑으므로 일정 시간 재사용)
+WORD_COUNT_TTL = 60
+_word_count_cache = {"value": None, "expires_at": 0.0}
+
+def get_word_count(conn) -> int:
+    now = time.monotonic()
+    if _word_count_cache["value"] is None or now >= _word_count_cache["expires_at"]:
+        _word_count_cache["value"] = conn.execute('SELECT COUNT(*) FROM words').fetchone()[0]
+        _word_count_cache["expires_at"] = now + WORD_COUNT_TTL
+    return _word_count_cache["value"]
+
 # 웹 인터페이스 라우트
 @app.get("/")
 async def read_root(request: Request):
@@ -86,42 +150,153 @@ async def add_related_word(related_word: RelatedWord):
     finally:
         conn.close()
 
+# 단어와 관련 단어를 한 번에 조회하는 쿼리
+# (단어마다 related_words를 따로 조회하던 N+1 쿼리를 idx_related_word를 타는 상관 서브쿼리로 대체)
+WORDS_WITH_RELATED_SQL = '''
+SELECT w.*, (
+    SELECT json_group_array(json_object('related_word', r.related_word, 'relation_type', r.relation_type))
+    FROM (SELECT related_word, relation_type FROM related_words WHERE word_id = w.id ORDER BY id) AS r
+) AS related_words
+FROM words AS w
+WHERE w.word LIKE ?
+'''
+
+def fetch_words_with_related(conn, word: str) -> List[dict]:
+    """단어를 부분 일치로 찾고 각 단어의 관련 단어 목록을 함께 반환합니다."""
+    words = []
+    for row in conn.execute(WORDS_WITH_RELATED_SQL, (f'%{word}%',)):
+        word_data = dict(row)
+        word_data['related_words'] = json.loads(word_data['related_words'])
+        words.append(word_data)
+    return words
+
+def ensure_related_words_index(conn) -> None:
+    """이전에 만들어진 데이터베이스에도 related_words.word_id 인덱스를 만듭니다."""
+    table = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'related_words'"
+    ).fetchone()
+    if table:
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_related_word ON related_words (word_id)')
+        conn.commit()
+
+@app.on_event("startup")
+async def prepare_indexes():
+    conn = get_db()
+    try:
+        ensure_related_words_index(conn)
+    except sqlite3.Error as e:
+        logging.warning(f"관련 단어 인덱스를 만들지 못했습니다: {e}")
+    finally:
+        conn.close()
+
 @app.get("/api/words/{word}", response_model=List[dict])
 async def search_word(word: str):
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute('''
-        SELECT * FROM words WHERE word LIKE ?
-        ''', (f'%{word}%',))
-        words = [dict(row) for row in cursor.fetchall()]
-        
-        for word_data in words:
-            cursor.execute('''
-            SELECT related_word, relation_type FROM related_words WHERE word_id = ?
-            ''', (word_data['id'],))
-            related_words = cursor.fetchall()
-            word_data['related_words'] = [dict(row) for row in related_words]
-        
-        return words
+        return fetch_words_with_related(conn, word)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     finally:
         conn.close()
 
-@app.get("/api/words/", response_model=List[dict])
-async def get_all_words():
+@app.get("/api/words/", response_model=Union[WordListResponse, List[dict]])
+async def get_all_words(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    cursor: Optional[int] = Query(None, description="이전 응답의 next_cursor (마지막 단어 ID)"),
+    envelope: bool = Query(True, description="false면 이전 형식(전체 단어 목록 배열)으로 응답")
+):
+    """단어 목록을 페이지 단위로 조회합니다.
+
+    응답 형식 변경: 이전에는 전체 단어를 배열 하나로 반환했지만, 지금은
+    {"total", "words", "next_cursor"} 봉투로 한 페이지씩 반환합니다. 이전 형식이
+    필요한 클라이언트는 envelope=false를 넘기면 전체 목록을 배열로 받습니다.
+    (배열도 스트리밍하므로 사전 크기와 관계없이 메모리 사용량이 일정)
+    """
+    after_id = cursor if cursor is not None else 0
+    # 내보내기 용도: 커서 다음의 모든 단어를 한 줄에 하나씩 스트리밍
+    if accepts_ndjson(request.headers.get("accept", "")):
+        return StreamingResponse(
+            iter_ndjson(iter_words(after_id), word_json),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+    if not envelope:
+        return StreamingResponse(iter_words_json_array(after_id), media_type="application/json")
+
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute('SELECT * FROM words')
-        words = [dict(row) for row in cursor.fetchall()]
-        return words
+        # 기본 키 탐색으로 커서 다음부터 조회하므로 깊은 페이지도 첫 페이지와 비용이 같음
+        rows = conn.execute(
+            'SELECT * FROM words WHERE id > ? ORDER BY id LIMIT ?',
+            (after_id, limit + 1)
+        ).fetchall()
+        words = [dict(row) for row in rows[:limit]]
+        next_cursor = words[-1]['id'] if len(rows) > limit else None
+        return {"total": get_word_count(conn), "words": words, "next_cursor": next_cursor}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     finally:
         conn.close()
 
+# 글자 → 단어: idx_word_hanja_hanja (hanja_id, word_id, position) 범위 탐색
+# (같은 글자가 여러 번 나오는 단어는 한 번만, 첫 위치로)
+WORDS_BY_HANJA_SQL = '''
+SELECT w.*, MIN(wh.position) AS position
+FROM word_hanja AS wh JOIN words AS w ON w.id = wh.word_id
+WHERE wh.hanja_id = ? AND wh.word_id > ?
+GROUP BY wh.word_id
+ORDER BY wh.word_id
+LIMIT ?
+'''
+
+# 단어 → 글자: word_hanja 기본 키 (word_id, position) 범위 탐색
+HANJA_BY_WORD_SQL = '''
+SELECT wh.position, h.*
+FROM word_hanja AS wh JOIN hanja AS h ON h.id = wh.hanja_id
+WHERE wh.word_id = ?
+ORDER BY wh.position
+'''
+
+@app.get("/api/hanja/{character}/words", response_model=dict)
+async def get_words_by_hanja(
+    character: str,
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    cursor: Optional[int] = Query(None, description="이전 응답의 next_cursor (마지막 단어 ID)")
+):
+    """한자 한 글자가 들어간 단어 목록"""
+    if len(character) != 1:
+        raise HTTPException(status_code=400, detail="한자 한 글자를 입력해 주세요.")
+    conn = get_hanja_db()
+    try:
+        hanja = conn.execute('SELECT * FROM hanja WHERE character = ?', (character,)).fetchone()
+        if hanja is None:
+            raise HTTPException(status_code=404, detail="한자를 찾을 수 없습니다.")
+        rows = conn.execute(
+            WORDS_BY_HANJA_SQL, (hanja['id'], cursor if cursor is not None else 0, limit + 1)
+        ).fetchall()
+        words = [dict(row) for row in rows[:limit]]
+        next_cursor = words[-1]['id'] if len(rows) > limit else None
+        return {"hanja": dict(hanja), "words": words, "next_cursor": next_cursor}
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        conn.close()
+
+@app.get("/api/hanja/words/{word_id}/characters", response_model=dict)
+async def get_hanja_by_word(word_id: int):
+    """단어의 한자 표기를 이루는 글자 목록 (위치 순)"""
+    conn = get_hanja_db()
+    try:
+        word = conn.execute('SELECT * FROM words WHERE id = ?', (word_id,)).fetchone()
+        if word is None:
+            raise HTTPException(status_code=404, detail="단어를 찾을 수 없습니다.")
+        characters = [dict(row) for row in conn.execute(HANJA_BY_WORD_SQL, (word_id,))]
+        return {"word": dict(word), "characters": characters}
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
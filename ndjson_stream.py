@@ -0,0 +1,34 @@
+"""
+NDJSON 스트리밍 공용 도우미
+
+루트 사전 API(korean_dictionary_api.py)와 백엔드(backend/app/core/streaming.py)가
+함께 사용합니다. 프레임워크 없이 표준 라이브러리만 사용하며, 응답 객체는 각 앱에서
+만듭니다.
+"""
+from typing import Any, Callable, Iterable, Iterator
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 한 번에 읽어 내보낼 행 수
+STREAM_CHUNK_SIZE = 500
+
+
+def accepts_ndjson(accept: str) -> bool:
+    """Accept 헤더 값이 NDJSON을 원하는지 확인합니다."""
+    return NDJSON_MEDIA_TYPE in (accept or "")
+
+
+def iter_ndjson(
+    rows: Iterable[Any],
+    serialize: Callable[[Any], str],
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """행을 NDJSON 줄로 직렬화해 chunk_size개씩 묶어 내보냅니다."""
+    lines = []
+    for row in rows:
+        lines.append(serialize(row))
+        if len(lines) >= chunk_size:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,57 @@
+"""
+korean_dictionary.db 단어 검색용 메모리 색인
+
+`words.word`와 `words.meaning`을 글자(음절) 단위 n-gram 역색인으로 유지해
+`/api/words/search`가 `LOWER(meaning) LIKE '%검색어%'` 전체 스캔 없이
+posting 교집합으로 후보를 찾도록 합니다. 초성/자모 접두사 검색을 위해
+`words.word`의 자모 트라이도 함께 유지합니다.
+(색인 구현은 백엔드와 함께 쓰는 hangul_search 패키지)
+"""
+import threading
+
+from hangul_search import ChoseongIndex, MeaningIndex
+
+# 싱글톤 인스턴스 생성
+word_index = MeaningIndex()
+choseong_index = ChoseongIndex()
+_build_lock = threading.Lock()
+
+
+def build_word_index(conn) -> MeaningIndex:
+    """words 테이블 전체로 단어 색인(n-gram, 초성)을 구축합니다.
+
+    Args:
+        conn: korean_dictionary.db에 연결된 sqlite3 연결
+    """
+    rows = conn.execute('SELECT id, word, meaning FROM words').fetchall()
+    word_index.build((row[0], (row[1], row[2])) for row in rows)
+    choseong_index.build((row[0], (row[1],)) for row in rows)
+    return word_index
+
+
+def ensure_word_indexes(connect) -> None:
+    """단어 색인이 아직 구축되지 않았다면 한 번만 구축합니다.
+
+    Args:
+        connect: sqlite3 연결을 반환하는 함수
+    """
+    if not word_index.loaded:
+        with _build_lock:
+            if not word_index.loaded:
+                conn = connect()
+                try:
+                    build_word_index(conn)
+                finally:
+                    conn.close()
+
+
+def get_word_index(connect) -> MeaningIndex:
+    """구축된 단어 n-gram 색인을 반환합니다."""
+    ensure_word_indexes(connect)
+    return word_index
+
+
+def get_choseong_index(connect) -> ChoseongIndex:
+    """구축된 단어 초성/자모 색인을 반환합니다."""
+    ensure_word_indexes(connect)
+    return choseong_index
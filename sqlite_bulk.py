@@ -0,0 +1,82 @@
+"""
+SQLite 대량 적재 모드
+
+사전 XML 임포트처럼 수십만 행을 한꺼번에 넣을 때 사용합니다.
+
+- 적재하는 테이블의 보조 인덱스(CREATE INDEX로 만든 비유일 인덱스)를 지웠다가
+  끝난 뒤 한 번에 다시 만듭니다. 유일 인덱스는 upsert/INSERT OR IGNORE에
+  필요하므로 그대로 둡니다.
+- 적재하는 동안 `journal_mode=OFF`, `synchronous=OFF`, 큰 `cache_size`/`mmap_size`로
+  저널 기록과 fsync를 없앱니다.
+- 끝나면 인덱스를 다시 만들고 `ANALYZE`를 실행한 뒤 PRAGMA를 원래대로 돌립니다.
+
+저널이 없으므로 적재 도중 프로세스가 죽거나 오류가 나면 데이터베이스가 깨질 수
+있습니다. 처음부터 다시 만들 수 있는 초기 적재에만 사용합니다.
+
+    with bulk_load(conn, ['words']):
+        for batch in batched(rows):
+            conn.executemany(INSERT_SQL, batch)
+"""
+import logging
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 적재 중 페이지 캐시 크기 (음수는 KiB 단위, 약 256MB)
+BULK_CACHE_SIZE = -256 * 1024
+# 적재 중 메모리 맵 크기(바이트)
+BULK_MMAP_SIZE = 1024 * 1024 * 1024
+
+
+def secondary_indexes(conn: sqlite3.Connection, tables: Iterable[str]) -> List[Tuple[str, str]]:
+    """테이블의 보조 인덱스 (이름, CREATE 문) 목록 (유일 인덱스와 제약 조건 인덱스 제외)"""
+    indexes = []
+    for table in tables:
+        for _, name, unique, origin, _ in conn.execute(f'PRAGMA index_list("{table}")'):
+            if unique or origin != 'c':
+                continue
+            row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)).fetchone()
+            if row and row[0]:
+                indexes.append((name, row[0]))
+    return indexes
+
+
+@contextmanager
+def bulk_load(conn: sqlite3.Connection, tables: Iterable[str]) -> Iterator[sqlite3.Connection]:
+    """대량 적재 구간: 보조 인덱스를 미루고 저널/동기화를 끈 채 하나의 트랜잭션으로 적재합니다."""
+    tables = list(tables)
+    journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+    synchronous = conn.execute('PRAGMA synchronous').fetchone()[0]
+    cache_size = conn.execute('PRAGMA cache_size').fetchone()[0]
+
+    conn.commit()
+    indexes = secondary_indexes(conn, tables)
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+    conn.execute('PRAGMA journal_mode=OFF')
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.execute(f'PRAGMA cache_size={BULK_CACHE_SIZE}')
+    conn.execute(f'PRAGMA mmap_size={BULK_MMAP_SIZE}')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    logger.info(f"대량 적재 모드 시작: 보조 인덱스 {len(indexes)}개 보류 ({', '.join(tables)})")
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        # 실패해도 인덱스가 빠진 채로 남지 않도록 다시 만듦
+        for name, sql in indexes:
+            conn.execute(sql)
+        conn.execute('ANALYZE')
+        conn.commit()
+        conn.execute(f'PRAGMA journal_mode={journal_mode}')
+        conn.execute(f'PRAGMA synchronous={synchronous}')
+        conn.execute(f'PRAGMA cache_size={cache_size}')
+        conn.execute('PRAGMA mmap_size=0')
+        logger.info("대량 적재 모드 종료: 인덱스 재생성 및 ANALYZE 완료")
+
+
+def is_empty(conn: sqlite3.Connection, table: str) -> bool:
+    """테이블에 행이 없는지 확인합니다. (대량 적재 모드를 쓸 수 있는 초기 적재인지 판단)"""
+    return conn.execute(f'SELECT NOT EXISTS (SELECT 1 FROM "{table}")').fetchone()[0] == 1
@@ -0,0 +1,29 @@
+"""
+루트 사전 도구(임포트 스크립트, 사전 API) 테스트
+
+저장소 루트에서 실행합니다. (backend 테스트는 backend/에서 따로 실행)
+
+    python -m pytest tests
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+SAMPLE_XML = FIXTURES / 'dictionary_sample.xml'
+
+
+@pytest.fixture
+def raw_dir(tmp_path, monkeypatch):
+    """임시 작업 디렉토리의 data/raw에 표본 XML을 복사하고 그 디렉토리로 이동"""
+    raw = tmp_path / 'data' / 'raw'
+    raw.mkdir(parents=True)
+    shutil.copy(SAMPLE_XML, raw / SAMPLE_XML.name)
+    monkeypatch.chdir(tmp_path)
+    return raw
@@ -0,0 +1,196 @@
+import json
+import os
+import sqlite3
+from functools import partial
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app
+import korean_dictionary_api
+from conftest import SAMPLE_XML
+from dictionary_xml import RECORD_FIELDS, batched, extract_record, iter_items
+from import_manifest import ImportManifest
+from sqlite_bulk import bulk_load, is_empty
+
+
+def word_count(db_path='korean_dictionary.db'):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM words').fetchone()[0]
+
+
+def manifest_row(conn, path):
+    return conn.execute(
+        'SELECT items_done, completed FROM import_manifest WHERE file_name = ?', (path.name,)
+    ).fetchone()
+
+
+def test_iter_items_and_extract_record():
+    """최상위 item만 스트리밍으로 읽고, word_info에 없는 필드는 기본값"""
+    # 요소는 다음 항목으로 넘어가면 지워지므로 반복 안에서 추출
+    records = [extract_record(item, default='') for item in iter_items(SAMPLE_XML)]
+    assert len(records) == 6
+
+    record = records[0]
+    assert record[RECORD_FIELDS.index('target_code')] == '900001'
+    assert record[RECORD_FIELDS.index('word')] == '산수01'
+    assert record[RECORD_FIELDS.index('origin')] == '山水'
+    # 예문은 sense_info 아래에 있어 word_info의 직접 자식이 아님
+    assert record[RECORD_FIELDS.index('example')] == ''
+    # target_code가 없는 item
+    assert records[-1][0] == ''
+
+    assert [len(batch) for batch in batched(range(5), 2)] == [2, 2, 1]
+
+
+def test_manifest_skips_unchanged_and_touched_files(raw_dir):
+    """완료된 파일은 건너뛰고, 수정 시각만 바뀐 파일은 해시로 확인해 건너뜀"""
+    path = raw_dir / SAMPLE_XML.name
+    conn = sqlite3.connect('korean_dictionary.db')
+    try:
+        manifest = ImportManifest(conn)
+        assert manifest.start_offset(path) == 0
+        manifest.checkpoint(path, 4)
+        conn.commit()
+        # 중간에 멈춘 파일은 마지막 기록 위치부터
+        assert manifest.start_offset(path) == 4
+        manifest.complete(path, 6)
+        assert manifest.start_offset(path) is None
+
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        assert manifest.start_offset(path) is None
+        assert conn.execute(
+            'SELECT mtime FROM import_manifest WHERE file_name = ?', (path.name,)
+        ).fetchone()[0] == path.stat().st_mtime
+
+        # 내용이 바뀌면 처음부터
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        assert manifest.start_offset(path) == 0
+    finally:
+        conn.close()
+
+
+def test_import_resumes_after_failed_batch(raw_dir, monkeypatch):
+    """배치 삽입이 실패하면 커밋한 배치까지만 남고, 다음 실행은 그 다음 item부터 가져옴"""
+    monkeypatch.setattr(app, 'batched', partial(batched, size=2))
+    path = raw_dir / SAMPLE_XML.name
+    app.init_db()
+
+    class FailingCursor:
+        """두 번째 배치 삽입에서 실패하는 커서"""
+        def __init__(self, cursor):
+            self.cursor = cursor
+            self.calls = 0
+
+        def executemany(self, sql, rows):
+            self.calls += 1
+            if self.calls == 2:
+                raise sqlite3.OperationalError('disk I/O error')
+            return self.cursor.executemany(sql, rows)
+
+    conn = sqlite3.connect('korean_dictionary.db')
+    try:
+        manifest = ImportManifest(conn)
+        app.import_files(conn, FailingCursor(conn.cursor()), manifest, [path], bulk=False)
+        assert manifest_row(conn, path) == (2, 0)
+        assert word_count() == 2
+
+        offsets = []
+        start_offset = manifest.start_offset
+        monkeypatch.setattr(manifest, 'start_offset', lambda p: offsets.append(start_offset(p)) or offsets[-1])
+        app.import_files(conn, conn.cursor(), manifest, [path], bulk=False)
+        assert offsets == [2]
+        assert manifest_row(conn, path) == (6, 1)
+    finally:
+        conn.close()
+    # target_code가 없는 item은 upsert할 수 없으므로 건너뜀
+    assert word_count() == 5
+
+
+def test_reimport_upserts_without_duplicates(raw_dir):
+    """첫 적재는 대량 적재 모드, 이후 실행은 변경 없는 파일을 건너뛰고 바뀐 파일은 upsert"""
+    path = raw_dir / SAMPLE_XML.name
+    app.init_db()
+    app.import_xml_to_db()
+    assert word_count() == 5
+
+    app.import_xml_to_db()
+    assert word_count() == 5
+
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content.replace('산과 물.', '산과 강.'))
+    app.import_xml_to_db()
+    assert word_count() == 5
+    with sqlite3.connect('korean_dictionary.db') as conn:
+        # 인덱스가 남아 있고 기존 행이 갱신됨
+        assert conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'idx_words_target_code'"
+        ).fetchone()
+        assert conn.execute(
+            "SELECT COUNT(*) FROM words WHERE target_code = '900001'"
+        ).fetchone()[0] == 1
+
+
+def test_word_list_pages_and_legacy_shape(raw_dir, monkeypatch):
+    """단어 목록은 커서로 페이지를 넘기고, envelope=false면 이전처럼 전체 배열, NDJSON은 한 줄에 한 단어"""
+    app.init_db()
+    app.import_xml_to_db()
+    monkeypatch.setattr(korean_dictionary_api, '_word_count_cache', {'value': None, 'expires_at': 0.0})
+    client = TestClient(korean_dictionary_api.app)
+
+    words, cursor = [], None
+    while True:
+        params = {'limit': 2, **({'cursor': cursor} if cursor is not None else {})}
+        page = client.get('/api/words/', params=params).json()
+        assert page['total'] == 5
+        words.extend(word['word'] for word in page['words'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    # 여러 묶음으로 나눠 보내도 올바른 JSON 배열
+    monkeypatch.setattr(korean_dictionary_api, 'STREAM_CHUNK_SIZE', 2)
+    legacy = client.get('/api/words/', params={'envelope': 'false'})
+    assert legacy.headers['content-type'].startswith('application/json')
+    assert [word['word'] for word in legacy.json()] == words
+
+    response = client.get('/api/words/', headers={'Accept': 'application/x-ndjson'})
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    assert [json.loads(line)['word'] for line in response.text.splitlines()] == words
+
+
+def test_bulk_load_defers_secondary_indexes(tmp_path):
+    """대량 적재 중에는 보조 인덱스만 지우고, 끝나거나 실패하면 다시 만들고 PRAGMA를 되돌림"""
+    conn = sqlite3.connect(tmp_path / 'bulk.db')
+    try:
+        conn.executescript('''
+            CREATE TABLE words (id INTEGER PRIMARY KEY, code TEXT UNIQUE, word TEXT);
+            CREATE INDEX idx_word ON words (word);
+        ''')
+        journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+
+        def index_names():
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+        assert is_empty(conn, 'words')
+        with bulk_load(conn, ['words']):
+            assert 'idx_word' not in index_names()
+            assert 'sqlite_autoindex_words_1' in index_names()
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'off'
+            conn.executemany('INSERT INTO words (code, word) VALUES (?, ?)', [('1', '물'), ('2', '산')])
+        assert 'idx_word' in index_names()
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == journal_mode
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()[0] == 1
+        assert not is_empty(conn, 'words')
+
+        with pytest.raises(RuntimeError):
+            with bulk_load(conn, ['words']):
+                raise RuntimeError('import failed')
+        assert 'idx_word' in index_names()
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == journal_mode
+    finally:
+        conn.close()
@@ -0,0 +1,173 @@
+import queue
+import shutil
+import sqlite3
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import import_hanja
+import korean_dictionary_api
+from conftest import SAMPLE_XML
+
+ITEM_TEMPLATE = '''
+    <item>
+        <target_code>{code}</target_code>
+        <word_info>
+            <word><![CDATA[수도{code}]]></word>
+            <origin><![CDATA[水道]]></origin>
+            <pos_info><comm_pattern_info><sense_info>
+                <definition><![CDATA[{definition}]]></definition>
+            </sense_info></comm_pattern_info></pos_info>
+        </word_info>
+    </item>'''
+
+
+def import_sample(db_path, batch_size=2):
+    """표본 XML을 쓰기 프로세스와 같은 경로로 가져옴 (프로세스 대신 같은 스레드에서)"""
+    batch_queue = queue.Queue()
+    result_queue = queue.Queue()
+    for batch in import_hanja.parse_xml_file(str(SAMPLE_XML), batch_size=batch_size):
+        batch_queue.put(batch)
+    batch_queue.put(None)
+    import_hanja.write_batches(batch_queue, threading.Event(), result_queue, str(db_path))
+    return result_queue.get_nowait()
+
+
+def table_counts(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return {
+            table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in ('hanja', 'words', 'word_hanja', 'hanja_words')
+        }
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    db_path = tmp_path / 'hanja.db'
+    assert import_sample(db_path) == 4
+    monkeypatch.setattr(korean_dictionary_api, 'HANJA_DB_PATH', str(db_path))
+    return TestClient(korean_dictionary_api.app)
+
+
+def test_import_decomposes_words_into_characters(tmp_path):
+    """한자어를 글자 단위로 분해하고, 같은 데이터를 다시 가져와도 행이 늘지 않는지 테스트"""
+    db_path = tmp_path / 'hanja.db'
+    # 한자가 없는 item과 target_code가 없는 item은 건너뜀
+    assert import_sample(db_path) == 4
+    counts = table_counts(db_path)
+    assert counts == {'hanja': 3, 'words': 4, 'word_hanja': 7, 'hanja_words': 2}
+
+    with sqlite3.connect(db_path) as conn:
+        # 한 글자 표제어의 정보가 글자 행에 들어감
+        assert conn.execute(
+            "SELECT meaning, reading FROM hanja WHERE character = '水'"
+        ).fetchone() == ('물.', '수')
+
+    # 두 번째 실행은 대량 적재가 아닌 증분 모드(upsert)로 가져옴
+    assert import_sample(db_path, batch_size=3) == 4
+    assert table_counts(db_path) == counts
+
+
+def test_words_by_character(client):
+    """글자 → 단어 조회와 커서 페이지"""
+    first = client.get('/api/hanja/水/words', params={'limit': 2}).json()
+    assert first['hanja']['character'] == '水'
+    assert [(w['target_code'], w['position']) for w in first['words']] == [('900001', 1), ('900002', 0)]
+
+    second = client.get('/api/hanja/水/words', params={'limit': 2, 'cursor': first['next_cursor']}).json()
+    # 같은 글자가 두 번 나오는 단어(水水)는 한 번만
+    assert [(w['target_code'], w['position']) for w in second['words']] == [('900004', 0), ('900005', 0)]
+    assert second['next_cursor'] is None
+
+    assert client.get('/api/hanja/金/words').status_code == 404
+    assert client.get('/api/hanja/山水/words').status_code == 400
+
+
+def test_characters_by_word(client):
+    """단어 → 글자 조회는 위치 순서"""
+    words = client.get('/api/hanja/道/words').json()['words']
+    assert [w['target_code'] for w in words] == ['900004']
+
+    response = client.get(f"/api/hanja/words/{words[0]['id']}/characters").json()
+    assert response['word']['hanja'] == '水道'
+    assert [(c['position'], c['character']) for c in response['characters']] == [(0, '水'), (1, '道')]
+
+    assert client.get('/api/hanja/words/999/characters').status_code == 404
+
+
+def test_bulk_insert_error_aborts(tmp_path):
+    """대량 적재 모드에서 삽입 오류는 삼키지 않고 올려 보냄 (롤백할 수 없으므로)"""
+    conn = sqlite3.connect(tmp_path / 'hanja.db')
+    try:
+        import_hanja.create_tables(conn)
+        bad_row = ('900001', '산수01', '山水', '산과 물.', '산수', '', 0)
+        # 예문 행의 target_code가 배치에 없으면 연결할 표제어가 없어 오류
+        examples = [('900009', '山水畵', '산과 물.')]
+        with pytest.raises(KeyError):
+            import_hanja.insert_hanja_batch(conn, [bad_row], examples, bulk=True)
+        assert import_hanja.insert_hanja_batch(conn, [bad_row], examples) == 0
+    finally:
+        conn.close()
+
+
+def run_main(**kwargs):
+    """main을 스레드에서 실행하고 끝나기를 기다림 (멈추면 None)"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(import_hanja.main(**kwargs)), daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+    return result[0] if result else None
+
+
+def test_main_imports_files_in_parallel(raw_dir, tmp_path):
+    """파싱 프로세스 여러 개가 넣은 배치를 쓰기 프로세스가 모두 받은 뒤 끝나는지 테스트"""
+    shutil.copy(SAMPLE_XML, raw_dir / 'dictionary_sample_copy.xml')
+    db_path = tmp_path / 'hanja.db'
+    assert run_main(workers=2, db_path=str(db_path)) == 8
+    assert table_counts(db_path) == {'hanja': 3, 'words': 4, 'word_hanja': 7, 'hanja_words': 2}
+
+
+def test_main_returns_when_writer_fails(raw_dir, tmp_path):
+    """쓰기 프로세스가 실패해도 파싱 프로세스가 큐를 비우다 멈추지 않고 main이 끝나는지 테스트"""
+    # 파이프 버퍼보다 큰 배치를 만들어 아무도 읽지 않는 큐에 남게 함
+    definition = '물이 흐르는 길. ' * 20
+    items = ''.join(ITEM_TEMPLATE.format(code=900100 + i, definition=definition) for i in range(2000))
+    (raw_dir / 'large.xml').write_text(f'<channel>{items}</channel>', encoding='utf-8')
+
+    # 없는 디렉토리의 데이터베이스는 열 수 없어 쓰기 프로세스가 바로 실패함
+    assert run_main(workers=2, db_path=str(tmp_path / 'missing' / 'hanja.db')) == -1
+
+
+def test_reimport_refreshes_character_fields(tmp_path):
+    """다시 가져오면 글자 행의 뜻/음을 새 값으로 갱신하고, 빈 값은 기존 값을 유지하는지 테스트"""
+    conn = sqlite3.connect(tmp_path / 'hanja.db')
+    try:
+        import_hanja.create_tables(conn)
+        import_hanja.insert_hanja_batch(conn, [('900002', '수05', '水', '물.', '수', '水', 4)], [])
+        import_hanja.insert_hanja_batch(conn, [('900002', '수05', '水', '물 수.', '', '', 0)], [])
+        assert conn.execute(
+            "SELECT meaning, reading, radical, stroke_count FROM hanja WHERE character = '水'"
+        ).fetchone() == ('물 수.', '수', '水', 4)
+    finally:
+        conn.close()
+
+
+def test_old_schema_is_rejected(tmp_path):
+    """표제어 전체를 hanja 행으로 저장하던 이전 형식의 데이터베이스에는 이어서 가져오지 않음"""
+    db_path = tmp_path / 'hanja.db'
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript('''
+            CREATE TABLE hanja (id INTEGER PRIMARY KEY, character TEXT UNIQUE, meaning TEXT,
+                                reading TEXT, radical TEXT, stroke_count INTEGER);
+            CREATE TABLE hanja_words (id INTEGER PRIMARY KEY, hanja_id INTEGER, word TEXT, meaning TEXT);
+            INSERT INTO hanja (character) VALUES ('山水');
+        ''')
+    conn = sqlite3.connect(db_path)
+    try:
+        with pytest.raises(import_hanja.OutdatedSchemaError):
+            import_hanja.create_tables(conn)
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'words'").fetchone() is None
+    finally:
+        conn.close()
+    assert import_sample(db_path) == -1